@@ -0,0 +1,52 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from qdrant_bench.domain.entities.core import ConcurrencyPolicy, Connection
+
+
+@dataclass
+class ConnectionGate:
+    """
+    Admits runs onto connections according to each connection's concurrency policy.
+    Shared runs proceed side by side; an exclusive run waits for the connection to drain
+    and holds it alone. Waiting exclusive runs block new shared ones so they cannot starve.
+    """
+
+    active: dict[UUID, int] = field(default_factory=dict)
+    exclusive_held: set[UUID] = field(default_factory=set)
+    exclusive_waiting: dict[UUID, int] = field(default_factory=dict)
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+    @asynccontextmanager
+    async def hold(self, connection: Connection) -> AsyncIterator[None]:
+        exclusive = connection.concurrency_policy == ConcurrencyPolicy.EXCLUSIVE
+
+        async with self.condition:
+            if exclusive:
+                self.exclusive_waiting[connection.id] = self.exclusive_waiting.get(connection.id, 0) + 1
+                try:
+                    await self.condition.wait_for(lambda: self.active.get(connection.id, 0) == 0)
+                finally:
+                    # A cancelled waiter must stop blocking shared runs too
+                    self.exclusive_waiting[connection.id] -= 1
+                    self.condition.notify_all()
+                self.exclusive_held.add(connection.id)
+            else:
+                await self.condition.wait_for(lambda: self.admits_shared(connection.id))
+
+            self.active[connection.id] = self.active.get(connection.id, 0) + 1
+
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.active[connection.id] -= 1
+                self.exclusive_held.discard(connection.id)
+                self.condition.notify_all()
+
+    def admits_shared(self, connection_id: UUID) -> bool:
+        """Whether a shared run may start: no exclusive run holds or waits for the connection"""
+        return connection_id not in self.exclusive_held and not self.exclusive_waiting.get(connection_id, 0)
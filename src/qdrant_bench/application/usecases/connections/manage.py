@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from qdrant_bench.domain.entities.core import Connection
+from qdrant_bench.domain.entities.core import ConcurrencyPolicy, Connection
 from qdrant_bench.ports.repositories import ConnectionRepository
 
 
@@ -9,6 +9,8 @@ class CreateConnectionCommand:
     name: str
     url: str
     api_key: str
+    concurrency_policy: ConcurrencyPolicy = ConcurrencyPolicy.SHARED
+    max_concurrent_runs: int | None = None
 
 
 @dataclass
@@ -16,7 +18,13 @@ class CreateConnectionUseCase:
     connection_repo: ConnectionRepository
 
     async def execute(self, command: CreateConnectionCommand) -> Connection:
-        connection = Connection(name=command.name, url=command.url, api_key=command.api_key)
+        connection = Connection(
+            name=command.name,
+            url=command.url,
+            api_key=command.api_key,
+            concurrency_policy=command.concurrency_policy,
+            max_concurrent_runs=command.max_concurrent_runs,
+        )
         return await self.connection_repo.save(connection)
 
 
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+
+import logfire
+
+from qdrant_bench.domain.entities.core import Dataset
+from qdrant_bench.domain.services.ground_truth import ExactNeighbors
+from qdrant_bench.infrastructure.ingestion.vectors import resolve_batch_vectors
+from qdrant_bench.infrastructure.persistence.dataset_loader import (
+    iter_dataset_corpus,
+    load_query_matrix,
+    write_ground_truth,
+)
+from qdrant_bench.ports.embedding_service import EmbeddingService
+
+
+@dataclass
+class GenerateGroundTruthCommand:
+    k: int = 100
+    distance: str = "COSINE"
+    vector_name: str | None = None
+    query_count: int | None = None
+    batch_size: int = 10_000
+    embedding_model: str = "text-embedding-3-small"
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    memory_limit_mb: int = 256
+
+
+@dataclass
+class GroundTruthSummary:
+    uri: str
+    queries: int
+    corpus_points: int
+    k: int
+    duration: float
+
+
+@dataclass
+class GenerateGroundTruthUseCase:
+    """
+    Computes exact top-k neighbors of a dataset's queries over its corpus and writes them
+    as the dataset's ground truth. Corpus vectors are resolved exactly as ingestion resolves
+    them, and point ids follow the same consecutive numbering, so the neighbors line up with
+    the ids a benchmarked collection returns.
+    """
+
+    embedding_service: EmbeddingService
+
+    async def execute(self, dataset: Dataset, command: GenerateGroundTruthCommand) -> GroundTruthSummary:
+        start = time.perf_counter()
+        query_column = f"{command.vector_name}_vector" if command.vector_name else "vector"
+
+        queries = await load_query_matrix(dataset, query_column, command.query_count)
+        if not len(queries):
+            raise ValueError(f"No '{query_column}' queries found for dataset {dataset.name}")
+
+        neighbors = ExactNeighbors(
+            queries=queries,
+            k=command.k,
+            distance=command.distance,
+            workers=command.workers,
+            memory_limit_bytes=command.memory_limit_mb * 1024**2,
+        )
+
+        offset = 0
+        with logfire.span("Generate Ground Truth", dataset=dataset.name, queries=len(queries), k=command.k):
+            async for record_batch in iter_dataset_corpus(dataset, batch_size=command.batch_size):
+                vector_names = [command.vector_name] if command.vector_name else []
+                vectors = await resolve_batch_vectors(
+                    record_batch, self.embedding_service, vector_names, command.embedding_model
+                )
+                block = vectors[vector_names[0]] if isinstance(vectors, dict) else vectors
+
+                await asyncio.to_thread(neighbors.add, offset, block)
+                offset += record_batch.height
+
+            uri = await write_ground_truth(dataset, neighbors.ids)
+
+        return GroundTruthSummary(
+            uri=uri, queries=len(queries), corpus_points=offset, k=command.k, duration=time.perf_counter() - start
+        )
@@ -0,0 +1,201 @@
+import copy
+import itertools
+from dataclasses import dataclass, replace
+from typing import Any, cast
+
+from qdrant_client.http import models
+
+from qdrant_bench.domain.services.warmup import WarmupPlan
+from qdrant_bench.infrastructure.ingestion.pipeline import IngestionConfig
+from qdrant_bench.ports.workload import (
+    ArrivalProcess,
+    FusionConfig,
+    FusionMethod,
+    SearchParams,
+    Transport,
+    WorkloadConfig,
+)
+
+
+@dataclass
+class PhaseBudgets:
+    """Wall-clock limits for each phase of a run, in seconds - None leaves a phase unbounded"""
+
+    ingestion: float | None = None
+    indexing: float | None = None
+    workload: float | None = None
+
+
+def parse_transports(optimizer_config: dict[str, Any]) -> list[Transport]:
+    """Pure function - transports to benchmark, in execution order"""
+    transport = optimizer_config.get("transport", Transport.REST)
+
+    if transport == "both":
+        return [Transport.REST, Transport.GRPC]
+
+    return [Transport(transport)]
+
+
+def parse_vector_config(vector_config: dict[str, Any]) -> Any:
+    """Pure function - parse vector config to Qdrant models"""
+    if "size" in vector_config:
+        return parse_vector_params(vector_config)
+
+    if "vectors" in vector_config:
+        return {name: parse_vector_params(cfg) for name, cfg in vector_config["vectors"].items()}
+
+    raise ValueError("Invalid vector_config structure")
+
+
+def parse_vector_params(cfg: dict[str, Any]) -> models.VectorParams:
+    """Pure function - one vector's params including its HNSW and quantization settings"""
+    return models.VectorParams(
+        size=cfg["size"],
+        distance=models.Distance[cfg.get("distance", "COSINE")],
+        hnsw_config=models.HnswConfigDiff(**cfg["hnsw_config"]) if cfg.get("hnsw_config") else None,
+        quantization_config=parse_quantization_config(cfg.get("quantization_config")),
+        on_disk=cfg.get("on_disk"),
+    )
+
+
+def parse_quantization_config(cfg: dict[str, Any] | None) -> models.QuantizationConfig | None:
+    """Pure function - parse scalar, product or binary quantization settings"""
+    if not cfg:
+        return None
+
+    if cfg.get("scalar"):
+        return models.ScalarQuantization(scalar=models.ScalarQuantizationConfig(**cfg["scalar"]))
+
+    if cfg.get("product"):
+        return models.ProductQuantization(product=models.ProductQuantizationConfig(**cfg["product"]))
+
+    if cfg.get("binary") is not None:
+        return models.BinaryQuantization(binary=models.BinaryQuantizationConfig(**cfg["binary"]))
+
+    raise ValueError("Invalid quantization_config structure")
+
+
+def parse_optimizer_config(optimizer_config: dict[str, Any]) -> models.OptimizersConfigDiff | None:
+    """Pure function - parse optimizer config to Qdrant models"""
+    if not optimizer_config:
+        return None
+
+    return models.OptimizersConfigDiff(indexing_threshold=optimizer_config.get("indexing_threshold", 20000))
+
+
+def parse_workload_config(optimizer_config: dict[str, Any]) -> WorkloadConfig:
+    """Pure function - parse workload settings from optimizer config"""
+    return WorkloadConfig(
+        k=optimizer_config.get("k", 10),
+        query_count=optimizer_config.get("query_count", 100),
+        score_threshold=optimizer_config.get("score_threshold"),
+        search_params=optimizer_config.get("search_params", {}),
+        arrival_rate=optimizer_config.get("arrival_rate"),
+        arrival_process=ArrivalProcess(optimizer_config.get("arrival_process", ArrivalProcess.FIXED)),
+        seed=optimizer_config.get("seed"),
+        concurrency=optimizer_config.get("concurrency"),
+        concurrency_levels=optimizer_config.get("concurrency_levels", []),
+        processes=optimizer_config.get("processes", 1),
+        batch_size=optimizer_config.get("batch_size"),
+        warmup=parse_warmup_plan(optimizer_config.get("warmup")),
+        fusion=parse_fusion_config(optimizer_config.get("fusion", {})),
+    )
+
+
+def parse_follow_up_workload_config(optimizer_config: dict[str, Any]) -> WorkloadConfig:
+    """
+    Pure function - workload settings for the filtered and mixed phases. The unfiltered run
+    already warmed the collection, and its sweep and prefetch-stage profile belong to it.
+    """
+    config = parse_workload_config(optimizer_config)
+    fusion = replace(config.fusion, profile_stages=False) if config.fusion else None
+
+    return replace(config, warmup=None, concurrency_levels=[], fusion=fusion)
+
+
+def parse_fusion_config(fusion: dict[str, Any] | None) -> FusionConfig | None:
+    """Pure function - hybrid search settings for multi-vector datasets; `{"method": "none"}` searches one vector"""
+    if fusion is None or fusion.get("method") == "none":
+        return None
+
+    return FusionConfig(
+        method=FusionMethod(fusion.get("method", FusionMethod.RRF)),
+        prefetch_limit=fusion.get("prefetch_limit"),
+        profile_stages=fusion.get("profile_stages", True),
+        profile_queries=fusion.get("profile_queries", 100),
+    )
+
+
+def parse_warmup_plan(warmup: dict[str, Any] | None) -> WarmupPlan | None:
+    """Pure function - warmup stage from the `warmup` section, None when warmup is not configured"""
+    if not warmup:
+        return None
+
+    return WarmupPlan(
+        queries=warmup.get("queries"),
+        duration=warmup.get("duration_s"),
+        auto=warmup.get("auto", False),
+        window=warmup.get("window", 50),
+        tolerance=warmup.get("tolerance", 0.1),
+    )
+
+
+def expand_search_param_grid(base: SearchParams, grid: dict[str, Any]) -> list[SearchParams]:
+    """Pure function - every combination of the grid layered over the base search params"""
+    unknown = set(grid) - set(SearchParams.__annotations__)
+    if unknown:
+        raise ValueError(f"Unknown search params in search_param_grid: {', '.join(sorted(unknown))}")
+
+    axes = flatten_grid(grid)
+    if not axes:
+        return []
+
+    combinations = []
+    for values in itertools.product(*(choices for _, choices in axes)):
+        params: dict[str, Any] = copy.deepcopy(dict(base))
+        for (path, _), value in zip(axes, values, strict=True):
+            *parents, leaf = path
+            target = params
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = value
+        combinations.append(cast(SearchParams, params))
+
+    return combinations
+
+
+def flatten_grid(grid: dict[str, Any], prefix: tuple[str, ...] = ()) -> list[tuple[tuple[str, ...], list[Any]]]:
+    """Pure function - (key path, choices) for every leaf list of a nested grid"""
+    axes = []
+    for key, value in grid.items():
+        if isinstance(value, dict):
+            axes.extend(flatten_grid(value, (*prefix, key)))
+        else:
+            axes.append(((*prefix, key), list(value)))
+
+    return axes
+
+
+def parse_phase_budgets(optimizer_config: dict[str, Any]) -> PhaseBudgets:
+    """Pure function - per-phase time budgets in seconds from the `budgets` section"""
+    budgets = optimizer_config.get("budgets", {})
+
+    return PhaseBudgets(
+        ingestion=budgets.get("ingestion_s"),
+        indexing=budgets.get("indexing_s"),
+        workload=budgets.get("workload_s"),
+    )
+
+
+def parse_ingestion_config(optimizer_config: dict[str, Any]) -> IngestionConfig:
+    """Pure function - parse ingestion pipeline settings from optimizer config"""
+    ingestion = optimizer_config.get("ingestion", {})
+    defaults = IngestionConfig()
+
+    return IngestionConfig(
+        batch_size=ingestion.get("batch_size", defaults.batch_size),
+        parallel=ingestion.get("parallel", defaults.parallel),
+        queue_size=ingestion.get("queue_size", defaults.queue_size),
+        wait=ingestion.get("wait", defaults.wait),
+        embedding_model=ingestion.get("embedding_model", defaults.embedding_model),
+    )
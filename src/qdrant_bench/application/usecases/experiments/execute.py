@@ -1,7 +1,7 @@
 import asyncio
 import time
-from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
@@ -9,14 +9,70 @@ import logfire
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 
-from qdrant_bench.domain.entities.core import Connection, Dataset, Experiment, RunStatus
+from qdrant_bench.application.usecases.connections.gate import ConnectionGate
+from qdrant_bench.application.usecases.experiments.config import (
+    PhaseBudgets,
+    expand_search_param_grid,
+    parse_follow_up_workload_config,
+    parse_ingestion_config,
+    parse_optimizer_config,
+    parse_phase_budgets,
+    parse_transports,
+    parse_vector_config,
+    parse_workload_config,
+)
+from qdrant_bench.application.usecases.experiments.filtered import (
+    FilteredSearch,
+    FilteredSearchCache,
+    build_query_filter,
+    filtered_search_key,
+    parse_filtered_search_plan,
+    prepare_filtered_search,
+    summarize_filter_bucket,
+)
+from qdrant_bench.application.usecases.experiments.lifecycle import (
+    COLLECTION_CREATED_AT_KEY,
+    COLLECTION_FINGERPRINT_KEY,
+    CollectionPolicy,
+    RunCollections,
+    SeedResult,
+    collection_fingerprint,
+    create_point_batches,
+    delete_collection_if_exists,
+    extract_named_vectors,
+    list_built_collections,
+    parse_collection_policy,
+    prune_retained_collections,
+    reuses_collection,
+    run_collection_name,
+    summarize_seed,
+    wait_for_indexing,
+)
+from qdrant_bench.application.usecases.experiments.mixed import (
+    merge_mixed_timeline,
+    parse_writer_config,
+    summarize_optimizer_samples,
+)
+from qdrant_bench.domain.entities.core import CollectionRetention, Connection, Dataset, Experiment, RunStatus
 from qdrant_bench.domain.services.evaluator import StandardEvaluator
-from qdrant_bench.infrastructure.persistence.dataset_loader import load_dataset_corpus, load_ground_truth
+from qdrant_bench.domain.services.slo import DEADLINE_BREACH, SloGuard
+from qdrant_bench.domain.services.timeline import QueryTimeline
+from qdrant_bench.infrastructure.ingestion.indexing import IndexingMonitor
+from qdrant_bench.infrastructure.ingestion.pipeline import IngestionConfig, ingest_point_batches
+from qdrant_bench.infrastructure.persistence.dataset_loader import iter_dataset_corpus, load_ground_truth
+from qdrant_bench.infrastructure.services.embedding_cache import CachingEmbeddingService, EmbeddingCacheStats
 from qdrant_bench.infrastructure.telemetry.qdrant_adapter import QdrantTelemetryAdapter
+from qdrant_bench.infrastructure.workloads.execution import summarize_latency_components
+from qdrant_bench.infrastructure.workloads.multi_vector import MultiVectorWorkload
 from qdrant_bench.infrastructure.workloads.single_vector import SingleVectorWorkload
+from qdrant_bench.infrastructure.workloads.writer import BackgroundWriter, WriterConfig, delete_writer_points
 from qdrant_bench.ports.embedding_service import EmbeddingService
+from qdrant_bench.ports.evaluator import GroundTruth
 from qdrant_bench.ports.repositories import ConnectionRepository, DatasetRepository, ExperimentRepository, RunRepository
-from qdrant_bench.ports.workload import WorkloadConfig
+from qdrant_bench.ports.workload import Transport, Workload, WorkloadConfig
+
+# Extra time granted past the workload budget for in-flight queries to drain before the phase is cut off
+WORKLOAD_BUDGET_GRACE_S = 30.0
 
 
 @dataclass
@@ -25,6 +81,16 @@ class WorkflowResult:
     metrics: dict[str, Any]
 
 
+class RunAborted(Exception):
+    """A phase ran out of budget or an SLO guard tripped; carries the metrics measured so far"""
+
+    def __init__(self, phase: str, reason: str, metrics: dict[str, Any] | None = None):
+        super().__init__(f"{phase} aborted: {reason}")
+        self.phase = phase
+        self.reason = reason
+        self.metrics = metrics or {}
+
+
 @dataclass
 class ExperimentWorkflow:
     """Orchestrates experiment execution with dependencies as fields"""
@@ -33,35 +99,204 @@ class ExperimentWorkflow:
     embedding_service: EmbeddingService
     telemetry_adapter: QdrantTelemetryAdapter
     evaluator: StandardEvaluator
+    transport_clients: dict[Transport, AsyncQdrantClient] = field(default_factory=dict)
+    run_collections: RunCollections | None = None
+    filtered_searches: FilteredSearchCache | None = None
 
-    async def execute(self, experiment: Experiment, dataset: Dataset, connection: Connection) -> WorkflowResult:
+    async def execute(
+        self, experiment: Experiment, dataset: Dataset, connection: Connection, collection_name: str | None = None
+    ) -> WorkflowResult:
         """Main workflow orchestration - pure with respect to inputs"""
-        collection_name = await self.create_collection(dataset, experiment)
+        run_collection = collection_name or dataset.name
+        fingerprint = collection_fingerprint(dataset, experiment)
+        policy = parse_collection_policy(experiment.optimizer_config)
+        budgets = parse_phase_budgets(experiment.optimizer_config)
+
+        reused = await self.select_collection(run_collection, dataset, fingerprint, experiment)
+        target = reused or run_collection
+        succeeded = False
 
-        indexing_duration = await self.seed_and_index(collection_name=collection_name, dataset=dataset)
+        try:
+            seed_result = None
+            transport_metrics: dict[Transport, dict[str, Any]] = {}
+            aborted = None
 
-        workload_result = await self.run_workload(
-            collection_name=collection_name, dataset=dataset, experiment=experiment
+            try:
+                filtered = await self.load_filtered_search(dataset, experiment, fingerprint, budgets)
+                if not reused:
+                    seed_result = await self.build_collection(
+                        target, dataset, experiment, fingerprint, budgets, filtered
+                    )
+
+                writer_config = parse_writer_config(experiment.optimizer_config)
+                deadline = time.perf_counter() + budgets.workload if budgets.workload is not None else None
+
+                for transport, client in self.workload_clients().items():
+                    transport_metrics[transport] = await self.measure_workload(
+                        client=client, collection_name=target, dataset=dataset, experiment=experiment, deadline=deadline
+                    )
+                    if filtered:
+                        transport_metrics[transport] |= await self.measure_filtered_search(
+                            client, target, dataset, experiment, filtered, deadline
+                        )
+                # Writes leave segments and deletions behind, so every read-only phase runs first
+                if writer_config:
+                    for transport, client in self.workload_clients().items():
+                        transport_metrics[transport] |= await self.measure_mixed_workload(
+                            client, target, dataset, experiment, writer_config, deadline
+                        )
+            except RunAborted as e:
+                logfire.warn(f"Run aborted during {e.phase}: {e.reason}")
+                aborted = e
+
+            telemetry = await self.telemetry_adapter.get_cluster_stats(connection)
+            succeeded = aborted is None
+
+            metrics = {
+                **(summarize_transports(transport_metrics) if transport_metrics else {}),
+                **telemetry,
+                **summarize_seed(seed_result),
+                "collection_name": target,
+                "collection_reused": reused is not None,
+                "collection_fingerprint": fingerprint,
+            }
+
+            if aborted:
+                return WorkflowResult(
+                    status=RunStatus.CANCELED,
+                    metrics={
+                        **metrics,
+                        **aborted.metrics,
+                        "aborted_phase": aborted.phase,
+                        "abort_reason": aborted.reason,
+                    },
+                )
+
+            return WorkflowResult(status=RunStatus.COMPLETED, metrics=metrics)
+        finally:
+            if reused is None:
+                await self.retire_collection(run_collection, dataset, policy, succeeded)
+
+    async def select_collection(
+        self, run_collection: str, dataset: Dataset, fingerprint: str, experiment: Experiment
+    ) -> str | None:
+        """The reusable collection to search, if any, claimed before use so other runs' retention spares it"""
+        reused = await self.find_reusable_collection(dataset, fingerprint, experiment)
+        if self.run_collections is None:
+            return reused
+
+        await self.run_collections.claim(reused or run_collection)
+        if reused and not await self.client.collection_exists(reused):
+            await self.run_collections.claim(run_collection)
+            return None
+
+        return reused
+
+    async def find_reusable_collection(self, dataset: Dataset, fingerprint: str, experiment: Experiment) -> str | None:
+        """A fully built collection of this dataset with the same index-relevant config, if any"""
+        if not reuses_collection(experiment.optimizer_config):
+            return None
+
+        built = await list_built_collections(self.client, dataset)
+
+        return next((name for name, metadata in built if metadata[COLLECTION_FINGERPRINT_KEY] == fingerprint), None)
+
+    async def load_filtered_search(
+        self, dataset: Dataset, experiment: Experiment, fingerprint: str, budgets: PhaseBudgets
+    ) -> FilteredSearch | None:
+        """
+        Filter buckets and their ground truth, None when no filtered search is configured. Computing
+        them streams and embeds the corpus, so a cached copy is reused when the inputs match and a
+        fresh computation runs within the ingestion budget.
+        """
+        if parse_filtered_search_plan(experiment.optimizer_config) is None:
+            return None
+
+        key = filtered_search_key(fingerprint, experiment)
+        cached = self.filtered_searches.get(key) if self.filtered_searches is not None else None
+        if cached:
+            return cached
+
+        try:
+            filtered = await asyncio.wait_for(
+                prepare_filtered_search(dataset, experiment, self.embedding_service), timeout=budgets.ingestion
+            )
+        except TimeoutError:
+            raise RunAborted(
+                phase="ingestion",
+                reason=f"ingestion time budget of {budgets.ingestion}s exceeded computing filtered ground truth",
+            ) from None
+
+        if filtered and self.filtered_searches is not None:
+            self.filtered_searches.put(key, filtered)
+
+        return filtered
+
+    async def build_collection(
+        self,
+        collection_name: str,
+        dataset: Dataset,
+        experiment: Experiment,
+        fingerprint: str,
+        budgets: PhaseBudgets | None = None,
+        filtered: FilteredSearch | None = None,
+    ) -> SeedResult:
+        """Create, seed and index the collection and its payload index, then stamp it for reuse if enabled"""
+        await self.create_collection(collection_name, experiment)
+
+        seed_result = await self.seed_and_index(
+            collection_name=collection_name,
+            dataset=dataset,
+            config=parse_ingestion_config(experiment.optimizer_config),
+            vector_names=extract_named_vectors(experiment.vector_config),
+            budgets=budgets or PhaseBudgets(),
         )
 
-        eval_result = await self.evaluate_results(workload_result=workload_result, dataset=dataset)
+        if filtered and filtered.index_schema:
+            filtered.payload_index_time_ms = await self.create_payload_index(
+                collection_name, filtered.field, filtered.index_schema
+            )
+
+        if reuses_collection(experiment.optimizer_config):
+            await self.stamp_collection(collection_name, fingerprint)
+
+        return seed_result
+
+    async def stamp_collection(self, collection_name: str, fingerprint: str) -> None:
+        """Record the fingerprint in collection metadata; servers before Qdrant 1.16 have none, so reuse is skipped"""
+        try:
+            await self.client.update_collection(
+                collection_name=collection_name,
+                metadata={COLLECTION_FINGERPRINT_KEY: fingerprint, COLLECTION_CREATED_AT_KEY: time.time()},
+            )
+        except Exception as e:
+            logfire.warn("Collection metadata not supported, collection will not be reused", error=repr(e))
+
+    async def retire_collection(
+        self, collection_name: str, dataset: Dataset, policy: CollectionPolicy, succeeded: bool
+    ) -> None:
+        """Apply the retention policy to the collection this run built, sparing collections other runs still search"""
+        in_use = await self.run_collections.in_use() if self.run_collections else set()
+        if collection_name in in_use:
+            return
+
+        if policy.retention == CollectionRetention.DELETE or (
+            policy.retention == CollectionRetention.KEEP_ON_FAILURE and succeeded
+        ):
+            await delete_collection_if_exists(self.client, collection_name)
+            return
 
-        telemetry = await self.telemetry_adapter.get_cluster_stats(connection)
+        if policy.max_retained is not None:
+            await prune_retained_collections(
+                self.client, dataset, policy.max_retained, keep=collection_name, in_use=in_use
+            )
 
-        return WorkflowResult(
-            status=RunStatus.COMPLETED,
-            metrics={
-                **eval_result.scores,
-                **telemetry,
-                "indexing_time_ms": indexing_duration * 1000,
-                "total_duration": workload_result.total_duration,
-            },
-        )
+    def workload_clients(self) -> dict[Transport, AsyncQdrantClient]:
+        """Clients to run the workload with, in order - defaults to the setup client over REST"""
+        return self.transport_clients or {Transport.REST: self.client}
 
-    async def create_collection(self, dataset: Dataset, experiment: Experiment) -> str:
+    async def create_collection(self, collection_name: str, experiment: Experiment) -> str:
         """Create collection - uses self.client"""
-        collection_name = dataset.name
-
         await delete_collection_if_exists(self.client, collection_name)
 
         vectors_config = parse_vector_config(experiment.vector_config)
@@ -73,41 +308,300 @@ class ExperimentWorkflow:
 
         return collection_name
 
-    async def seed_and_index(self, collection_name: str, dataset: Dataset) -> float:
-        """Seed collection and wait for indexing - returns duration"""
+    async def seed_and_index(
+        self,
+        collection_name: str,
+        dataset: Dataset,
+        config: IngestionConfig,
+        vector_names: list[str],
+        budgets: PhaseBudgets | None = None,
+    ) -> SeedResult:
+        """Seed collection through the ingestion pipeline and wait for indexing, each within its budget"""
+        budgets = budgets or PhaseBudgets()
         indexing_start = time.perf_counter()
+        cache_before = self.embedding_cache_stats()
+
+        try:
+            ingestion = await asyncio.wait_for(
+                ingest_point_batches(
+                    client=self.client,
+                    collection_name=collection_name,
+                    batches=create_point_batches(
+                        record_batches=iter_dataset_corpus(dataset, batch_size=config.batch_size),
+                        embedding_service=self.embedding_service,
+                        vector_names=vector_names,
+                        model=config.embedding_model,
+                    ),
+                    config=config,
+                ),
+                timeout=budgets.ingestion,
+            )
+        except TimeoutError:
+            raise RunAborted(
+                phase="ingestion",
+                reason=f"ingestion time budget of {budgets.ingestion}s exceeded",
+                metrics={
+                    "ingestion_time_ms": (time.perf_counter() - indexing_start) * 1000,
+                    "ingested_points": (await self.client.count(collection_name=collection_name, exact=True)).count,
+                },
+            ) from None
+
+        monitor = IndexingMonitor()
+
+        try:
+            await asyncio.wait_for(wait_for_indexing(self.client, collection_name, monitor), timeout=budgets.indexing)
+        except TimeoutError:
+            raise RunAborted(
+                phase="indexing",
+                reason=f"indexing time budget of {budgets.indexing}s exceeded",
+                metrics={
+                    "ingestion_time_ms": ingestion.duration * 1000,
+                    "ingested_points": ingestion.points,
+                    "ingestion_points_per_sec": ingestion.points_per_second,
+                    "indexing_time_ms": (time.perf_counter() - indexing_start) * 1000,
+                    **monitor.summary(),
+                },
+            ) from None
+
+        cache_after = self.embedding_cache_stats()
+
+        return SeedResult(
+            ingestion=ingestion,
+            duration=time.perf_counter() - indexing_start,
+            embedding_cache=cache_after.since(cache_before) if cache_after and cache_before else None,
+            indexing=monitor,
+        )
 
-        records = await load_dataset_corpus(dataset)
+    def embedding_cache_stats(self) -> EmbeddingCacheStats | None:
+        """Snapshot of the embedding cache counters, None when embeddings are not cached"""
+        if not isinstance(self.embedding_service, CachingEmbeddingService):
+            return None
+
+        return self.embedding_service.stats
+
+    async def measure_workload(
+        self,
+        client: AsyncQdrantClient,
+        collection_name: str,
+        dataset: Dataset,
+        experiment: Experiment,
+        deadline: float | None = None,
+    ) -> dict[str, Any]:
+        """Run and evaluate the workload once, or once per search-param combination, under SLOs and deadline"""
+        # A breach aborts a single run, while a sweep records the breaching combination and moves on
+        config = parse_workload_config(experiment.optimizer_config)
+        grid = expand_search_param_grid(config.search_params, experiment.optimizer_config.get("search_param_grid", {}))
+        slo = experiment.optimizer_config.get("slo", {})
+        ground_truth = await load_ground_truth(dataset) if slo.get("min_recall") is not None else None
+
+        if not grid:
+            guard = create_slo_guard(slo, deadline, ground_truth)
+            metrics = await self.run_and_evaluate(
+                client, collection_name, dataset, replace(config, guard=guard), deadline
+            )
+            if guard and guard.tripped:
+                raise RunAborted(phase="workload", reason=guard.breach or "", metrics=metrics)
+            if deadline_passed(deadline):
+                raise RunAborted(phase="workload", reason=DEADLINE_BREACH, metrics=metrics)
+            return metrics
+
+        points = []
+        out_of_time = False
+        for index, search_params in enumerate(grid):
+            guard = create_slo_guard(slo, deadline, ground_truth)
+            # The collection stays warm between combinations, so only the first one warms it up
+            warmup = config.warmup if index == 0 else None
+            metrics = await self.run_and_evaluate(
+                client,
+                collection_name,
+                dataset,
+                replace(config, search_params=search_params, guard=guard, warmup=warmup),
+                deadline,
+            )
+            points.append({"search_params": search_params, **metrics})
+
+            out_of_time = (guard is not None and guard.out_of_time) or deadline_passed(deadline)
+            if out_of_time:
+                break
+
+        summary = {
+            **points[0],
+            **summarize_search_sweep(points, experiment.optimizer_config.get("target_recall")),
+        }
 
-        async for batch_points in create_point_batches(
-            records=records, embedding_service=self.embedding_service, batch_size=100
-        ):
-            await self.client.upsert(collection_name=collection_name, points=batch_points)
+        if out_of_time:
+            raise RunAborted(phase="workload", reason=DEADLINE_BREACH, metrics=summary)
+
+        return summary
 
+    async def create_payload_index(
+        self, collection_name: str, field_name: str, field_schema: models.PayloadSchemaType
+    ) -> float:
+        """Index a payload field of a collection this run built and wait until it is queryable, in ms"""
+        start = time.perf_counter()
+        await self.client.create_payload_index(
+            collection_name=collection_name, field_name=field_name, field_schema=field_schema, wait=True
+        )
         await wait_for_indexing(self.client, collection_name)
 
-        return time.perf_counter() - indexing_start
+        return (time.perf_counter() - start) * 1000
+
+    async def measure_filtered_search(
+        self,
+        client: AsyncQdrantClient,
+        collection_name: str,
+        dataset: Dataset,
+        experiment: Experiment,
+        filtered: FilteredSearch,
+        deadline: float | None = None,
+    ) -> dict[str, Any]:
+        """Run the workload once per selectivity bucket and score it against that bucket's ground truth"""
+        config = parse_follow_up_workload_config(experiment.optimizer_config)
+        buckets = []
+
+        for bucket in filtered.buckets:
+            metrics = await self.run_and_evaluate(
+                client,
+                collection_name,
+                dataset,
+                replace(config, query_filter=build_query_filter(bucket.payload_filter)),
+                deadline,
+                ground_truth=bucket.ground_truth,
+            )
+            buckets.append(summarize_filter_bucket(bucket.payload_filter, metrics))
+            if deadline_passed(deadline):
+                break
+
+        summary = {
+            "filtered_search": {
+                "field": filtered.field,
+                "buckets": buckets,
+                **(
+                    {"payload_index_time_ms": filtered.payload_index_time_ms}
+                    if filtered.payload_index_time_ms is not None
+                    else {}
+                ),
+            }
+        }
 
-    async def run_workload(self, collection_name: str, dataset: Dataset, experiment: Experiment) -> Any:
-        """Execute workload"""
-        workload = SingleVectorWorkload()
+        if deadline_passed(deadline):
+            raise RunAborted(phase="workload", reason=DEADLINE_BREACH, metrics=summary)
+
+        return summary
+
+    async def measure_mixed_workload(
+        self,
+        client: AsyncQdrantClient,
+        collection_name: str,
+        dataset: Dataset,
+        experiment: Experiment,
+        writer_config: WriterConfig,
+        deadline: float | None = None,
+    ) -> dict[str, Any]:
+        """Run the workload once under a background write load, sampling the collection's optimizer status"""
+        # Writes go through the setup client so they never queue behind searches in the same pool;
+        # they leave segments and deletions behind, so this runs last on a private collection
+        config = replace(parse_follow_up_workload_config(experiment.optimizer_config), deadline=deadline)
+        writer = BackgroundWriter(config=writer_config)
+        monitor = IndexingMonitor()
+        stop = asyncio.Event()
+        timeout = max(deadline - time.perf_counter(), 0.0) + WORKLOAD_BUDGET_GRACE_S if deadline is not None else None
+
+        start = time.perf_counter()
+        background = asyncio.gather(
+            writer.run(self.client, collection_name, stop),
+            monitor.watch(self.client, collection_name, stop, start, writer_config.status_interval),
+        )
+
+        try:
+            with logfire.span("Mixed Workload", collection=collection_name, write_rate=writer_config.rate):
+                workload_result = await asyncio.wait_for(
+                    self.run_workload(client=client, collection_name=collection_name, dataset=dataset, config=config),
+                    timeout=timeout,
+                )
+        except TimeoutError:
+            raise RunAborted(phase="workload", reason="workload time budget exceeded") from None
+        finally:
+            stop.set()
+            duration = time.perf_counter() - start
+            await background
+            await delete_writer_points(self.client, collection_name)
+
+        eval_result = await self.evaluate_results(workload_result=workload_result, dataset=dataset)
+        search_timeline = workload_result.timeline or QueryTimeline(start=start)
+        search_timeline = replace(search_timeline, start=start)
 
-        optimizer_config = experiment.optimizer_config
+        summary = {
+            "mixed_workload": {
+                **eval_result.scores,
+                **summarize_latency_components(workload_result.latency_components),
+                "errors": search_timeline.errors,
+                **writer.summary(duration),
+                **summarize_optimizer_samples(monitor.samples),
+                "timeline": merge_mixed_timeline(search_timeline, writer.timeline(start), monitor.samples),
+            }
+        }
 
-        config = WorkloadConfig(
-            k=optimizer_config.get("k", 10),
-            query_count=optimizer_config.get("query_count", 100),
-            score_threshold=optimizer_config.get("score_threshold"),
-            search_params=optimizer_config.get("search_params", {}),
+        if deadline_passed(deadline):
+            raise RunAborted(phase="workload", reason=DEADLINE_BREACH, metrics=summary)
+
+        return summary
+
+    async def run_and_evaluate(
+        self,
+        client: AsyncQdrantClient,
+        collection_name: str,
+        dataset: Dataset,
+        config: WorkloadConfig,
+        deadline: float | None = None,
+        ground_truth: GroundTruth | None = None,
+    ) -> dict[str, Any]:
+        """Run the workload and merge its scores with its load metrics; past the grace period it is cut off"""
+        timeout = max(deadline - time.perf_counter(), 0.0) + WORKLOAD_BUDGET_GRACE_S if deadline is not None else None
+
+        try:
+            workload_result = await asyncio.wait_for(
+                self.run_workload(
+                    client=client,
+                    collection_name=collection_name,
+                    dataset=dataset,
+                    config=replace(config, deadline=deadline),
+                ),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            raise RunAborted(phase="workload", reason="workload time budget exceeded") from None
+
+        eval_result = await self.evaluate_results(
+            workload_result=workload_result, dataset=dataset, ground_truth=ground_truth
         )
 
-        return await workload.execute(self.client, dataset, config)
+        return {
+            **eval_result.scores,
+            **workload_result.metrics,
+            **summarize_timeline(workload_result.timeline),
+            **summarize_latency_components(workload_result.latency_components),
+            "total_duration": workload_result.total_duration,
+            "latency_histogram": workload_result.latencies.to_dict(),
+        }
 
-    async def evaluate_results(self, workload_result: Any, dataset: Dataset) -> Any:
-        """Evaluate workload results against ground truth"""
-        ground_truth = await load_ground_truth(dataset)
+    async def run_workload(
+        self, client: AsyncQdrantClient, collection_name: str, dataset: Dataset, config: WorkloadConfig
+    ) -> Any:
+        """Execute workload"""
+        workload = select_workload(dataset)
 
-        return self.evaluator.evaluate(workload_result.predictions, ground_truth, workload_result.latencies)
+        return await workload.execute(client, collection_name, dataset, config)
+
+    async def evaluate_results(
+        self, workload_result: Any, dataset: Dataset, ground_truth: GroundTruth | None = None
+    ) -> Any:
+        """Evaluate workload results against the given ground truth, or the dataset's own"""
+        ground_truth = ground_truth or await load_ground_truth(dataset)
+
+        return self.evaluator.evaluate(
+            workload_result.predictions, ground_truth, workload_result.latencies, workload_result.timeline
+        )
 
 
 @dataclass
@@ -119,6 +613,8 @@ class ExecuteExperimentUseCase:
     embedding_service: EmbeddingService
     telemetry_adapter: QdrantTelemetryAdapter
     evaluator: StandardEvaluator = field(default_factory=StandardEvaluator)
+    connection_gate: ConnectionGate = field(default_factory=ConnectionGate)
+    filtered_searches: FilteredSearchCache = field(default_factory=FilteredSearchCache)
 
     async def execute(self, run_id: UUID):
         """Execute experiment run - orchestrates repositories and workflow"""
@@ -147,102 +643,165 @@ class ExecuteExperimentUseCase:
                 await self.run_repo.save(replace(run, status=RunStatus.FAILED))
                 return
 
-            await self.run_repo.save(replace(run, status=RunStatus.RUNNING))
+            async with self.connection_gate.hold(connection):
+                run = await self.run_repo.save(replace(run, status=RunStatus.RUNNING, heartbeat_at=datetime.now(UTC)))
 
-            try:
-                result = await self.execute_workflow(experiment=experiment, dataset=dataset, connection=connection)
+                try:
+                    result = await self.execute_workflow(
+                        experiment=experiment,
+                        dataset=dataset,
+                        connection=connection,
+                        collection_name=run_collection_name(dataset, run.id),
+                        run_collections=RunCollections(self.run_repo, run.id),
+                    )
 
-                await self.run_repo.save(replace(run, status=result.status, metrics=result.metrics))
+                    await self.run_repo.save(replace(run, status=result.status, metrics=result.metrics))
 
-                logfire.info(f"Run {run_id} completed successfully")
+                    logfire.info(f"Run {run_id} completed successfully")
 
-            except Exception as e:
-                logfire.error(f"Run {run_id} failed: {e}")
-                await self.run_repo.save(replace(run, status=RunStatus.FAILED))
+                except asyncio.CancelledError:
+                    # Shutdown or a cancelled task - record it so the run is not left RUNNING
+                    logfire.warn(f"Run {run_id} was cancelled")
+                    await self.run_repo.save(
+                        replace(run, status=RunStatus.CANCELED, metrics={**run.metrics, "abort_reason": "cancelled"})
+                    )
+                    raise
+
+                except Exception as e:
+                    logfire.error(f"Run {run_id} failed: {e}")
+                    await self.run_repo.save(replace(run, status=RunStatus.FAILED))
 
     async def execute_workflow(
-        self, experiment: Experiment, dataset: Dataset, connection: Connection
+        self,
+        experiment: Experiment,
+        dataset: Dataset,
+        connection: Connection,
+        collection_name: str,
+        run_collections: RunCollections | None = None,
     ) -> WorkflowResult:
         """Create workflow orchestrator and execute"""
-        client = AsyncQdrantClient(url=connection.url, api_key=connection.api_key)
+        transports = parse_transports(experiment.optimizer_config)
+        transport_clients = {transport: create_client(connection, transport) for transport in transports}
 
         workflow = ExperimentWorkflow(
-            client=client,
+            client=transport_clients[transports[0]],
             embedding_service=self.embedding_service,
             telemetry_adapter=self.telemetry_adapter,
             evaluator=self.evaluator,
+            transport_clients=transport_clients,
+            run_collections=run_collections,
+            filtered_searches=self.filtered_searches,
         )
 
-        return await workflow.execute(experiment=experiment, dataset=dataset, connection=connection)
-
-
-def parse_vector_config(vector_config: dict[str, Any]) -> Any:
-    """Pure function - parse vector config to Qdrant models"""
-    if "size" in vector_config:
-        return models.VectorParams(
-            size=vector_config["size"], distance=models.Distance[vector_config.get("distance", "COSINE")]
-        )
-
-    if "vectors" in vector_config:
-        return {
-            name: models.VectorParams(size=cfg["size"], distance=models.Distance[cfg.get("distance", "COSINE")])
-            for name, cfg in vector_config["vectors"].items()
+        try:
+            return await workflow.execute(
+                experiment=experiment, dataset=dataset, connection=connection, collection_name=collection_name
+            )
+        finally:
+            for client in transport_clients.values():
+                await client.close()
+
+
+def create_client(connection: Connection, transport: Transport) -> AsyncQdrantClient:
+    """Build a client for the connection speaking the given transport"""
+    return AsyncQdrantClient(url=connection.url, api_key=connection.api_key, prefer_grpc=transport == Transport.GRPC)
+
+
+def summarize_transports(transport_metrics: dict[Transport, dict[str, Any]]) -> dict[str, Any]:
+    """Pure function - headline metrics from the first transport, plus the REST-minus-gRPC gap when both ran"""
+    primary = next(iter(transport_metrics))
+    metrics = {**transport_metrics[primary], "transport": primary.value}
+
+    if len(transport_metrics) < 2:
+        return metrics
+
+    rest = transport_metrics.get(Transport.REST, {})
+    grpc = transport_metrics.get(Transport.GRPC, {})
+
+    overhead = {
+        f"rest_overhead_{name}": rest[name] - grpc[name]
+        for name in ("p50_latency", "p95_latency", "p99_latency")
+        if name in rest and name in grpc
+    }
+
+    return {
+        **metrics,
+        "transports": {transport.value: values for transport, values in transport_metrics.items()},
+        **overhead,
+    }
+
+
+def summarize_search_sweep(points: list[dict[str, Any]], target_recall: float | None) -> dict[str, Any]:
+    """Pure function - recall-vs-latency series, recommending the fastest combination meeting the target"""
+    series = [
+        {
+            "search_params": point["search_params"],
+            **{
+                key: point[key]
+                for key in (
+                    "recall",
+                    "p50_latency",
+                    "p95_latency",
+                    "p99_latency",
+                    "server_p95_latency",
+                    "server_p99_latency",
+                    "qps",
+                    "aborted_reason",
+                )
+                if key in point
+            },
         }
+        for point in points
+    ]
+
+    if target_recall is None:
+        return {"search_param_sweep": series}
+
+    # Ranked by server p95 where available so network noise does not pick the winner; combinations
+    # stopped by an SLO guard were measured on a partial workload and are never recommended
+    meeting = [point for point in series if "aborted_reason" not in point and point.get("recall", 0.0) >= target_recall]
+    best = min(
+        meeting,
+        key=lambda point: point.get("server_p95_latency", point.get("p95_latency", float("inf"))),
+        default=None,
+    )
 
-    raise ValueError("Invalid vector_config structure")
-
-
-def parse_optimizer_config(optimizer_config: dict[str, Any]) -> models.OptimizersConfigDiff | None:
-    """Pure function - parse optimizer config to Qdrant models"""
-    if not optimizer_config:
-        return None
-
-    return models.OptimizersConfigDiff(indexing_threshold=optimizer_config.get("indexing_threshold", 20000))
-
+    return {
+        "search_param_sweep": series,
+        "target_recall": target_recall,
+        "recommended_search_params": best["search_params"] if best else None,
+    }
 
-def create_point_struct(idx: int, embedding: list[float], record: dict[str, Any]) -> models.PointStruct:
-    """Pure function - create a single point"""
-    return models.PointStruct(id=idx, vector=embedding, payload=record.get("metadata", {}))
 
+def deadline_passed(deadline: float | None) -> bool:
+    """Helper function - whether a phase deadline on the perf_counter clock has passed"""
+    return deadline is not None and time.perf_counter() >= deadline
 
-async def delete_collection_if_exists(client: AsyncQdrantClient, collection_name: str) -> None:
-    """Helper function - delete collection if it exists"""
-    try:
-        await client.get_collection(collection_name)
-        await client.delete_collection(collection_name)
-    except Exception:
-        pass
 
+def create_slo_guard(slo: dict[str, Any], deadline: float | None, ground_truth: GroundTruth | None) -> SloGuard | None:
+    """Pure function - guard for one workload run, None when there is nothing to guard"""
+    if deadline is None and slo.get("max_p99_latency") is None and slo.get("min_recall") is None:
+        return None
 
-async def wait_for_indexing(client: AsyncQdrantClient, collection_name: str) -> None:
-    """Helper function - wait for collection indexing to complete"""
-    await client.update_collection(
-        collection_name=collection_name, optimizer_config=models.OptimizersConfigDiff(indexing_threshold=0)
+    return SloGuard(
+        max_p99_latency=slo.get("max_p99_latency"),
+        min_recall=slo.get("min_recall"),
+        deadline=deadline,
+        relevant_items=ground_truth.relevant_items if ground_truth else {},
     )
 
-    while True:
-        info = await client.get_collection(collection_name)
-        if info.status == models.CollectionStatus.GREEN:
-            break
-        await asyncio.sleep(1)
 
+def summarize_timeline(timeline: QueryTimeline | None) -> dict[str, Any]:
+    """Pure function - per-second completions, errors and latency, plus the run's error count"""
+    if timeline is None:
+        return {}
 
-async def create_point_batches(
-    records: list[dict[str, Any]],
-    embedding_service: EmbeddingService,
-    batch_size: int,
-    model: str = "text-embedding-3-small",
-) -> AsyncGenerator[list[models.PointStruct], None]:
-    """Generator that yields batches of embedded points"""
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        texts = [rec.get("text", "") for rec in batch]
+    return {"timeline": timeline.windows(), "errors": timeline.errors}
 
-        embeddings = await embedding_service.embed_text(texts, model=model)
 
-        points = [
-            create_point_struct(i + idx, embedding, rec)
-            for idx, (rec, embedding) in enumerate(zip(batch, embeddings, strict=True))
-        ]
+def select_workload(dataset: Dataset) -> Workload:
+    """Pure function - pick the workload matching the dataset's vector layout"""
+    if "vectors" in dataset.schema_config:
+        return MultiVectorWorkload()
 
-        yield points
+    return SingleVectorWorkload()
@@ -0,0 +1,242 @@
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any
+
+import logfire
+import numpy as np
+from qdrant_client.http import models
+
+from qdrant_bench.application.usecases.experiments.config import parse_ingestion_config, parse_workload_config
+from qdrant_bench.domain.entities.core import Dataset, Experiment
+from qdrant_bench.domain.services.filters import PayloadFilter, derive_filters, pick_filter_field
+from qdrant_bench.domain.services.ground_truth import ExactNeighbors
+from qdrant_bench.infrastructure.ingestion.pipeline import IngestionConfig
+from qdrant_bench.infrastructure.ingestion.vectors import resolve_batch_vectors
+from qdrant_bench.infrastructure.persistence.dataset_loader import (
+    iter_dataset_corpus,
+    load_payload_columns,
+    load_query_matrix,
+)
+from qdrant_bench.ports.embedding_service import EmbeddingService
+from qdrant_bench.ports.evaluator import GroundTruth
+from qdrant_bench.ports.workload import WorkloadConfig
+
+
+@dataclass
+class FilteredSearchPlan:
+    """Filtered-search buckets to measure: target selectivities over one payload field"""
+
+    selectivities: list[float] = field(default_factory=lambda: [0.5, 0.05, 0.001])
+    field: str | None = None
+    create_payload_index: bool = False
+
+
+@dataclass
+class FilterBucket:
+    payload_filter: PayloadFilter
+    ground_truth: GroundTruth
+
+
+@dataclass
+class FilteredSearch:
+    """Filter buckets for one payload field; `index_schema` is set when the field gets a payload index"""
+
+    field: str
+    buckets: list[FilterBucket]
+    index_schema: models.PayloadSchemaType | None = None
+    payload_index_time_ms: float | None = None
+
+
+@dataclass
+class FilteredSearchCache:
+    """
+    Filter buckets and their ground truth from earlier runs in this process, keyed by
+    filtered_search_key; the least recently used entry is dropped once max_entries is reached
+    """
+
+    max_entries: int = 8
+    entries: OrderedDict[str, FilteredSearch] = field(default_factory=OrderedDict)
+
+    def get(self, key: str) -> FilteredSearch | None:
+        """A copy of the cached buckets without the payload index timing, which belongs to the run that built it"""
+        if key not in self.entries:
+            return None
+
+        self.entries.move_to_end(key)
+        return replace(self.entries[key], payload_index_time_ms=None)
+
+    def put(self, key: str, filtered: FilteredSearch) -> None:
+        self.entries[key] = replace(filtered, payload_index_time_ms=None)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+def filtered_search_key(fingerprint: str, experiment: Experiment) -> str:
+    """
+    Pure function - hash of everything filtered ground truth depends on: the collection
+    fingerprint covers the dataset, distance and embedding model, the rest the query set
+    """
+    config = parse_workload_config(experiment.optimizer_config)
+    plan = parse_filtered_search_plan(experiment.optimizer_config)
+
+    inputs = {
+        "collection": fingerprint,
+        "plan": asdict(plan) if plan else None,
+        "k": config.k,
+        "query_count": config.query_count,
+    }
+
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+async def prepare_filtered_search(
+    dataset: Dataset, experiment: Experiment, embedding_service: EmbeddingService
+) -> FilteredSearch | None:
+    """Helper function - one payload filter per target selectivity with its exact ground truth, None when unset"""
+    plan = parse_filtered_search_plan(experiment.optimizer_config)
+    if plan is None:
+        return None
+    if "vectors" in dataset.schema_config:
+        raise ValueError("filtered_search supports single-vector datasets only")
+
+    columns = await load_payload_columns(dataset)
+    field_name = plan.field or pick_filter_field(columns)
+    if field_name not in columns:
+        raise ValueError(f"Payload field '{field_name}' not found in corpus metadata")
+
+    filters = derive_filters(field_name, columns[field_name], plan.selectivities)
+
+    with logfire.span("Filtered Ground Truth", field=field_name, buckets=len(filters)):
+        buckets = await compute_filtered_ground_truth(
+            dataset,
+            filters,
+            columns[field_name],
+            parse_workload_config(experiment.optimizer_config),
+            distance=experiment.vector_config.get("distance", "COSINE"),
+            ingestion=parse_ingestion_config(experiment.optimizer_config),
+            embedding_service=embedding_service,
+        )
+
+    return FilteredSearch(
+        field=field_name,
+        buckets=buckets,
+        index_schema=payload_schema(columns[field_name]) if plan.create_payload_index else None,
+    )
+
+
+async def compute_filtered_ground_truth(
+    dataset: Dataset,
+    filters: list[PayloadFilter],
+    values: np.ndarray,
+    config: WorkloadConfig,
+    distance: str,
+    ingestion: IngestionConfig,
+    embedding_service: EmbeddingService,
+) -> list[FilterBucket]:
+    """Helper function - exact top-k among the points each filter keeps, in one streaming pass over the corpus"""
+    queries = await load_query_matrix(dataset, "vector", config.query_count)
+    masks = [payload_filter.matches(values) for payload_filter in filters]
+    neighbors = [ExactNeighbors(queries=queries, k=config.k, distance=distance) for _ in filters]
+    kept_ids: list[list[np.ndarray]] = [[] for _ in filters]
+    kept_counts = [0 for _ in filters]
+
+    offset = 0
+    async for record_batch in iter_dataset_corpus(dataset, batch_size=ingestion.batch_size):
+        block = await resolve_batch_vectors(record_batch, embedding_service, [], ingestion.embedding_model)
+        if isinstance(block, dict):
+            raise ValueError("filtered_search supports single-vector datasets only")
+
+        # Kept points are searched densely, so their positions map back to ingestion's consecutive ids
+        for index, mask in enumerate(masks):
+            kept = np.flatnonzero(mask[offset : offset + record_batch.height])
+            await asyncio.to_thread(neighbors[index].add, kept_counts[index], block[kept])
+            kept_ids[index].append(kept + offset)
+            kept_counts[index] += len(kept)
+
+        offset += record_batch.height
+
+    buckets = []
+    for payload_filter, bucket_neighbors, ids in zip(filters, neighbors, kept_ids, strict=True):
+        point_ids = np.concatenate(ids)[bucket_neighbors.ids] if ids else bucket_neighbors.ids
+        buckets.append(
+            FilterBucket(
+                payload_filter=payload_filter,
+                ground_truth=GroundTruth(relevant_items={i: set(row.tolist()) for i, row in enumerate(point_ids)}),
+            )
+        )
+
+    return buckets
+
+
+def parse_filtered_search_plan(optimizer_config: dict[str, Any]) -> FilteredSearchPlan | None:
+    """Pure function - filtered-search buckets from the `filtered_search` section, None when absent"""
+    section = optimizer_config.get("filtered_search")
+    if section is None:
+        return None
+
+    defaults = FilteredSearchPlan()
+
+    return FilteredSearchPlan(
+        selectivities=section.get("selectivities", defaults.selectivities),
+        field=section.get("field"),
+        create_payload_index=section.get("create_payload_index", False),
+    )
+
+
+def build_query_filter(payload_filter: PayloadFilter) -> models.Filter:
+    """Pure function - the payload filter as a Qdrant filter"""
+    if payload_filter.upper is not None:
+        condition = models.FieldCondition(key=payload_filter.field, range=models.Range(lte=payload_filter.upper))
+        return models.Filter(must=[condition])
+
+    values = payload_filter.any_of or []
+    if values and all(isinstance(value, bool) for value in values):
+        # MatchAny takes keywords or integers only, so booleans are matched one value at a time
+        return models.Filter(
+            should=[
+                models.FieldCondition(key=payload_filter.field, match=models.MatchValue(value=value))
+                for value in values
+            ]
+        )
+
+    return models.Filter(must=[models.FieldCondition(key=payload_filter.field, match=models.MatchAny(any=values))])
+
+
+def payload_schema(values: np.ndarray) -> models.PayloadSchemaType:
+    """Pure function - payload index type for a field's values"""
+    if np.issubdtype(values.dtype, np.bool_):
+        return models.PayloadSchemaType.BOOL
+    if np.issubdtype(values.dtype, np.integer):
+        return models.PayloadSchemaType.INTEGER
+    if np.issubdtype(values.dtype, np.floating):
+        return models.PayloadSchemaType.FLOAT
+
+    return models.PayloadSchemaType.KEYWORD
+
+
+def summarize_filter_bucket(payload_filter: PayloadFilter, metrics: dict[str, Any]) -> dict[str, Any]:
+    """Pure function - quality and latency of one selectivity bucket"""
+    return {
+        "target_selectivity": payload_filter.target,
+        "selectivity": payload_filter.selectivity,
+        "filter": payload_filter.describe(),
+        **{
+            key: metrics[key]
+            for key in (
+                "recall",
+                "ndcg",
+                "p50_latency",
+                "p95_latency",
+                "p99_latency",
+                "server_p95_latency",
+                "server_p99_latency",
+                "qps",
+                "errors",
+            )
+            if key in metrics
+        },
+    }
@@ -0,0 +1,232 @@
+import hashlib
+import json
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass, replace
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+import polars as pl
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.application.usecases.experiments.config import parse_ingestion_config, parse_optimizer_config
+from qdrant_bench.application.usecases.experiments.filtered import parse_filtered_search_plan
+from qdrant_bench.domain.entities.core import CollectionRetention, Dataset, Experiment, RunStatus
+from qdrant_bench.infrastructure.ingestion.indexing import IndexingMonitor
+from qdrant_bench.infrastructure.ingestion.pipeline import IngestionResult
+from qdrant_bench.infrastructure.ingestion.vectors import resolve_batch_vectors
+from qdrant_bench.infrastructure.services.embedding_cache import EmbeddingCacheStats
+from qdrant_bench.ports.embedding_service import EmbeddingService
+from qdrant_bench.ports.repositories import RunRepository
+
+COLLECTION_FINGERPRINT_KEY = "qdrant_bench_fingerprint"
+COLLECTION_CREATED_AT_KEY = "qdrant_bench_created_at"
+
+
+@dataclass
+class SeedResult:
+    ingestion: IngestionResult
+    duration: float
+    embedding_cache: EmbeddingCacheStats | None = None
+    indexing: IndexingMonitor | None = None
+
+
+@dataclass
+class CollectionPolicy:
+    """What happens to a run's collection once the run ends - max_retained None keeps collections without a bound"""
+
+    retention: CollectionRetention = CollectionRetention.KEEP
+    max_retained: int | None = 1
+
+
+@dataclass
+class RunCollections:
+    """Collections searched by in-flight runs, recorded on each run so workers in other processes see them"""
+
+    run_repo: RunRepository
+    run_id: UUID
+
+    async def claim(self, collection_name: str) -> None:
+        run = await self.run_repo.get(self.run_id)
+        if run:
+            await self.run_repo.save(replace(run, metrics={**run.metrics, "collection_name": collection_name}))
+
+    async def in_use(self) -> set[str]:
+        running = await self.run_repo.list(status=RunStatus.RUNNING.value)
+        return {
+            run.metrics["collection_name"]
+            for run in running
+            if run.id != self.run_id and run.metrics.get("collection_name")
+        }
+
+
+def collection_fingerprint(dataset: Dataset, experiment: Experiment) -> str:
+    """Pure function - hash of everything that shapes the built index, leaving search-time settings out"""
+    optimizers = parse_optimizer_config(experiment.optimizer_config)
+    filtered = parse_filtered_search_plan(experiment.optimizer_config)
+
+    index_config = {
+        "dataset": {"name": dataset.name, "source_uri": dataset.source_uri, "schema_config": dataset.schema_config},
+        "vector_config": experiment.vector_config,
+        "optimizers": optimizers.model_dump(exclude_none=True) if optimizers else None,
+        "embedding_model": parse_ingestion_config(experiment.optimizer_config).embedding_model,
+        "payload_index": {"field": filtered.field} if filtered and filtered.create_payload_index else None,
+    }
+
+    return hashlib.sha256(json.dumps(index_config, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def reuses_collection(optimizer_config: dict[str, Any]) -> bool:
+    """Pure function - whether this run may reuse and stamp a collection; mixed workloads write, so never"""
+    return optimizer_config.get("reuse_collection", True) and "mixed_workload" not in optimizer_config
+
+
+def parse_collection_policy(optimizer_config: dict[str, Any]) -> CollectionPolicy:
+    """Pure function - parse collection retention settings from optimizer config"""
+    return CollectionPolicy(
+        retention=CollectionRetention(optimizer_config.get("collection_retention", CollectionRetention.KEEP)),
+        max_retained=optimizer_config.get("max_retained_collections", 1),
+    )
+
+
+def run_collection_name(dataset: Dataset, run_id: UUID) -> str:
+    """Pure function - collection owned by a single run, so concurrent runs never collide"""
+    return f"{dataset.name}-run-{run_id.hex[:12]}"
+
+
+def extract_named_vectors(vector_config: dict[str, Any]) -> list[str]:
+    """Pure function - names of the collection's named vectors, empty for a single unnamed vector"""
+    return list(vector_config.get("vectors", {}).keys())
+
+
+def summarize_seed(seed_result: SeedResult | None) -> dict[str, Any]:
+    """Pure function - ingestion and indexing metrics, empty when an existing collection was reused"""
+    if seed_result is None:
+        return {}
+
+    return {
+        "indexing_time_ms": seed_result.duration * 1000,
+        "ingestion_time_ms": seed_result.ingestion.duration * 1000,
+        "ingested_points": seed_result.ingestion.points,
+        "ingestion_points_per_sec": seed_result.ingestion.points_per_second,
+        **summarize_embedding_cache(seed_result.embedding_cache),
+        **(seed_result.indexing.summary() if seed_result.indexing else {}),
+    }
+
+
+def summarize_embedding_cache(stats: EmbeddingCacheStats | None) -> dict[str, Any]:
+    """Pure function - embedding cache effectiveness for this run's ingestion"""
+    if stats is None:
+        return {}
+
+    return {
+        "embedding_cache_hits": stats.hits,
+        "embedding_cache_misses": stats.misses,
+        "embedding_cache_hit_ratio": stats.hit_ratio,
+        "embedding_cache_bytes_saved": stats.bytes_saved,
+    }
+
+
+def create_point_batch(
+    offset: int, vectors: np.ndarray | dict[str, np.ndarray], record_batch: pl.DataFrame
+) -> models.Batch:
+    """Pure function - a columnar batch of points with consecutive ids from offset"""
+    payloads = (
+        [payload or {} for payload in record_batch.get_column("metadata").to_list()]
+        if "metadata" in record_batch.columns
+        else [{} for _ in range(record_batch.height)]
+    )
+
+    batch_vectors = (
+        {name: matrix.tolist() for name, matrix in vectors.items()} if isinstance(vectors, dict) else vectors.tolist()
+    )
+
+    return models.Batch(ids=list(range(offset, offset + record_batch.height)), vectors=batch_vectors, payloads=payloads)
+
+
+async def create_point_batches(
+    record_batches: AsyncIterator[pl.DataFrame],
+    embedding_service: EmbeddingService,
+    vector_names: list[str] | None = None,
+    model: str = "text-embedding-3-small",
+) -> AsyncGenerator[models.Batch, None]:
+    """Generator that yields columnar batches of points, one per streamed record batch"""
+    offset = 0
+
+    async for record_batch in record_batches:
+        vectors = await resolve_batch_vectors(record_batch, embedding_service, vector_names or [], model)
+
+        yield create_point_batch(offset, vectors, record_batch)
+
+        offset += record_batch.height
+
+
+async def delete_collection_if_exists(client: AsyncQdrantClient, collection_name: str) -> None:
+    """Helper function - delete collection if it exists"""
+    try:
+        await client.get_collection(collection_name)
+        await client.delete_collection(collection_name)
+    except Exception:
+        pass
+
+
+async def wait_for_indexing(
+    client: AsyncQdrantClient, collection_name: str, monitor: IndexingMonitor | None = None
+) -> IndexingMonitor:
+    """Helper function - force indexing of all segments and sample its progress until complete"""
+    monitor = monitor or IndexingMonitor()
+
+    await client.update_collection(
+        collection_name=collection_name, optimizer_config=models.OptimizersConfigDiff(indexing_threshold=0)
+    )
+
+    await monitor.run(client, collection_name)
+
+    return monitor
+
+
+async def list_built_collections(client: AsyncQdrantClient, dataset: Dataset) -> list[tuple[str, dict[str, Any]]]:
+    """Helper function - this dataset's collections that finished building, with their metadata"""
+    return [
+        (name, metadata)
+        for name, metadata in await list_run_collections(client, dataset)
+        if COLLECTION_FINGERPRINT_KEY in metadata
+    ]
+
+
+async def list_run_collections(client: AsyncQdrantClient, dataset: Dataset) -> list[tuple[str, dict[str, Any]]]:
+    """Helper function - every collection of this dataset, built or not, with its metadata"""
+    run_prefix = f"{dataset.name}-run-"
+    collections = []
+
+    for description in (await client.get_collections()).collections:
+        if description.name != dataset.name and not description.name.startswith(run_prefix):
+            continue
+
+        try:
+            info = await client.get_collection(description.name)
+        except Exception:
+            continue  # dropped by a concurrent run since listing
+
+        collections.append((description.name, info.config.metadata or {}))
+
+    return collections
+
+
+async def prune_retained_collections(
+    client: AsyncQdrantClient, dataset: Dataset, max_retained: int, keep: str, in_use: set[str] | None = None
+) -> None:
+    """Helper function - drop the oldest collections beyond max_retained, unstamped first, sparing those in use"""
+    collections = await list_run_collections(client, dataset)
+    newest_first = sorted(collections, key=lambda item: item[1].get(COLLECTION_CREATED_AT_KEY, 0.0), reverse=True)
+    spared = {keep} | (in_use or set())
+
+    retained = [name for name, _ in newest_first if name == keep]
+    for name, _ in newest_first:
+        if name in spared:
+            continue
+        if len(retained) < max_retained:
+            retained.append(name)
+            continue
+        await delete_collection_if_exists(client, name)
@@ -0,0 +1,76 @@
+from typing import Any
+
+from qdrant_client.http import models
+
+from qdrant_bench.domain.services.timeline import TIMELINE_RESOLUTION_S, QueryTimeline
+from qdrant_bench.infrastructure.ingestion.indexing import IndexingSample
+from qdrant_bench.infrastructure.workloads.writer import WriteOperation, WriterConfig
+
+
+def parse_writer_config(optimizer_config: dict[str, Any]) -> WriterConfig | None:
+    """Pure function - background write load from the `mixed_workload` section, None when absent"""
+    section = optimizer_config.get("mixed_workload")
+    if section is None:
+        return None
+    if section.get("write_rate") is None:
+        raise ValueError("mixed_workload needs a write_rate in operations per second")
+
+    defaults = WriterConfig(rate=section["write_rate"])
+
+    return WriterConfig(
+        rate=section["write_rate"],
+        batch_size=section.get("batch_size", defaults.batch_size),
+        mix={WriteOperation(name): weight for name, weight in section["mix"].items()}
+        if "mix" in section
+        else defaults.mix,
+        wait=section.get("wait", defaults.wait),
+        seed=section.get("seed"),
+        status_interval=section.get("status_interval_s", defaults.status_interval),
+    )
+
+
+def merge_mixed_timeline(
+    search: QueryTimeline,
+    writes: QueryTimeline,
+    samples: list[IndexingSample],
+    resolution: float = TIMELINE_RESOLUTION_S,
+) -> list[dict[str, Any]]:
+    """Pure function - search and write load per window, with the status last sampled before the window closed"""
+    # Both timelines share a start, so window i covers the same wall-clock second in each
+    search_windows = search.windows(resolution)
+    write_windows = writes.windows(resolution)
+    empty = {"completed": 0, "errors": 0, "p50_latency": None, "p99_latency": None}
+
+    merged = []
+    for index in range(max(len(search_windows), len(write_windows))):
+        searched = search_windows[index] if index < len(search_windows) else empty
+        written = write_windows[index] if index < len(write_windows) else empty
+        sample = next((s for s in reversed(samples) if s.elapsed < (index + 1) * resolution), None)
+
+        merged.append(
+            {
+                "second": round(index * resolution, 6),
+                **{key: searched[key] for key in empty},
+                **{f"write_{key}": written[key] for key in empty},
+                "status": sample.status if sample else None,
+                "optimizer_status": sample.optimizer_status if sample else None,
+                "segments": sample.segments if sample else None,
+                "points": sample.points if sample else None,
+            }
+        )
+
+    return merged
+
+
+def summarize_optimizer_samples(samples: list[IndexingSample]) -> dict[str, Any]:
+    """Pure function - how much of the run the collection spent optimizing, and its segment churn"""
+    if not samples:
+        return {}
+
+    optimizing = sum(sample.status == models.CollectionStatus.YELLOW.value for sample in samples)
+
+    return {
+        "optimizing_fraction": optimizing / len(samples),
+        "max_segments": max(sample.segments for sample in samples),
+        "optimizer_errors": sorted({s.optimizer_status for s in samples if s.optimizer_status.startswith("error")}),
+    }
@@ -8,6 +8,7 @@ from qdrant_bench.ports.repositories import ExperimentRepository, RunRepository
 @dataclass
 class TriggerRunCommand:
     experiment_id: UUID
+    priority: int = 0
 
 
 @dataclass
@@ -20,7 +21,7 @@ class TriggerRunUseCase:
         if not experiment:
             raise ValueError(f"Experiment with id {command.experiment_id} not found")
 
-        run = Run(experiment_id=command.experiment_id, status=RunStatus.CREATED)
+        run = Run(experiment_id=command.experiment_id, status=RunStatus.CREATED, priority=command.priority)
         return await self.run_repo.save(run)
 
 
@@ -0,0 +1,88 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from uuid import UUID
+
+import logfire
+
+ClaimFn = Callable[[], Awaitable[UUID | None]]
+ExecuteFn = Callable[[UUID], Awaitable[None]]
+RenewFn = Callable[[UUID], Awaitable[None]]
+
+# How long a RUNNING run keeps its lease without a heartbeat before it counts as lost
+RUN_LEASE_S = 60.0
+
+
+@dataclass
+class RunWorkerPool:
+    """
+    Pulls queued runs and executes them on a fixed number of concurrent slots.
+    Claiming is delegated to the caller so the queue stays durable in the database;
+    a slot that finds nothing to claim sleeps for poll_interval before asking again.
+    While a run executes its lease is renewed every lease_interval seconds.
+    """
+
+    claim_next: ClaimFn
+    execute_run: ExecuteFn
+    workers: int = 4
+    poll_interval: float = 1.0
+    renew_lease: RenewFn | None = None
+    lease_interval: float = RUN_LEASE_S / 3
+
+    async def run(self, drain: bool = False) -> None:
+        """Run all slots - forever, or until the queue is empty when draining"""
+        if self.workers < 1:
+            raise ValueError(f"workers must be at least 1, got {self.workers}")
+
+        async with asyncio.TaskGroup() as group:
+            for slot in range(self.workers):
+                group.create_task(self.work(slot, drain))
+
+    async def work(self, slot: int, drain: bool) -> None:
+        """Claim and execute runs one at a time on a single slot"""
+        while True:
+            try:
+                run_id = await self.claim_next()
+            except Exception as e:
+                logfire.error(f"Worker slot {slot} failed to claim a run: {e}")
+                run_id = None
+
+            if run_id is None:
+                if drain:
+                    return
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            with logfire.span("Worker Run", slot=slot, run_id=run_id):
+                lease = (
+                    hold_lease(self.renew_lease, run_id, self.lease_interval)
+                    if self.renew_lease
+                    else contextlib.nullcontext()
+                )
+                try:
+                    async with lease:
+                        await self.execute_run(run_id)
+                except Exception as e:
+                    logfire.error(f"Worker slot {slot} failed to execute run {run_id}: {e}")
+
+
+@contextlib.asynccontextmanager
+async def hold_lease(renew_lease: RenewFn, run_id: UUID, interval: float) -> AsyncIterator[None]:
+    """Renew a run's lease every `interval` seconds until the body exits"""
+
+    async def heartbeat() -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await renew_lease(run_id)
+            except Exception as e:
+                logfire.warn(f"Failed to renew the lease of run {run_id}: {e}")
+
+    task = asyncio.create_task(heartbeat())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
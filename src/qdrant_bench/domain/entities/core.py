@@ -13,11 +13,24 @@ class RunStatus(str, Enum):
     CANCELED = "CANCELED"
 
 
+class ConcurrencyPolicy(str, Enum):
+    EXCLUSIVE = "exclusive"
+    SHARED = "shared"
+
+
+class CollectionRetention(str, Enum):
+    KEEP = "keep"
+    DELETE = "delete"
+    KEEP_ON_FAILURE = "keep_on_failure"
+
+
 @dataclass
 class Connection:
     name: str
     url: str
     api_key: str
+    concurrency_policy: ConcurrencyPolicy = ConcurrencyPolicy.SHARED
+    max_concurrent_runs: int | None = None
     id: UUID = field(default_factory=uuid4)
 
 
@@ -56,4 +69,6 @@ class Run:
     start_time: datetime = field(default_factory=lambda: datetime.now(UTC))
     end_time: datetime | None = None
     metrics: dict[str, Any] = field(default_factory=dict)
+    priority: int = 0
+    heartbeat_at: datetime | None = None
     id: UUID = field(default_factory=uuid4)
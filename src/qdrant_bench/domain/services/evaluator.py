@@ -1,56 +1,151 @@
+from collections.abc import Collection, Sequence
+from itertools import chain, repeat
+from operator import attrgetter
 from typing import Any
 
 import numpy as np
 
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.domain.services.timeline import QueryTimeline
 from qdrant_bench.ports.evaluator import EvaluationResult, Evaluator, GroundTruth
 
+RECALL_CUTOFFS = (1, 10)
 
-class StandardEvaluator(Evaluator):
-    def evaluate(self, predictions: list[Any], ground_truth: GroundTruth, latencies: list[float]) -> EvaluationResult:
-        # predictions: List of Qdrant Search Responses (ScoredPoint)
-
-        recall_scores = []
-        precision_scores = []
-
-        for i, prediction in enumerate(predictions):
-            # Prediction is a list of ScoredPoint
-            retrieved_ids = {point.id for point in prediction}
-            relevant_ids = ground_truth.relevant_items.get(i, set())
-
-            if not relevant_ids:
-                continue
 
-            # Calculate Intersection
-            intersection = retrieved_ids.intersection(relevant_ids)
-
-            # Recall = (Relevant & Retrieved) / Relevant
-            recall = len(intersection) / len(relevant_ids)
-            recall_scores.append(recall)
+class StandardEvaluator(Evaluator):
+    def evaluate(
+        self,
+        predictions: list[Any],
+        ground_truth: GroundTruth,
+        latencies: LatencyHistogram,
+        timeline: QueryTimeline | None = None,
+    ) -> EvaluationResult:
+        # predictions: List of Qdrant Search Responses (ScoredPoint); None for queries an aborted workload skipped
+        answered = [prediction or () for prediction in predictions]
+        relevant = list(map(ground_truth.relevant_items.get, range(len(predictions)), repeat(())))
 
-            # Precision = (Relevant & Retrieved) / Retrieved
-            precision = len(intersection) / len(retrieved_ids) if retrieved_ids else 0.0
-            precision_scores.append(precision)
+        retrieved, retrieved_mask = id_matrix(list(map(attrgetter("id"), chain.from_iterable(answered))), answered)
+        judged, judged_mask = id_matrix(list(chain.from_iterable(relevant)), relevant)
 
-        avg_recall = np.mean(recall_scores) if recall_scores else 0.0
-        avg_precision = np.mean(precision_scores) if precision_scores else 0.0
-        f1 = (
-            2 * (avg_precision * avg_recall) / (avg_precision + avg_recall) if (avg_precision + avg_recall) > 0 else 0.0
+        # Queries without a prediction or without judgments are not scored
+        answered_mask = np.fromiter(
+            (prediction is not None for prediction in predictions), dtype=bool, count=len(predictions)
         )
+        scored = answered_mask & judged_mask.any(axis=1)
+
+        hits = hit_matrix(retrieved, retrieved_mask, judged, judged_mask)[scored]
+        retrieved_counts = retrieved_mask.sum(axis=1)[scored]
+        relevant_counts = judged_mask.sum(axis=1)[scored]
 
         # Latency Metrics
-        p50 = np.percentile(latencies, 50)
-        p95 = np.percentile(latencies, 95)
-        p99 = np.percentile(latencies, 99)
-        qps = len(latencies) / sum(latencies) if latencies else 0.0
+        p50 = latencies.percentile(50)
+        p95 = latencies.percentile(95)
+        p99 = latencies.percentile(99)
+        # Throughput is completions per second of wall clock; inverse mean latency ignores concurrency and idle time
+        qps = timeline.achieved_qps if timeline else 0.0
 
         return EvaluationResult(
             scores={
-                "recall": float(avg_recall),
-                "precision": float(avg_precision),
-                "f1": float(f1),
+                **retrieval_scores(hits, retrieved_counts, relevant_counts),
                 "p50_latency": float(p50),
                 "p95_latency": float(p95),
                 "p99_latency": float(p99),
                 "qps": float(qps),
             }
         )
+
+
+def id_matrix(flat_ids: list[Any], rows: Sequence[Collection[Any]]) -> tuple[np.ndarray, np.ndarray]:
+    """Pure function - ragged rows, given flattened, as a padded (rows x width) id matrix and its validity mask"""
+    lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    mask = np.arange(lengths.max(initial=0)) < lengths[:, None]
+
+    values = np.asarray(flat_ids)
+    ids = np.zeros(mask.shape, dtype=values.dtype)
+    ids[mask] = values
+
+    return ids, mask
+
+
+def hit_matrix(
+    predicted: np.ndarray, predicted_mask: np.ndarray, judged: np.ndarray, judged_mask: np.ndarray
+) -> np.ndarray:
+    """
+    Pure function - (queries x k) boolean matrix, true where the retrieved id at that rank is relevant.
+    Ids become integer codes offset by query row, so one sorted lookup over the flattened
+    matrices matches every query against its own ground truth at once.
+    """
+    codes, vocabulary = id_codes(predicted[predicted_mask], judged[judged_mask])
+    predicted_count = int(predicted_mask.sum())
+
+    predicted_keys = np.nonzero(predicted_mask)[0] * vocabulary + codes[:predicted_count]
+    judged_keys = np.sort(np.nonzero(judged_mask)[0] * vocabulary + codes[predicted_count:])
+
+    hits = np.zeros(predicted.shape, dtype=bool)
+    if judged_keys.size:
+        positions = np.minimum(np.searchsorted(judged_keys, predicted_keys), judged_keys.size - 1)
+        hits[predicted_mask] = judged_keys[positions] == predicted_keys
+
+    return hits
+
+
+def id_codes(predicted_ids: np.ndarray, judged_ids: np.ndarray) -> tuple[np.ndarray, int]:
+    """
+    Pure function - non-negative int64 codes for both id arrays, concatenated, and the code range.
+    Integer ids are shifted to start at zero when row offsets stay within int64;
+    UUID strings, mixed ids and very sparse integers are factorized instead.
+    """
+    ids = np.concatenate([predicted_ids, judged_ids])
+    if not ids.size:
+        return ids.astype(np.int64), 1
+
+    if predicted_ids.dtype.kind in "iu" and judged_ids.dtype.kind in "iu":
+        low, high = int(ids.min()), int(ids.max())
+        if (high - low + 1) * (len(ids) + 1) < 2**62:
+            return (ids - low).astype(np.int64), high - low + 1
+    else:
+        # Ground truth may hold integer ids where the client returned them as text
+        ids = ids.astype(str)
+
+    _, codes = np.unique(ids, return_inverse=True)
+
+    return codes.astype(np.int64), int(codes.max()) + 1
+
+
+def retrieval_scores(hits: np.ndarray, retrieved_counts: np.ndarray, relevant_counts: np.ndarray) -> dict[str, float]:
+    """
+    Pure function - retrieval quality averaged over scored queries.
+    recall is over the full result list; recall@c caps the denominator at c so a query with
+    more judgments than c can still reach 1.0. nDCG uses binary relevance and MRR the first hit;
+    mean_overlap is the average number of ids a result list shares with its ground truth.
+    """
+    queries, k = hits.shape
+    if not queries or not k:
+        return {"recall": 0.0, "precision": 0.0, "f1": 0.0}
+
+    overlap = hits.sum(axis=1)
+    recall = float(np.mean(overlap / relevant_counts))
+    precision = float(np.mean(np.divide(overlap, retrieved_counts, out=np.zeros(queries), where=retrieved_counts > 0)))
+    f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
+
+    recall_at = {
+        f"recall@{cutoff}": float(np.mean(hits[:, :cutoff].sum(axis=1) / np.minimum(relevant_counts, cutoff)))
+        for cutoff in sorted({*(c for c in RECALL_CUTOFFS if c < k), k})
+    }
+
+    discounts = 1.0 / np.log2(np.arange(k) + 2)
+    dcg = hits @ discounts
+    ideal = np.cumsum(discounts)[np.minimum(relevant_counts, k) - 1]
+
+    first_hit = np.argmax(hits, axis=1)
+    reciprocal_rank = np.where(hits.any(axis=1), 1.0 / (first_hit + 1), 0.0)
+
+    return {
+        "recall": recall,
+        "precision": precision,
+        "f1": float(f1),
+        **recall_at,
+        "ndcg": float(np.mean(dcg / ideal)),
+        "mrr": float(np.mean(reciprocal_rank)),
+        "mean_overlap": float(np.mean(overlap)),
+    }
@@ -0,0 +1,118 @@
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class PayloadFilter:
+    """
+    A condition on one payload field chosen to match a target share of the corpus.
+    Numeric fields get an upper bound at the target quantile, other fields a set of values
+    whose combined frequency comes closest to the target without exceeding it. Ties and
+    coarse value counts mean the achieved selectivity can differ from the target; it is
+    measured exactly over the corpus and reported alongside.
+    """
+
+    field: str
+    target: float
+    selectivity: float
+    upper: float | None = None
+    any_of: list[Any] | None = None
+
+    def matches(self, values: np.ndarray) -> np.ndarray:
+        """Boolean mask of the corpus values this filter keeps"""
+        if self.upper is not None:
+            return numeric_values(values) <= self.upper
+
+        return np.isin(values, np.asarray(self.any_of, dtype=values.dtype))
+
+    def describe(self) -> dict[str, Any]:
+        """JSON-safe form of the condition"""
+        if self.upper is not None:
+            return {"field": self.field, "range": {"lte": self.upper}}
+
+        return {"field": self.field, "any": self.any_of}
+
+
+def derive_filters(field: str, values: np.ndarray, targets: Sequence[float]) -> list[PayloadFilter]:
+    """Pure function - one filter per target selectivity over a field's values, in corpus order"""
+    invalid = [target for target in targets if not 0 < target <= 1]
+    if invalid:
+        raise ValueError(f"Selectivities must be in (0, 1], got {invalid}")
+    if not np.any(present_mask(values)):
+        raise ValueError(f"Payload field '{field}' has no values")
+
+    derive = derive_range_filter if is_numeric(values) else derive_match_filter
+    filters = [derive(field, values, target) for target in targets]
+
+    return [
+        replace(payload_filter, selectivity=float(payload_filter.matches(values).mean())) for payload_filter in filters
+    ]
+
+
+def derive_range_filter(field: str, values: np.ndarray, target: float) -> PayloadFilter:
+    """Pure function - `field <= upper` with upper at the target quantile of the corpus"""
+    present = np.sort(numeric_values(values)[present_mask(values)])
+    rank = min(max(math.ceil(target * len(values)), 1), len(present))
+
+    return PayloadFilter(field=field, target=target, selectivity=0.0, upper=float(present[rank - 1]))
+
+
+def derive_match_filter(field: str, values: np.ndarray, target: float) -> PayloadFilter:
+    """
+    Pure function - values taken most frequent first while they fit the target share;
+    when even the rarest value is too common, that value alone
+    """
+    present = values[present_mask(values)]
+    distinct, counts = np.unique(present, return_counts=True)
+    budget = target * len(values)
+
+    chosen, total = [], 0
+    for index in np.argsort(-counts, kind="stable"):
+        if total + counts[index] <= budget:
+            chosen.append(python_value(distinct[index]))
+            total += counts[index]
+
+    if not chosen:
+        chosen = [python_value(distinct[np.argmin(counts)])]
+
+    return PayloadFilter(field=field, target=target, selectivity=0.0, any_of=chosen)
+
+
+def pick_filter_field(columns: dict[str, np.ndarray]) -> str:
+    """
+    Pure function - the payload field best suited to hitting arbitrary selectivities:
+    a numeric field if there is one, otherwise the field with the most distinct values
+    """
+    if not columns:
+        raise ValueError("Corpus has no payload fields to filter on")
+
+    numeric = [name for name, values in columns.items() if is_numeric(values)]
+    if numeric:
+        return numeric[0]
+
+    return max(columns, key=lambda name: len(set(columns[name].tolist())))
+
+
+def present_mask(values: np.ndarray) -> np.ndarray:
+    """Pure function - points that carry the field: not null, and not NaN for numeric fields"""
+    if is_numeric(values):
+        return ~np.isnan(numeric_values(values))
+
+    return np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+
+
+def is_numeric(values: np.ndarray) -> bool:
+    return np.issubdtype(values.dtype, np.number) and not np.issubdtype(values.dtype, np.bool_)
+
+
+def numeric_values(values: np.ndarray) -> np.ndarray:
+    return values.astype(np.float64)
+
+
+def python_value(value: Any) -> Any:
+    """Plain Python value for a numpy scalar; object arrays already hold plain values"""
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,125 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# Distance names as accepted by parse_vector_config (qdrant_client models.Distance members)
+DISTANCES = ("COSINE", "DOT", "EUCLID", "MANHATTAN")
+
+
+@dataclass
+class ExactNeighbors:
+    """
+    Exact top-k neighbors of a query set over a corpus streamed in blocks.
+    Each block is scored against tiles of queries sized so one tile's score matrix stays
+    within memory_limit_bytes per worker, and tiles run on a thread pool - NumPy releases
+    the GIL inside matrix products and reductions, so tiles use separate cores.
+    The running top-k is merged with every block, so the corpus never has to fit in memory.
+    Scores are ranking keys where higher is closer; distances are negated.
+    """
+
+    queries: np.ndarray
+    k: int
+    distance: str = "COSINE"
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    memory_limit_bytes: int = 256 * 1024**2
+    ids: np.ndarray = field(init=False)
+    scores: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.distance not in DISTANCES:
+            raise ValueError(f"Unsupported distance {self.distance}, expected one of {', '.join(DISTANCES)}")
+        if self.k < 1:
+            raise ValueError(f"k must be at least 1, got {self.k}")
+        if self.workers < 1:
+            raise ValueError(f"workers must be at least 1, got {self.workers}")
+
+        self.queries = prepare_vectors(self.queries, self.distance)
+        self.ids = np.empty((len(self.queries), 0), dtype=np.int64)
+        self.scores = np.empty((len(self.queries), 0), dtype=np.float32)
+
+    def add(self, first_id: int, block: np.ndarray) -> None:
+        """Merge a corpus block whose rows have consecutive ids starting at first_id"""
+        if not len(block) or not len(self.queries):
+            return
+
+        block = prepare_vectors(block, self.distance)
+        if block.shape[1] != self.queries.shape[1]:
+            raise ValueError(
+                f"Corpus dimension {block.shape[1]} does not match query dimension {self.queries.shape[1]}"
+            )
+
+        block_ids = np.arange(first_id, first_id + len(block), dtype=np.int64)
+        width = min(self.k, self.ids.shape[1] + len(block))
+        ids = np.empty((len(self.queries), width), dtype=np.int64)
+        scores = np.empty((len(self.queries), width), dtype=np.float32)
+
+        def merge(rows: slice) -> None:
+            candidates = np.hstack([self.scores[rows], score_tile(self.queries[rows], block, self.distance)])
+            candidate_ids = np.hstack([self.ids[rows], np.broadcast_to(block_ids, (candidates.shape[0], len(block)))])
+            ids[rows], scores[rows] = select_top_k(candidates, candidate_ids, width)
+
+        rows_per_tile = tile_rows(len(block), block.shape[1], self.distance, self.memory_limit_bytes // self.workers)
+        tiles = [slice(start, start + rows_per_tile) for start in range(0, len(self.queries), rows_per_tile)]
+
+        if self.workers == 1 or len(tiles) == 1:
+            for rows in tiles:
+                merge(rows)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(merge, tiles))
+
+        self.ids, self.scores = ids, scores
+
+
+def prepare_vectors(vectors: np.ndarray, distance: str) -> np.ndarray:
+    """Pure function - float32 matrix, rows unit-normalized for cosine"""
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a (rows x dim) matrix, got shape {matrix.shape}")
+
+    if distance != "COSINE":
+        return matrix
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def score_tile(queries: np.ndarray, block: np.ndarray, distance: str) -> np.ndarray:
+    """Pure function - (queries x block) ranking keys, higher is closer"""
+    if distance in ("COSINE", "DOT"):
+        return queries @ block.T
+
+    if distance == "EUCLID":
+        # |q - c|^2 = |q|^2 - 2 q.c + |c|^2, expanded so the bulk of the work is one matrix product
+        squared = (
+            np.einsum("ij,ij->i", queries, queries)[:, None]
+            - 2 * (queries @ block.T)
+            + np.einsum("ij,ij->i", block, block)[None, :]
+        )
+        return -np.sqrt(np.maximum(squared, 0.0))
+
+    differences = queries[:, None, :] - block[None, :, :]
+    return -np.abs(differences, out=differences).sum(axis=2)
+
+
+def select_top_k(scores: np.ndarray, ids: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Pure function - per row, the k highest scores with their ids, best first and ties by lower id"""
+    if scores.shape[1] > k:
+        partition = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, partition, axis=1)
+        ids = np.take_along_axis(ids, partition, axis=1)
+
+    order = np.lexsort((ids, -scores), axis=1)
+
+    return np.take_along_axis(ids, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+def tile_rows(block_rows: int, dim: int, distance: str, memory_limit_bytes: int) -> int:
+    """Pure function - query rows per tile so one tile's intermediates fit in the memory limit"""
+    # Score matrix, its merged copy and one temporary; Manhattan also holds a (rows x block x dim) difference tensor
+    floats_per_pair = 3 + (dim if distance == "MANHATTAN" else 0)
+    bytes_per_query = block_rows * 4 * floats_per_pair
+
+    return max(1, memory_limit_bytes // max(bytes_per_query, 1))
@@ -0,0 +1,129 @@
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(eq=False)
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram in the spirit of HdrHistogram. Bucket i covers
+    (lowest * growth^(i-1), lowest * growth^i] with growth = 1 + precision, so every recorded
+    value is known to within precision relative error, memory is fixed by the covered range,
+    and recording is one logarithm. Histograms with the same layout merge losslessly by adding
+    counts; count, sum, min and max are tracked exactly alongside the buckets.
+    """
+
+    lowest: float = 1e-6
+    highest: float = 3600.0
+    precision: float = 0.01
+    counts: np.ndarray = field(init=False, repr=False)
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = 0.0
+    log_growth: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.lowest < self.highest:
+            raise ValueError(f"Histogram range must satisfy 0 < lowest < highest, got {self.lowest}..{self.highest}")
+        if self.precision <= 0:
+            raise ValueError(f"precision must be positive, got {self.precision}")
+
+        self.log_growth = math.log1p(self.precision)
+        self.counts = np.zeros(math.ceil(math.log(self.highest / self.lowest) / self.log_growth) + 1, dtype=np.int64)
+
+    @classmethod
+    def of(cls, values: Iterable[float], **layout: Any) -> "LatencyHistogram":
+        """Histogram of a batch of latencies in seconds"""
+        histogram = cls(**layout)
+        histogram.record_many(values)
+        return histogram
+
+    def bucket(self, value: float) -> int:
+        if value <= self.lowest:
+            return 0
+        return min(math.ceil(math.log(value / self.lowest) / self.log_growth), len(self.counts) - 1)
+
+    def record(self, value: float) -> None:
+        """Record one latency in seconds"""
+        self.counts[self.bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def record_many(self, values: Iterable[float]) -> None:
+        """Record a batch of latencies in one vectorized pass"""
+        samples = np.fromiter(values, dtype=np.float64)
+        if not samples.size:
+            return
+
+        scaled = np.log(np.maximum(samples, self.lowest) / self.lowest) / self.log_growth
+        buckets = np.minimum(np.ceil(scaled).astype(np.int64), len(self.counts) - 1)
+
+        self.counts += np.bincount(buckets, minlength=len(self.counts))
+        self.count += int(samples.size)
+        self.total += float(samples.sum())
+        self.minimum = min(self.minimum, float(samples.min()))
+        self.maximum = max(self.maximum, float(samples.max()))
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """A new histogram holding the samples of both; layouts must match"""
+        if (self.lowest, self.highest, self.precision) != (other.lowest, other.highest, other.precision):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+
+        merged = LatencyHistogram(lowest=self.lowest, highest=self.highest, precision=self.precision)
+        merged.counts = self.counts + other.counts
+        merged.count = self.count + other.count
+        merged.total = self.total + other.total
+        merged.minimum = min(self.minimum, other.minimum)
+        merged.maximum = max(self.maximum, other.maximum)
+
+        return merged
+
+    def percentile(self, percentile: float) -> float:
+        """Nearest-rank percentile, reported at its bucket's geometric midpoint and clamped to min/max"""
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        value = self.lowest * math.exp((index - 0.5) * self.log_growth) if index else self.lowest
+
+        return min(max(value, self.minimum), self.maximum)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-safe form with only the non-empty buckets"""
+        occupied = np.flatnonzero(self.counts)
+
+        return {
+            "lowest": self.lowest,
+            "highest": self.highest,
+            "precision": self.precision,
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum if self.count else None,
+            "max": self.maximum if self.count else None,
+            "buckets": {str(index): int(self.counts[index]) for index in occupied},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram persisted with to_dict"""
+        histogram = cls(lowest=data["lowest"], highest=data["highest"], precision=data["precision"])
+        for index, bucket_count in data["buckets"].items():
+            histogram.counts[int(index)] = bucket_count
+
+        histogram.count = data["count"]
+        histogram.total = data["sum"]
+        histogram.minimum = data["min"] if data["min"] is not None else math.inf
+        histogram.maximum = data["max"] if data["max"] is not None else 0.0
+
+        return histogram
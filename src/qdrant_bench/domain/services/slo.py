@@ -0,0 +1,101 @@
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+DEADLINE_BREACH = "workload time budget exceeded"
+
+
+@dataclass
+class SloGuard:
+    """
+    Tracks completed queries and trips as soon as the workload can no longer meet its
+    SLOs, or its time budget runs out. SLO breaches are only declared once they are
+    certain: p99 latency once too many queries were slow for any remaining ones to pull
+    the percentile back, recall once even perfect remaining queries could not lift the mean.
+    """
+
+    max_p99_latency: float | None = None
+    min_recall: float | None = None
+    deadline: float | None = None
+    relevant_items: dict[int, set[Any]] = field(default_factory=dict)
+    total_queries: int = 0
+    completed: int = 0
+    slow_queries: int = 0
+    graded_queries: int = 0
+    gradable_queries: int = 0
+    recall_sum: float = 0.0
+    breach: str | None = None
+
+    def begin(self, total_queries: int) -> None:
+        """Reset counters for a workload of total_queries"""
+        self.total_queries = total_queries
+        self.completed = 0
+        self.slow_queries = 0
+        self.graded_queries = 0
+        self.gradable_queries = sum(1 for index in self.relevant_items if index < total_queries)
+        self.recall_sum = 0.0
+        self.breach = self.check_deadline()
+
+    def observe(self, index: int, prediction: list[Any], latency: float) -> None:
+        """Record one completed query and re-evaluate the guards"""
+        self.completed += 1
+
+        if self.max_p99_latency is not None and latency > self.max_p99_latency:
+            self.slow_queries += 1
+
+        relevant = self.relevant_items.get(index)
+        if relevant:
+            retrieved = {point.id for point in prediction}
+            self.recall_sum += len(retrieved & relevant) / len(relevant)
+            self.graded_queries += 1
+
+        self.breach = self.breach or self.check_deadline() or self.check_latency() or self.check_recall()
+
+    @property
+    def enforces_slo(self) -> bool:
+        """Whether the guard checks latency or recall, beyond the deadline"""
+        return self.max_p99_latency is not None or self.min_recall is not None
+
+    @property
+    def tripped(self) -> bool:
+        return self.breach is not None
+
+    @property
+    def out_of_time(self) -> bool:
+        return self.breach == DEADLINE_BREACH
+
+    def check_deadline(self) -> str | None:
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            return DEADLINE_BREACH
+        return None
+
+    def check_latency(self) -> str | None:
+        if self.max_p99_latency is None or not self.total_queries:
+            return None
+
+        # LatencyHistogram reports the nearest-rank p99, the ceil(0.99 * n)-th smallest latency;
+        # once every latency from that rank up is slow, it is slow too
+        slow_needed = self.total_queries - math.ceil(0.99 * self.total_queries) + 1
+        if self.slow_queries >= slow_needed:
+            return f"p99 latency above {self.max_p99_latency}s"
+        return None
+
+    def check_recall(self) -> str | None:
+        if self.min_recall is None:
+            return None
+
+        if not self.gradable_queries:
+            return None
+
+        best_case = (self.recall_sum + self.gradable_queries - self.graded_queries) / self.gradable_queries
+        if best_case < self.min_recall:
+            return f"recall below {self.min_recall}"
+        return None
+
+    def summary(self) -> dict[str, Any]:
+        """Metrics describing how far the guarded workload got"""
+        if not self.tripped:
+            return {}
+
+        return {"aborted_reason": self.breach, "completed_queries": self.completed}
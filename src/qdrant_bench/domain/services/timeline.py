@@ -0,0 +1,178 @@
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+
+TIMELINE_RESOLUTION_S = 1.0
+WINDOW_LATENCY_PRECISION = 0.02
+
+
+def create_window_histogram() -> LatencyHistogram:
+    """Coarser than the run-wide histogram, so a window costs a few kilobytes however many queries land in it"""
+    return LatencyHistogram(lowest=1e-5, highest=100.0, precision=WINDOW_LATENCY_PRECISION)
+
+
+@dataclass(eq=False)
+class TimelineWindow:
+    """Successful and failed completions in one window, with the latencies of the successful ones"""
+
+    completed: int = 0
+    errors: int = 0
+    latencies: LatencyHistogram = field(default_factory=create_window_histogram)
+
+    def merge(self, other: "TimelineWindow") -> "TimelineWindow":
+        """A new window holding the completions of both"""
+        return TimelineWindow(
+            completed=self.completed + other.completed,
+            errors=self.errors + other.errors,
+            latencies=self.latencies.merge(other.latencies),
+        )
+
+
+@dataclass(eq=False)
+class QueryTimeline:
+    """
+    Completions, errors and latency of a workload, aggregated into fixed wall-clock windows as
+    queries are recorded; no per-query samples are kept. Failed queries carry a NaN latency:
+    they count as errors in their window without touching its percentiles. Windows sit on a
+    fixed grid of the monotonic clock, so timelines of workers on the same host merge exactly
+    and timelines sharing a start line up window for window.
+    """
+
+    start: float
+    resolution: float = TIMELINE_RESOLUTION_S
+    buckets: dict[int, TimelineWindow] = field(default_factory=dict)
+    completed: int = 0
+    errors: int = 0
+    last_completed_at: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.resolution <= 0:
+            raise ValueError(f"resolution must be positive, got {self.resolution}")
+
+    @classmethod
+    def of(
+        cls,
+        start: float,
+        completed_at: Sequence[float],
+        latencies: Sequence[float],
+        resolution: float = TIMELINE_RESOLUTION_S,
+    ) -> "QueryTimeline":
+        """Timeline of queries completed since start; a NaN latency marks a failed query"""
+        timeline = cls(start=start, resolution=resolution)
+        timeline.record_many(completed_at, latencies)
+        return timeline
+
+    def record(self, completed_at: float, latency: float) -> None:
+        """Add one completion to its window; a NaN latency marks a failed query"""
+        window = self.buckets.setdefault(math.floor(completed_at / self.resolution), TimelineWindow())
+        if math.isnan(latency):
+            window.errors += 1
+            self.errors += 1
+        else:
+            window.completed += 1
+            window.latencies.record(latency)
+            self.completed += 1
+
+        self.extend_to(completed_at)
+
+    def record_many(self, completed_at: Sequence[float], latencies: Sequence[float]) -> None:
+        """Add a batch of completions in one vectorized pass per window"""
+        if len(completed_at) != len(latencies):
+            raise ValueError(f"Got {len(completed_at)} completion times for {len(latencies)} latencies")
+        if not len(completed_at):
+            return
+
+        times = np.asarray(completed_at, dtype=np.float64)
+        values = np.asarray(latencies, dtype=np.float64)
+        window_ids = np.floor(times / self.resolution).astype(np.int64)
+
+        # Sorting by window makes every window a contiguous slice
+        order = np.argsort(window_ids, kind="stable")
+        ids, firsts = np.unique(window_ids[order], return_index=True)
+        for window_id, group in zip(ids.tolist(), np.split(order, firsts[1:]), strict=True):
+            window = self.buckets.setdefault(window_id, TimelineWindow())
+            failed = np.isnan(values[group])
+            window.errors += int(failed.sum())
+            window.completed += int(failed.size - failed.sum())
+            window.latencies.record_many(values[group][~failed])
+
+        failed_count = int(np.isnan(values).sum())
+        self.errors += failed_count
+        self.completed += int(values.size) - failed_count
+        self.extend_to(float(times.max()))
+
+    def extend_to(self, completed_at: float) -> None:
+        if self.last_completed_at is None or completed_at > self.last_completed_at:
+            self.last_completed_at = completed_at
+
+    @property
+    def duration(self) -> float:
+        """Wall-clock time from the start of the workload to its last completion"""
+        return self.last_completed_at - self.start if self.last_completed_at is not None else 0.0
+
+    @property
+    def achieved_qps(self) -> float:
+        """Successful queries per second of wall clock"""
+        return self.completed / self.duration if self.duration > 0 else 0.0
+
+    def merge(self, other: "QueryTimeline") -> "QueryTimeline":
+        """A new timeline holding the queries of both, starting at the earlier start"""
+        if self.resolution != other.resolution:
+            raise ValueError(f"Cannot merge timelines with resolutions {self.resolution} and {other.resolution}")
+
+        # Windows are copied, never shared, so recording into the merged timeline leaves both inputs alone
+        buckets: dict[int, TimelineWindow] = {}
+        for window_id, window in [*self.buckets.items(), *other.buckets.items()]:
+            buckets[window_id] = buckets.get(window_id, TimelineWindow()).merge(window)
+
+        ends = [end for end in (self.last_completed_at, other.last_completed_at) if end is not None]
+
+        return QueryTimeline(
+            start=min(self.start, other.start),
+            resolution=self.resolution,
+            buckets=buckets,
+            completed=self.completed + other.completed,
+            errors=self.errors + other.errors,
+            last_completed_at=max(ends, default=None),
+        )
+
+    def windows(self, resolution: float | None = None) -> list[dict[str, Any]]:
+        """
+        One entry per window from the start to the last completion, empty windows included so
+        stalls show up as gaps; completions before the start count towards the first window.
+        Windows can be coarsened to a whole multiple of the recorded resolution. Percentiles are
+        nearest-rank values within the window histogram's precision, None where nothing succeeded.
+        """
+        resolution = resolution or self.resolution
+        factor = round(resolution / self.resolution)
+        if factor < 1 or not math.isclose(factor * self.resolution, resolution):
+            raise ValueError(f"resolution must be a whole multiple of {self.resolution}, got {resolution}")
+        if not self.buckets:
+            return []
+
+        first = math.floor(self.start / self.resolution) // factor
+        coarse: dict[int, TimelineWindow] = {}
+        for window_id, window in self.buckets.items():
+            key = max(window_id // factor, first)
+            coarse[key] = coarse[key].merge(window) if key in coarse else window
+
+        return [
+            summarize_window(round((key - first) * resolution, 6), coarse.get(key, TimelineWindow()))
+            for key in range(first, max(coarse) + 1)
+        ]
+
+
+def summarize_window(second: float, window: TimelineWindow) -> dict[str, Any]:
+    """Pure function - one timeline entry"""
+    return {
+        "second": second,
+        "completed": window.completed,
+        "errors": window.errors,
+        "p50_latency": window.latencies.percentile(50) if window.completed else None,
+        "p99_latency": window.latencies.percentile(99) if window.completed else None,
+    }
@@ -0,0 +1,69 @@
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+
+AUTO_WARMUP_MAX_QUERIES = 10_000
+AUTO_WARMUP_MAX_DURATION_S = 120.0
+
+
+@dataclass
+class WarmupPlan:
+    """
+    How long to warm a collection up before measuring: a query count, a duration, or both,
+    whichever is reached first. In auto mode warmup ends as soon as latency is steady, with
+    the count and duration acting as caps for a collection that never settles.
+    """
+
+    queries: int | None = None
+    duration: float | None = None
+    auto: bool = False
+    window: int = 50
+    tolerance: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.queries is None and self.duration is None and not self.auto:
+            raise ValueError("warmup needs a query count, a duration or auto mode")
+        if self.queries is not None and self.queries < 1:
+            raise ValueError(f"warmup queries must be at least 1, got {self.queries}")
+        if self.duration is not None and self.duration <= 0:
+            raise ValueError(f"warmup duration must be positive, got {self.duration}")
+
+    @property
+    def query_limit(self) -> int | None:
+        return self.queries or (AUTO_WARMUP_MAX_QUERIES if self.auto else None)
+
+    @property
+    def duration_limit(self) -> float | None:
+        return self.duration or (AUTO_WARMUP_MAX_DURATION_S if self.auto else None)
+
+
+@dataclass
+class SteadyStateDetector:
+    """
+    Declares latency steady once the median of the latest window of queries is within
+    tolerance of the median of the window before it. Cold page cache, unloaded mmap segments
+    and fresh connections show up as a falling median; once it stops moving, the collection
+    serves queries the way it will for the rest of the run.
+    """
+
+    window: int = 50
+    tolerance: float = 0.1
+    recent: deque[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.window < 1:
+            raise ValueError(f"window must be at least 1, got {self.window}")
+
+        self.recent = deque(maxlen=2 * self.window)
+
+    def observe(self, latency: float) -> bool:
+        """Record one latency; True once the last two windows agree"""
+        self.recent.append(latency)
+        if len(self.recent) < 2 * self.window:
+            return False
+
+        previous = statistics.median(islice(self.recent, 0, self.window))
+        current = statistics.median(islice(self.recent, self.window, None))
+
+        return abs(current - previous) <= self.tolerance * previous
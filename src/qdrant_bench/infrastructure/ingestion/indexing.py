@@ -0,0 +1,118 @@
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import logfire
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+
+@dataclass
+class IndexingSample:
+    elapsed: float
+    indexed_vectors: int
+    points: int
+    segments: int
+    status: str
+    optimizer_status: str
+    vectors_per_sec: float
+
+
+@dataclass
+class IndexingMonitor:
+    """
+    Samples a collection's indexing progress until it turns GREEN. The poll interval
+    shrinks towards min_interval while indexed_vectors_count is moving and backs off
+    towards max_interval while it stalls, so short builds are resolved finely and long
+    ones are not hammered. Samples accumulate on the monitor, so a caller that cuts the
+    wait short still has the timeline up to that point.
+    """
+
+    min_interval: float = 0.05
+    max_interval: float = 2.0
+    samples: list[IndexingSample] = field(default_factory=list)
+
+    async def run(self, client: AsyncQdrantClient, collection_name: str) -> None:
+        start = time.perf_counter()
+        interval = self.min_interval
+
+        while True:
+            info = await client.get_collection(collection_name)
+            sample = self.record(time.perf_counter() - start, info)
+
+            if info.status == models.CollectionStatus.GREEN:
+                logfire.info("Collection indexed", collection=collection_name, seconds=sample.elapsed)
+                return
+
+            progressed = len(self.samples) > 1 and sample.indexed_vectors != self.samples[-2].indexed_vectors
+            interval = max(interval / 2, self.min_interval) if progressed else min(interval * 2, self.max_interval)
+
+            await asyncio.sleep(interval)
+
+    async def watch(
+        self, client: AsyncQdrantClient, collection_name: str, stop: asyncio.Event, start: float, interval: float
+    ) -> None:
+        """
+        Sample the collection every `interval` seconds until `stop` is set, whatever its status -
+        a collection under writes keeps going back to optimizing. Sample times count from `start`.
+        """
+        while not stop.is_set():
+            self.record(time.perf_counter() - start, await client.get_collection(collection_name))
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+
+    def record(self, elapsed: float, info: models.CollectionInfo) -> IndexingSample:
+        """Append a sample with the indexing throughput since the previous one"""
+        indexed = info.indexed_vectors_count or 0
+        previous = self.samples[-1] if self.samples else None
+        window = elapsed - previous.elapsed if previous else 0.0
+
+        sample = IndexingSample(
+            elapsed=elapsed,
+            indexed_vectors=indexed,
+            points=info.points_count or 0,
+            segments=info.segments_count,
+            status=info.status.value,
+            optimizer_status=describe_optimizer_status(info.optimizer_status),
+            vectors_per_sec=(indexed - previous.indexed_vectors) / window if previous and window > 0 else 0.0,
+        )
+        self.samples.append(sample)
+
+        return sample
+
+    def summary(self) -> dict[str, Any]:
+        """Indexing timeline and throughput metrics for the run"""
+        if not self.samples:
+            return {}
+
+        green_at = next((s.elapsed for s in self.samples if s.status == models.CollectionStatus.GREEN.value), None)
+
+        return {
+            "indexing_timeline": [
+                {
+                    "t": sample.elapsed,
+                    "indexed_vectors": sample.indexed_vectors,
+                    "points": sample.points,
+                    "segments": sample.segments,
+                    "status": sample.status,
+                    "optimizer_status": sample.optimizer_status,
+                    "vectors_per_sec": sample.vectors_per_sec,
+                }
+                for sample in self.samples
+            ],
+            "indexing_peak_vectors_per_sec": max(sample.vectors_per_sec for sample in self.samples),
+            "indexed_vectors": self.samples[-1].indexed_vectors,
+            "segments_count": self.samples[-1].segments,
+            "queryable_after_ms": green_at * 1000 if green_at is not None else None,
+        }
+
+
+def describe_optimizer_status(status: models.OptimizersStatus) -> str:
+    """Pure function - `ok`, or the optimizer's error message"""
+    if isinstance(status, models.OptimizersStatusOneOf1):
+        return f"error: {status.error}"
+
+    return status.value
@@ -0,0 +1,80 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import logfire
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+
+@dataclass
+class IngestionConfig:
+    batch_size: int = 100
+    parallel: int = 4
+    queue_size: int = 8
+    wait: bool = True
+    embedding_model: str = "text-embedding-3-small"
+
+
+@dataclass
+class IngestionResult:
+    points: int
+    batches: int
+    duration: float
+
+    @property
+    def points_per_second(self) -> float:
+        return self.points / self.duration if self.duration > 0 else 0.0
+
+
+async def ingest_point_batches(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    batches: AsyncIterator[models.Batch],
+    config: IngestionConfig,
+) -> IngestionResult:
+    """
+    Upload columnar point batches through a bounded queue drained by parallel upsert workers.
+    Producing the next batch (loading, embedding) overlaps with uploads in flight,
+    and the queue bound keeps a fast producer from buffering the whole corpus.
+    """
+    if config.parallel < 1:
+        raise ValueError(f"ingestion parallel must be at least 1, got {config.parallel}")
+
+    queue: asyncio.Queue[models.Batch | None] = asyncio.Queue(maxsize=max(config.queue_size, 1))
+    uploaded = {"points": 0, "batches": 0}
+
+    async def produce() -> None:
+        async for batch in batches:
+            await queue.put(batch)
+
+        for _ in range(config.parallel):
+            await queue.put(None)
+
+    async def upload() -> None:
+        while (batch := await queue.get()) is not None:
+            await client.upsert(collection_name=collection_name, points=batch, wait=config.wait)
+            uploaded["points"] += len(batch.ids)
+            uploaded["batches"] += 1
+
+    start = time.perf_counter()
+
+    with logfire.span("Ingestion", collection=collection_name, parallel=config.parallel, wait=config.wait):
+        async with asyncio.TaskGroup() as group:
+            group.create_task(produce())
+            for _ in range(config.parallel):
+                group.create_task(upload())
+
+        if not config.wait:
+            await wait_for_points(client, collection_name, uploaded["points"])
+
+    return IngestionResult(points=uploaded["points"], batches=uploaded["batches"], duration=time.perf_counter() - start)
+
+
+async def wait_for_points(
+    client: AsyncQdrantClient, collection_name: str, expected: int, poll_interval: float = 0.5
+) -> None:
+    """Wait until fire-and-forget upserts are visible in the collection"""
+    while (await client.count(collection_name=collection_name, exact=True)).count < expected:
+        await asyncio.sleep(poll_interval)
@@ -0,0 +1,33 @@
+import numpy as np
+import polars as pl
+
+from qdrant_bench.infrastructure.persistence.dataset_loader import extract_vector_matrix
+from qdrant_bench.ports.embedding_service import EmbeddingService
+
+
+async def resolve_batch_vectors(
+    record_batch: pl.DataFrame, embedding_service: EmbeddingService, vector_names: list[str], model: str
+) -> np.ndarray | dict[str, np.ndarray]:
+    """
+    Use vector columns the corpus already carries - `vector`, or `{name}_vector` for named
+    vectors - and only fall back to embedding the `text` column when there are none.
+    """
+    if vector_names:
+        missing = [f"{name}_vector" for name in vector_names if f"{name}_vector" not in record_batch.columns]
+        if missing:
+            raise ValueError(f"Corpus is missing precomputed columns for named vectors: {', '.join(missing)}")
+
+        return {name: extract_vector_matrix(record_batch, f"{name}_vector") for name in vector_names}
+
+    if "vector" in record_batch.columns:
+        return extract_vector_matrix(record_batch, "vector")
+
+    texts = (
+        record_batch.get_column("text").fill_null("").to_list()
+        if "text" in record_batch.columns
+        else ["" for _ in range(record_batch.height)]
+    )
+
+    embeddings = await embedding_service.embed_text(texts, model=model)
+
+    return np.asarray(embeddings, dtype=np.float32)
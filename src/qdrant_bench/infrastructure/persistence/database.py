@@ -1,8 +1,25 @@
 import os
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
+# create_all only creates missing tables, so columns added to existing tables are applied here.
+# Every statement is idempotent and runs on each startup.
+SCHEMA_UPGRADES = [
+    """
+    DO $$ BEGIN
+        CREATE TYPE concurrencypolicy AS ENUM ('EXCLUSIVE', 'SHARED');
+    EXCEPTION WHEN duplicate_object THEN NULL;
+    END $$
+    """,
+    "ALTER TABLE connection ADD COLUMN IF NOT EXISTS concurrency_policy concurrencypolicy NOT NULL DEFAULT 'SHARED'",
+    "ALTER TABLE connection ADD COLUMN IF NOT EXISTS max_concurrent_runs INTEGER",
+    "ALTER TABLE run ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 0",
+    "CREATE INDEX IF NOT EXISTS ix_run_priority ON run (priority)",
+    "ALTER TABLE run ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE",
+]
+
 # Default to a local postgres container if not set
 
 
@@ -22,6 +39,8 @@ async def init_db(engine: AsyncEngine):
     async with engine.begin() as conn:
         # await conn.run_sync(SQLModel.metadata.drop_all) # For dev only
         await conn.run_sync(SQLModel.metadata.create_all)
+        for statement in SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
 
 
 def get_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
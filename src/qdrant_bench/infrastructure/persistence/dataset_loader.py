@@ -1,86 +1,108 @@
 import asyncio
 import io
+from collections.abc import AsyncIterator
 from typing import Any, cast
 
 import aioboto3
-import httpx
+import numpy as np
 import polars as pl
 
 from qdrant_bench.domain.entities.core import Dataset
 from qdrant_bench.domain.services.evaluator import GroundTruth
 
 
-async def load_dataset_corpus(dataset: Dataset, limit: int | None = None) -> list[dict[str, Any]]:
-    """Pure async function - load corpus data"""
-    return await load_from_uri(dataset.source_uri, limit)
+async def iter_dataset_corpus(
+    dataset: Dataset, batch_size: int, limit: int | None = None
+) -> AsyncIterator[pl.DataFrame]:
+    """Async generator - stream the corpus as columnar record batches"""
+    async for batch in iter_from_uri(dataset.source_uri, batch_size, limit):
+        yield batch
 
 
-async def load_query_data(dataset: Dataset, limit: int | None = None) -> list[dict[str, Any]]:
-    """Pure async function - load query data"""
-    query_uri = derive_query_uri(dataset.source_uri)
-    return await load_from_uri(query_uri, limit)
+async def load_query_matrix(dataset: Dataset, column: str, limit: int | None = None) -> np.ndarray:
+    """Pure async function - load one query vector column as a float32 matrix"""
+    matrices = await load_query_matrices(dataset, [column], limit)
+    return matrices.get(column, np.empty((0, 0), dtype=np.float32))
 
 
-async def load_ground_truth(dataset: Dataset) -> GroundTruth:
-    """Pure async function - load ground truth judgments"""
-    gt_uri = derive_ground_truth_uri(dataset.source_uri)
-    records = await load_from_uri(gt_uri, limit=None)
+async def load_query_matrices(dataset: Dataset, columns: list[str], limit: int | None = None) -> dict[str, np.ndarray]:
+    """Pure async function - load query vector columns as float32 matrices, skipping absent columns"""
+    frame = pl.scan_parquet(derive_query_uri(dataset.source_uri))
 
-    relevant_items = {rec["query_id"]: set(rec["relevant_ids"]) for rec in records}
-
-    return GroundTruth(relevant_items=relevant_items)
+    present = [column for column in columns if column in frame.collect_schema().names()]
+    if not present:
+        return {}
 
+    frame = frame.select(present)
+    if limit:
+        frame = frame.head(limit)
 
-async def load_from_uri(uri: str, limit: int | None) -> list[dict[str, Any]]:
-    """Pure async function - load from any URI type"""
+    queries = await asyncio.to_thread(frame.collect)
 
-    if uri.startswith("s3://"):
-        return await load_from_s3(uri, limit)
+    return {column: extract_vector_matrix(queries, column) for column in present}
 
-    if uri.startswith("http"):
-        return await load_from_http(uri, limit)
 
-    return await load_from_local(uri, limit)
+async def load_payload_columns(dataset: Dataset) -> dict[str, np.ndarray]:
+    """Pure async function - scalar fields of the corpus `metadata` column, one array per field in point order"""
+    frame = pl.scan_parquet(dataset.source_uri)
+    if "metadata" not in frame.collect_schema().names():
+        return {}
 
+    metadata = (await asyncio.to_thread(frame.select("metadata").collect)).get_column("metadata")
+    if not isinstance(metadata.dtype, pl.Struct):
+        return {}
 
-async def load_from_s3(s3_uri: str, limit: int | None) -> list[dict[str, Any]]:
-    """Pure async function - load from S3"""
-    bucket, key = parse_s3_uri(s3_uri)
+    fields = metadata.struct.unnest()
 
-    data = await download_from_s3(bucket, key)
+    return {
+        name: fields.get_column(name).to_numpy()
+        for name, dtype in fields.schema.items()
+        if dtype.is_numeric() or dtype in (pl.String, pl.Boolean)
+    }
 
-    return parse_parquet_bytes(data, limit)
 
+async def load_ground_truth(dataset: Dataset) -> GroundTruth:
+    """Pure async function - load ground truth judgments"""
+    frame = pl.scan_parquet(derive_ground_truth_uri(dataset.source_uri)).select("query_id", "relevant_ids")
+    judgments = await asyncio.to_thread(frame.collect)
 
-async def load_from_http(http_uri: str, limit: int | None) -> list[dict[str, Any]]:
-    """Pure async function - load from HTTP"""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(http_uri)
-        response.raise_for_status()
+    relevant_items = {
+        query_id: set(relevant_ids)
+        for query_id, relevant_ids in zip(
+            judgments.get_column("query_id").to_list(), judgments.get_column("relevant_ids").to_list(), strict=True
+        )
+    }
 
-        return parse_parquet_bytes(response.content, limit)
+    return GroundTruth(relevant_items=relevant_items)
 
 
-async def load_from_local(file_path: str, limit: int | None) -> list[dict[str, Any]]:
-    """Pure async function - load from local file"""
+async def iter_from_uri(uri: str, batch_size: int, limit: int | None) -> AsyncIterator[pl.DataFrame]:
+    """
+    Async generator - lazily scan parquet from any URI type in record batches.
+    One streaming scan decodes each row group once, and memory stays bounded by the
+    batch size instead of the corpus size. S3 and HTTP files are read with ranged
+    requests, picking up AWS credentials the same way boto3 does.
+    """
+    frame = pl.scan_parquet(uri)
 
-    def read_file():
-        return pl.read_parquet(file_path)
+    if limit:
+        frame = frame.head(limit)
 
-    df = await asyncio.to_thread(read_file)
+    async for batch in iter_lazy_batches(frame, batch_size):
+        yield batch
 
-    if limit:
-        df = df.head(limit)
 
-    return df.to_dicts()
+async def iter_lazy_batches(frame: pl.LazyFrame, batch_size: int) -> AsyncIterator[pl.DataFrame]:
+    """Async generator - stream a lazy frame in batch_size chunks, pulling each off the event loop"""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
 
+    # A single streaming query; collecting a slice per batch would re-decode the file for every batch
+    batches = iter(frame.collect_batches(chunk_size=batch_size, lazy=True))
 
-async def download_from_s3(bucket: str, key: str) -> bytes:
-    """Pure async function - download from S3"""
-    session = aioboto3.Session()
-    async with cast(Any, session.client("s3")) as s3:
-        response = await s3.get_object(Bucket=bucket, Key=key)
-        return await response["Body"].read()
+    while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+        if not batch.is_empty():
+            yield batch
 
 
 def parse_s3_uri(s3_uri: str) -> tuple[str, str]:
@@ -89,14 +111,59 @@ def parse_s3_uri(s3_uri: str) -> tuple[str, str]:
     return (parts[0], parts[1])
 
 
-def parse_parquet_bytes(data: bytes, limit: int | None) -> list[dict[str, Any]]:
-    """Pure function - parse parquet bytes to records"""
-    df = pl.read_parquet(io.BytesIO(data))
+def extract_vector_matrix(frame: pl.DataFrame, column: str) -> np.ndarray:
+    """
+    Pure function - view a vector column as a contiguous (rows x dim) float32 matrix.
+    Fixed-size float32 array columns are exposed without copying; variable-length
+    list columns are packed into a fixed-size array once.
+    """
+    series = frame.get_column(column)
 
-    if limit:
-        df = df.head(limit)
+    if series.is_empty():
+        return np.empty((0, 0), dtype=np.float32)
+
+    if isinstance(series.dtype, pl.List):
+        series = series.list.to_array(int(cast(int, series.list.len().max())))
+
+    dim = cast(pl.Array, series.dtype).size
+    if series.dtype != pl.Array(pl.Float32, dim):
+        series = series.cast(pl.Array(pl.Float32, dim))
+
+    return series.to_numpy()
+
+
+async def write_ground_truth(dataset: Dataset, neighbors: np.ndarray) -> str:
+    """
+    Pure async function - write a (queries x k) neighbor id matrix next to the corpus,
+    in the layout load_ground_truth reads back. Returns the written URI.
+    """
+    uri = derive_ground_truth_uri(dataset.source_uri)
+    frame = pl.DataFrame(
+        {
+            "query_id": np.arange(len(neighbors), dtype=np.int64),
+            "relevant_ids": pl.Series(np.asarray(neighbors, dtype=np.int64)).cast(pl.List(pl.Int64)),
+        }
+    )
+
+    if uri.startswith("http"):
+        raise ValueError(f"Cannot write ground truth to {uri}: HTTP sources are read-only")
+
+    if uri.startswith("s3://"):
+        buffer = io.BytesIO()
+        frame.write_parquet(buffer)
+        bucket, key = parse_s3_uri(uri)
+        await upload_to_s3(bucket, key, buffer.getvalue())
+        return uri
+
+    await asyncio.to_thread(frame.write_parquet, uri)
+    return uri
 
-    return df.to_dicts()
+
+async def upload_to_s3(bucket: str, key: str, data: bytes) -> None:
+    """Pure async function - upload to S3"""
+    session = aioboto3.Session()
+    async with cast(Any, session.client("s3")) as s3:
+        await s3.put_object(Bucket=bucket, Key=key, Body=data)
 
 
 def derive_query_uri(source_uri: str) -> str:
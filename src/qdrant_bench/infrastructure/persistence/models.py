@@ -6,7 +6,7 @@ from pydantic import field_validator
 from sqlalchemy import Column, DateTime
 from sqlmodel import JSON, Field, SQLModel
 
-from qdrant_bench.domain.entities.core import RunStatus
+from qdrant_bench.domain.entities.core import ConcurrencyPolicy, RunStatus
 
 
 class Connection(SQLModel, table=True):
@@ -14,6 +14,8 @@ class Connection(SQLModel, table=True):
     name: str = Field(unique=True, index=True)
     url: str
     api_key: str  # Encrypted handling should be done in repository/service layer
+    concurrency_policy: ConcurrencyPolicy = Field(default=ConcurrencyPolicy.SHARED)
+    max_concurrent_runs: int | None = None
 
 
 class ObjectStorage(SQLModel, table=True):
@@ -57,3 +59,6 @@ class Run(SQLModel, table=True):
     start_time: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
     end_time: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
     metrics: dict[str, Any] = Field(default={}, sa_type=JSON)
+    priority: int = Field(default=0, index=True)
+    # Lease of a RUNNING run, renewed by whoever executes it; a stale one means the executor died
+    heartbeat_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
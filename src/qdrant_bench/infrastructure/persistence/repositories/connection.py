@@ -13,7 +13,14 @@ class SqlAlchemyConnectionRepository(ConnectionRepository):
         self.session = session
 
     async def save(self, connection: Connection) -> Connection:
-        db_conn = DbConnection(id=connection.id, name=connection.name, url=connection.url, api_key=connection.api_key)
+        db_conn = DbConnection(
+            id=connection.id,
+            name=connection.name,
+            url=connection.url,
+            api_key=connection.api_key,
+            concurrency_policy=connection.concurrency_policy,
+            max_concurrent_runs=connection.max_concurrent_runs,
+        )
         db_conn = await self.session.merge(db_conn)
         await self.session.commit()
         await self.session.refresh(db_conn)
@@ -30,4 +37,11 @@ class SqlAlchemyConnectionRepository(ConnectionRepository):
         return [self.to_domain(c) for c in result.scalars().all()]
 
     def to_domain(self, db_conn: DbConnection) -> Connection:
-        return Connection(id=db_conn.id, name=db_conn.name, url=db_conn.url, api_key=db_conn.api_key)
+        return Connection(
+            id=db_conn.id,
+            name=db_conn.name,
+            url=db_conn.url,
+            api_key=db_conn.api_key,
+            concurrency_policy=db_conn.concurrency_policy,
+            max_concurrent_runs=db_conn.max_concurrent_runs,
+        )
@@ -1,10 +1,16 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+from sqlalchemy import Select, case, func, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlalchemy.orm import aliased
+from sqlmodel import col, select
 
-from qdrant_bench.domain.entities.core import Run, RunStatus
+from qdrant_bench.domain.entities.core import ConcurrencyPolicy, Run, RunStatus
+from qdrant_bench.infrastructure.persistence.models import Connection as DbConnection
+from qdrant_bench.infrastructure.persistence.models import Experiment as DbExperiment
 from qdrant_bench.infrastructure.persistence.models import Run as DbRun
 from qdrant_bench.ports.repositories import RunRepository
 
@@ -21,6 +27,8 @@ class SqlAlchemyRunRepository(RunRepository):
             start_time=run.start_time,
             end_time=run.end_time,
             metrics=run.metrics,
+            priority=run.priority,
+            heartbeat_at=run.heartbeat_at,
         )
         db_run = await self.session.merge(db_run)
         await self.session.commit()
@@ -43,6 +51,105 @@ class SqlAlchemyRunRepository(RunRepository):
         result = await self.session.execute(query)
         return [self.to_domain(run) for run in result.scalars().all()]
 
+    async def claim_next(self) -> Run | None:
+        """
+        Atomically move the next CREATED run to RUNNING - highest priority first, then oldest -
+        and start its lease. Runs whose connection is at its concurrency limit are not claimable.
+        Row locks with SKIP LOCKED let many workers claim in parallel without handing out the same
+        run; a transaction-scoped advisory lock per connection serializes admission, and the limit
+        is checked again under it, so two workers never fill the same last slot.
+        """
+        while True:
+            result = await self.session.execute(self.claimable_run())
+            candidate = result.first()
+            if not candidate:
+                await self.session.rollback()
+                return None
+
+            db_run, connection = candidate
+            await self.session.execute(select(func.pg_advisory_xact_lock(advisory_lock_key(connection.id))))
+
+            # Read committed: this count sees every claim committed before the lock was granted
+            if not await self.has_free_slot(connection):
+                await self.session.rollback()
+                continue
+
+            db_run.status = RunStatus.RUNNING
+            db_run.heartbeat_at = datetime.now(UTC)
+            await self.session.commit()
+            await self.session.refresh(db_run)
+            return self.to_domain(db_run)
+
+    def claimable_run(self) -> Select[DbRun, DbConnection]:
+        """The next CREATED run on a connection with a free slot, locked unless another worker holds it"""
+        running_run = aliased(DbRun)
+        running_experiment = aliased(DbExperiment)
+
+        running_on_connection = (
+            select(func.count())
+            .select_from(running_run)
+            .join(running_experiment, col(running_experiment.id) == col(running_run.experiment_id))
+            .where(col(running_experiment.connection_id) == col(DbConnection.id))
+            .where(col(running_run.status) == RunStatus.RUNNING)
+            .scalar_subquery()
+        )
+        concurrency_limit = case(
+            (col(DbConnection.concurrency_policy) == ConcurrencyPolicy.EXCLUSIVE, 1),
+            else_=col(DbConnection.max_concurrent_runs),
+        )
+
+        return (
+            select(DbRun, DbConnection)
+            .join(DbExperiment, col(DbExperiment.id) == col(DbRun.experiment_id))
+            .join(DbConnection, col(DbConnection.id) == col(DbExperiment.connection_id))
+            .where(col(DbRun.status) == RunStatus.CREATED)
+            .where(or_(concurrency_limit.is_(None), running_on_connection < concurrency_limit))
+            .order_by(col(DbRun.priority).desc(), col(DbRun.start_time).asc())
+            .limit(1)
+            .with_for_update(of=DbRun, skip_locked=True)
+        )
+
+    async def has_free_slot(self, connection: DbConnection) -> bool:
+        limit = 1 if connection.concurrency_policy == ConcurrencyPolicy.EXCLUSIVE else connection.max_concurrent_runs
+        if limit is None:
+            return True
+
+        running = await self.session.scalar(
+            select(func.count())
+            .select_from(DbRun)
+            .join(DbExperiment, col(DbExperiment.id) == col(DbRun.experiment_id))
+            .where(col(DbExperiment.connection_id) == connection.id)
+            .where(col(DbRun.status) == RunStatus.RUNNING)
+        )
+        return (running or 0) < limit
+
+    async def renew_lease(self, id: UUID) -> None:
+        await self.session.execute(
+            update(DbRun)
+            .where(col(DbRun.id) == id)
+            .where(col(DbRun.status) == RunStatus.RUNNING)
+            .values(heartbeat_at=datetime.now(UTC))
+        )
+        await self.session.commit()
+
+    async def expire_stale_runs(self, lease: timedelta) -> Sequence[Run]:
+        """Fail RUNNING runs whose lease ran out - their executor died without recording an outcome"""
+        result = await self.session.execute(
+            select(DbRun)
+            .where(col(DbRun.status) == RunStatus.RUNNING)
+            .where(or_(col(DbRun.heartbeat_at).is_(None), col(DbRun.heartbeat_at) < datetime.now(UTC) - lease))
+            .with_for_update(skip_locked=True)
+        )
+        stale = list(result.scalars().all())
+
+        for db_run in stale:
+            db_run.status = RunStatus.FAILED
+            db_run.end_time = datetime.now(UTC)
+            db_run.metrics = {**db_run.metrics, "failure_reason": "lease expired"}
+
+        await self.session.commit()
+        return [self.to_domain(db_run) for db_run in stale]
+
     def to_domain(self, db_run: DbRun) -> Run:
         if not db_run.start_time:
             raise RuntimeError(f"Run {db_run.id} has no start_time")
@@ -54,4 +161,11 @@ class SqlAlchemyRunRepository(RunRepository):
             start_time=db_run.start_time,
             end_time=db_run.end_time,
             metrics=db_run.metrics,
+            priority=db_run.priority,
+            heartbeat_at=db_run.heartbeat_at,
         )
+
+
+def advisory_lock_key(connection_id: UUID) -> int:
+    """Pure function - the signed 64-bit advisory lock key guarding admission to a connection"""
+    return int.from_bytes(connection_id.bytes[:8], "big", signed=True)
@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+import logfire
+import numpy as np
+
+from qdrant_bench.ports.embedding_service import EmbeddingService
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (name TEXT PRIMARY KEY, bytes INTEGER NOT NULL, last_used REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    block TEXT NOT NULL REFERENCES blocks(name) ON DELETE CASCADE,
+    row INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_block ON entries(block);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def since(self, earlier: "EmbeddingCacheStats") -> "EmbeddingCacheStats":
+        """Counters accumulated after an earlier snapshot"""
+        return EmbeddingCacheStats(
+            hits=self.hits - earlier.hits,
+            misses=self.misses - earlier.misses,
+            bytes_saved=self.bytes_saved - earlier.bytes_saved,
+        )
+
+
+def cache_key(model: str, text: str) -> str:
+    """Pure function - content address of one embedding"""
+    return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+
+class EmbeddingCacheStore:
+    """
+    On-disk embedding store. Each write lands in its own `.npy` block that is read back
+    memory-mapped, so hits never load whole blocks into memory. A SQLite index maps keys
+    to (block, row) and tracks block recency; least recently used blocks are dropped
+    once the blocks on disk exceed max_bytes. One store is meant to be shared by the whole
+    process: a lock serializes index access, so a lookup never reads a block an eviction
+    is unlinking.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.index = sqlite3.connect(directory / "index.sqlite", check_same_thread=False, isolation_level=None)
+        self.index.execute("PRAGMA foreign_keys = ON")
+        self.index.executescript(INDEX_SCHEMA)
+        self.blocks: dict[str, np.ndarray] = {}
+        self.lock = threading.Lock()
+
+    def lookup(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Vectors for the keys present in the store, touching the blocks they came from"""
+        if not keys:
+            return {}
+
+        with self.lock:
+            rows = self.index.execute(
+                f"SELECT key, block, row FROM entries WHERE key IN ({', '.join('?' for _ in keys)})", keys
+            ).fetchall()
+
+            found = {}
+            used_blocks = set()
+            for key, block, row in rows:
+                matrix = self.open_block(block)
+                # Another process sharing the directory may have evicted the block; that is a miss
+                if matrix is not None:
+                    found[key] = matrix[row]
+                    used_blocks.add(block)
+
+            self.index.executemany(
+                "UPDATE blocks SET last_used = ? WHERE name = ?", [(time.time(), block) for block in used_blocks]
+            )
+
+        return found
+
+    def store(self, keys: list[str], vectors: np.ndarray) -> None:
+        """Persist a matrix of vectors as a new block, then evict down to the size bound"""
+        if not keys:
+            return
+
+        name = f"{uuid.uuid4().hex}.npy"
+        path = self.directory / name
+        np.save(path, np.ascontiguousarray(vectors, dtype=np.float32))
+
+        with self.lock:
+            self.insert_block(name, path.stat().st_size, keys)
+            self.evict(keep=name)
+
+    def insert_block(self, name: str, size: int, keys: list[str]) -> None:
+        """Register a written block and point its keys at it, in one transaction"""
+        with self.index:
+            self.index.execute("BEGIN")
+            self.index.execute(
+                "INSERT INTO blocks (name, bytes, last_used) VALUES (?, ?, ?)",
+                (name, size, time.time()),
+            )
+            self.index.executemany(
+                "INSERT OR REPLACE INTO entries (key, block, row) VALUES (?, ?, ?)",
+                [(key, name, row) for row, key in enumerate(keys)],
+            )
+
+    def evict(self, keep: str | None = None) -> None:
+        """Drop least recently used blocks until the store fits in max_bytes"""
+        blocks = self.index.execute("SELECT name, bytes FROM blocks ORDER BY last_used ASC").fetchall()
+        total = sum(size for _, size in blocks)
+
+        for name, size in blocks:
+            if total <= self.max_bytes:
+                return
+            if name == keep:
+                continue
+
+            self.index.execute("DELETE FROM blocks WHERE name = ?", (name,))
+            self.blocks.pop(name, None)
+            (self.directory / name).unlink(missing_ok=True)
+            total -= size
+
+    def open_block(self, name: str) -> np.ndarray | None:
+        """Memory-map a block once and reuse the mapping; None when the block file is gone"""
+        if name not in self.blocks:
+            try:
+                self.blocks[name] = np.load(self.directory / name, mmap_mode="r")
+            except FileNotFoundError:
+                return None
+
+        return self.blocks[name]
+
+    def close(self) -> None:
+        with self.lock:
+            self.blocks.clear()
+            self.index.close()
+
+
+class CachingEmbeddingService(EmbeddingService):
+    """
+    EmbeddingService decorator that serves repeated (model, text) pairs from an
+    EmbeddingCacheStore and only sends the misses to the wrapped service.
+    """
+
+    def __init__(self, inner: EmbeddingService, store: EmbeddingCacheStore):
+        self.inner = inner
+        self.store = store
+        self.stats = EmbeddingCacheStats()
+
+    async def embed_text(self, texts: list[str], model: str) -> list[list[float]]:
+        keys = [cache_key(model, text) for text in texts]
+
+        cached = await asyncio.to_thread(self.store.lookup, keys)
+
+        missing = {key: text for key, text in zip(keys, texts, strict=True) if key not in cached}
+
+        if missing:
+            embeddings = np.asarray(await self.inner.embed_text(list(missing.values()), model=model), dtype=np.float32)
+            await asyncio.to_thread(self.store.store, list(missing), embeddings)
+            cached = {**cached, **dict(zip(missing, embeddings, strict=True))}
+
+        hits = len(texts) - len(missing)
+        self.stats = EmbeddingCacheStats(
+            hits=self.stats.hits + hits,
+            misses=self.stats.misses + len(missing),
+            bytes_saved=self.stats.bytes_saved + sum(cached[key].nbytes for key in keys if key not in missing),
+        )
+
+        logfire.debug("Embedding cache lookup", model=model, hits=hits, misses=len(missing))
+
+        return [cached[key].tolist() for key in keys]
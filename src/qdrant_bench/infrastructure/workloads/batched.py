@@ -0,0 +1,131 @@
+import time
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import Any
+
+import logfire
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.infrastructure.workloads.execution import (
+    build_timeline,
+    collect_latency_components,
+    run_load,
+    split_latency,
+    summarize_latencies,
+    summarize_run,
+    warm_up,
+)
+from qdrant_bench.infrastructure.workloads.server_timing import query_batch_with_server_time
+from qdrant_bench.ports.workload import WorkloadConfig, WorkloadResult
+
+
+async def execute_batched_searches(
+    client: AsyncQdrantClient, collection_name: str, requests: list[models.QueryRequest], config: WorkloadConfig
+) -> WorkloadResult:
+    """
+    Group query requests into server-side batches and send each batch as one call.
+    Batches are dispatched with the configured load pattern, so arrival rate and
+    concurrency apply to batches rather than to individual queries; offered and achieved
+    throughput are still reported in queries per second.
+    """
+    batch_size = config.batch_size or 1
+    batches = chunk_requests(requests, batch_size)
+
+    async def search(batch: list[models.QueryRequest]) -> dict[str, Any]:
+        try:
+            return await execute_query_batch(client, collection_name, batch)
+        except Exception as e:
+            # Keep one empty prediction per query so later batches stay aligned with their queries
+            return {"prediction": [None] * len(batch), "error": repr(e)}
+
+    warmup = await warm_up(batches, search, config)
+    start_total = time.perf_counter()
+
+    # SLO guards observe individual queries; batches rely on the workflow's phase timeout instead
+    results, curve = await run_load(batches, search, replace(config, guard=None))
+
+    total_duration = time.perf_counter() - start_total
+
+    # Batches never sent before the deadline keep one empty prediction per query they carry
+    predictions = [
+        points
+        for r, batch in zip(results, batches, strict=True)
+        for points in (r["prediction"] if r else [None] * len(batch))
+    ]
+    sent = [r for r in results if r]
+    succeeded = [r for r in sent if "error" not in r]
+
+    # Every query in a batch waits for the whole batch, so the batch latency is what each one sees
+    return WorkloadResult(
+        predictions=predictions,
+        latencies=LatencyHistogram.of(r["latency"] for r in succeeded),
+        total_duration=total_duration,
+        timeline=build_timeline(expand_batches(sent), start_total),
+        latency_components=collect_latency_components(succeeded),
+        metrics={
+            **summarize_run(config, sum(len(r["prediction"]) for r in succeeded), total_duration, curve),
+            **warmup,
+            **summarize_batches(sent, batch_size, total_duration),
+        },
+    )
+
+
+async def execute_query_batch(
+    client: AsyncQdrantClient, collection_name: str, batch: list[models.QueryRequest]
+) -> dict[str, Any]:
+    """Execute one batch query call with timing"""
+    start = time.perf_counter()
+
+    with logfire.span("Batch Search", collection=collection_name, batch_size=len(batch)):
+        points, server_time = await query_batch_with_server_time(client, collection_name, batch)
+
+    latency = time.perf_counter() - start
+
+    return {"prediction": points, "latency": latency, **split_latency(latency, server_time)}
+
+
+def chunk_requests(requests: Sequence[models.QueryRequest], batch_size: int) -> list[list[models.QueryRequest]]:
+    """Pure function - split requests into batches of at most batch_size"""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    return [list(requests[i : i + batch_size]) for i in range(0, len(requests), batch_size)]
+
+
+def amortize_batch_latencies(results: list[dict[str, Any]]) -> list[float]:
+    """Pure function - spread each batch latency evenly over the queries it carried"""
+    return [r["latency"] / len(r["prediction"]) for r in results if "latency" in r for _ in r["prediction"]]
+
+
+def expand_batches(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Pure function - one result per query carried, completing with its batch at the batch latency"""
+    return [
+        {"completed_at": r["completed_at"], "error": r["error"]}
+        if "error" in r
+        else {"completed_at": r["completed_at"], "latency": r["latency"]}
+        for r in results
+        for _ in r["prediction"]
+    ]
+
+
+def summarize_batches(results: list[dict[str, Any]], batch_size: int, total_duration: float) -> dict[str, Any]:
+    """
+    Pure function - batch counts, amortized per-query latency (batch time / batch size) and query
+    throughput. Amortized latency is a cost figure, not comparable with the latency of other modes.
+    """
+    succeeded = [r for r in results if "error" not in r]
+    batch_latencies = [r["latency"] for r in succeeded]
+    query_count = sum(len(r["prediction"]) for r in succeeded)
+    amortized = LatencyHistogram.of(amortize_batch_latencies(succeeded))
+
+    return {
+        "latency_scope": "batch",
+        "batch_size": batch_size,
+        "batch_count": len(results),
+        "batch_errors": len(results) - len(succeeded),
+        **{f"amortized_{name}": value for name, value in summarize_latencies(amortized).items()},
+        "amortized_query_latency": sum(batch_latencies) / query_count if query_count else 0.0,
+        "batch_query_throughput": query_count / total_duration if total_duration > 0 else 0.0,
+    }
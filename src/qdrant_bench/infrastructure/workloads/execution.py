@@ -0,0 +1,473 @@
+import asyncio
+import contextlib
+import itertools
+import math
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.domain.services.slo import SloGuard
+from qdrant_bench.domain.services.timeline import QueryTimeline
+from qdrant_bench.domain.services.warmup import SteadyStateDetector, WarmupPlan
+from qdrant_bench.ports.workload import ArrivalProcess, WorkloadConfig, WorkloadResult
+
+SearchFn = Callable[[Any], Awaitable[dict[str, Any]]]
+ResultFn = Callable[[Any, dict[str, Any]], None]
+
+# Server-reported processing time and the network plus client time around it, which add up to the
+# query's service time; open-loop runs add the wait from the scheduled send, so all three add up to `latency`
+LATENCY_COMPONENTS = ("server_latency", "overhead_latency", "queue_latency")
+
+
+async def run_load(
+    queries: Sequence[Any], search: SearchFn, config: WorkloadConfig
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Run a concurrency sweep when levels are configured, otherwise a single load pattern.
+    Failed queries come back as error results; a run where every query failed raises instead.
+    """
+    if config.concurrency_levels and config.guard and config.guard.enforces_slo:
+        raise ValueError("SLO guards cannot be combined with concurrency_levels")
+
+    if config.concurrency_levels:
+        results, curve = await run_concurrency_sweep(queries, search, config.concurrency_levels, config.deadline)
+    else:
+        results, curve = await run_queries(queries, search, config), []
+
+    check_failures(results)
+
+    return results, curve
+
+
+async def warm_up(queries: Sequence[Any], search: SearchFn, config: WorkloadConfig) -> dict[str, Any]:
+    """Run the configured warmup, if any, at the workload's concurrency"""
+    if config.warmup is None:
+        return {}
+
+    return await run_warmup(queries, search, config.warmup, config.concurrency or 1)
+
+
+async def run_warmup(queries: Sequence[Any], search: SearchFn, plan: WarmupPlan, concurrency: int) -> dict[str, Any]:
+    """
+    Send queries ahead of the measured run, cycling through the query set with `concurrency`
+    virtual clients, until the plan's count or duration is reached or - in auto mode - latency
+    is steady. Warmup results never reach the measured run; they are summarized on their own.
+    """
+    search = record_outcome(search)
+    detector = SteadyStateDetector(window=plan.window, tolerance=plan.tolerance) if plan.auto else None
+    latencies = LatencyHistogram()
+    pending = itertools.cycle(queries)
+    sent = errors = 0
+    steady = False
+    start = time.perf_counter()
+
+    def done() -> bool:
+        return (
+            steady
+            or (plan.query_limit is not None and sent >= plan.query_limit)
+            or (plan.duration_limit is not None and time.perf_counter() - start >= plan.duration_limit)
+        )
+
+    async def virtual_client() -> None:
+        nonlocal sent, errors, steady
+        while not done():
+            sent += 1
+            result = await search(next(pending))
+            if "error" in result:
+                errors += 1
+                continue
+
+            latencies.record(result["latency"])
+            steady = steady or bool(detector and detector.observe(result["latency"]))
+
+    if queries:
+        await asyncio.gather(*[virtual_client() for _ in range(max(concurrency, 1))])
+
+    return {
+        "warmup_queries": sent,
+        "warmup_errors": errors,
+        "warmup_duration": time.perf_counter() - start,
+        **({"warmup_steady": steady} if plan.auto else {}),
+        **{f"warmup_{name}": value for name, value in summarize_latencies(latencies).items()},
+    }
+
+
+def record_outcome(search: SearchFn) -> SearchFn:
+    """
+    Stamp every result with its completion time and turn a failed query into an error
+    result, so one bad response shows up in the timeline instead of ending the run
+    """
+
+    async def recorded(query: Any) -> dict[str, Any]:
+        try:
+            result = await search(query)
+        except Exception as e:
+            return {"error": repr(e), "completed_at": time.perf_counter()}
+
+        result["completed_at"] = time.perf_counter()
+        return result
+
+    return recorded
+
+
+def report_to(search: SearchFn, on_result: ResultFn) -> SearchFn:
+    """Hand every result to `on_result` as soon as its query completes"""
+
+    async def reported(query: Any) -> dict[str, Any]:
+        result = await search(query)
+        on_result(query, result)
+        return result
+
+    return reported
+
+
+def check_failures(results: list[dict[str, Any]]) -> None:
+    """Raise when every query that was sent failed - a missing collection, not a degraded server"""
+    sent = [r for r in results if r]
+    if sent and all("error" in r for r in sent):
+        raise RuntimeError(f"All {len(sent)} queries failed, first error: {sent[0]['error']}")
+
+
+def build_result(
+    config: WorkloadConfig,
+    results: list[dict[str, Any]],
+    curve: list[dict[str, Any]],
+    start: float,
+    total_duration: float,
+    metrics: dict[str, Any],
+) -> WorkloadResult:
+    """Pure function - a workload result from per-query outcomes, with load, guard and workload metrics"""
+    completed = [r for r in results if r and "error" not in r]
+
+    return WorkloadResult(
+        predictions=[r.get("prediction") for r in results],
+        latencies=LatencyHistogram.of(r["latency"] for r in completed),
+        total_duration=total_duration,
+        timeline=build_timeline(results, start),
+        latency_components=collect_latency_components(completed),
+        metrics={
+            **summarize_run(config, len(completed), total_duration, curve),
+            **(config.guard.summary() if config.guard else {}),
+            **metrics,
+        },
+    )
+
+
+def build_timeline(results: list[dict[str, Any]], start: float) -> QueryTimeline:
+    """Pure function - timeline of the results that were sent; unsent queries are left out"""
+    sent = [r for r in results if "completed_at" in r]
+
+    return QueryTimeline.of(
+        start, [r["completed_at"] for r in sent], [math.nan if "error" in r else r["latency"] for r in sent]
+    )
+
+
+async def run_queries(queries: Sequence[Any], search: SearchFn, config: WorkloadConfig) -> list[dict[str, Any]]:
+    """Dispatch queries with the load pattern selected by the workload config"""
+    search = record_outcome(search)
+
+    if config.guard:
+        return await run_guarded(queries, search, config, config.guard)
+
+    if config.deadline is not None:
+        return await run_until(queries, search, config, config.deadline)
+
+    return await run_pattern(queries, search, config)
+
+
+async def run_pattern(
+    queries: Sequence[Any],
+    search: SearchFn,
+    config: WorkloadConfig,
+    stop: asyncio.Event | None = None,
+    on_result: ResultFn | None = None,
+) -> list[dict[str, Any]]:
+    """Run the open-loop, closed-loop or all-at-once pattern, handing every final result to `on_result`"""
+    if config.arrival_rate:
+        schedule = build_arrival_schedule(
+            count=len(queries), rate=config.arrival_rate, process=config.arrival_process, seed=config.seed
+        )
+        return await run_open_loop(queries, search, schedule, stop, on_result)
+
+    if on_result:
+        search = report_to(search, on_result)
+
+    if config.concurrency:
+        return await run_closed_loop(queries, search, config.concurrency)
+
+    return await run_all_at_once(queries, search)
+
+
+async def run_guarded(
+    queries: Sequence[Any], search: SearchFn, config: WorkloadConfig, guard: SloGuard
+) -> list[dict[str, Any]]:
+    """
+    Run the load pattern under an SLO guard. Completed queries feed the guard with their final
+    latency - queueing delay included on an open loop; once it trips - or its deadline passes -
+    no further query is sent and unsent queries come back as empty results, so the queries
+    that did complete keep their positions.
+    """
+    stop = asyncio.Event()
+    guard.begin(len(queries))
+
+    timer = (
+        asyncio.get_running_loop().call_later(max(guard.deadline - time.perf_counter(), 0.0), stop.set)
+        if guard.deadline is not None
+        else None
+    )
+
+    async def guarded(index: int) -> dict[str, Any]:
+        if stop.is_set() or guard.tripped:
+            return {}
+
+        return await search(queries[index])
+
+    def observe(index: int, result: dict[str, Any]) -> None:
+        if result and "error" not in result:
+            guard.observe(index, result["prediction"], result["latency"])
+
+        if guard.tripped:
+            stop.set()
+
+    try:
+        return await run_pattern(range(len(queries)), guarded, config, stop, observe)
+    finally:
+        if timer:
+            timer.cancel()
+        if stop.is_set() and not guard.tripped:
+            guard.breach = guard.check_deadline()
+
+
+async def run_until(
+    queries: Sequence[Any], search: SearchFn, config: WorkloadConfig, deadline: float
+) -> list[dict[str, Any]]:
+    """
+    Run the load pattern until the deadline. No query is sent past it and unsent queries come
+    back as empty results, so what did complete is still measured instead of being cut off.
+    """
+    stop = asyncio.Event()
+    timer = asyncio.get_running_loop().call_later(max(deadline - time.perf_counter(), 0.0), stop.set)
+
+    async def bounded(query: Any) -> dict[str, Any]:
+        if stop.is_set() or time.perf_counter() >= deadline:
+            return {}
+        return await search(query)
+
+    try:
+        return await run_pattern(queries, bounded, config, stop)
+    finally:
+        timer.cancel()
+
+
+async def run_all_at_once(queries: Sequence[Any], search: SearchFn) -> list[dict[str, Any]]:
+    """Fire every query at once and wait for all of them"""
+    return list(await asyncio.gather(*[search(query) for query in queries]))
+
+
+async def run_closed_loop(queries: Sequence[Any], search: SearchFn, concurrency: int) -> list[dict[str, Any]]:
+    """
+    Run a fixed number of virtual clients, each sending its next query as soon as
+    the previous one returns. Results keep the order of the input queries.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    results: list[dict[str, Any]] = [{} for _ in queries]
+    pending = iter(range(len(queries)))
+
+    async def virtual_client() -> None:
+        for index in pending:
+            results[index] = await search(queries[index])
+
+    await asyncio.gather(*[virtual_client() for _ in range(min(concurrency, len(queries)))])
+
+    return results
+
+
+async def run_concurrency_sweep(
+    queries: Sequence[Any], search: SearchFn, levels: list[int], deadline: float | None = None
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Run a closed loop over the full query set at every concurrency level.
+    Returns the results of the first level and one throughput/latency point per level.
+    Past the deadline no query is sent and no further level starts.
+    """
+    recorded = record_outcome(search)
+    first_results: list[dict[str, Any]] = []
+    curve = []
+
+    async def bounded(query: Any) -> dict[str, Any]:
+        return {} if deadline is not None and time.perf_counter() >= deadline else await recorded(query)
+
+    for level in levels:
+        start = time.perf_counter()
+        results = await run_closed_loop(queries, bounded, level)
+        duration = time.perf_counter() - start
+
+        sent = [r for r in results if r]
+        succeeded = [r for r in sent if "error" not in r]
+
+        first_results = first_results or results
+        curve.append(
+            {
+                "concurrency": level,
+                "qps": len(succeeded) / duration if duration > 0 else 0.0,
+                "errors": len(sent) - len(succeeded),
+                **summarize_latencies(LatencyHistogram.of(r["latency"] for r in succeeded)),
+            }
+        )
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+    return first_results, curve
+
+
+async def run_open_loop(
+    queries: Sequence[Any],
+    search: SearchFn,
+    schedule: list[float],
+    stop: asyncio.Event | None = None,
+    on_result: ResultFn | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Send queries on a fixed arrival schedule regardless of outstanding responses.
+    Latency is measured from each query's scheduled send time, so time spent waiting
+    behind a slow dispatcher or a saturated client counts against the query.
+    Setting `stop` ends dispatch early; queries never sent come back as empty results.
+    """
+
+    async def dispatch(query: Any, scheduled_at: float) -> dict[str, Any]:
+        result = await measure_from(scheduled_at, search(query))
+        if on_result:
+            on_result(query, result)
+        return result
+
+    start = time.perf_counter()
+    tasks = []
+
+    for query, offset in zip(queries, schedule, strict=True):
+        scheduled_at = start + offset
+        delay = scheduled_at - time.perf_counter()
+        if delay > 0 and stop:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+        elif delay > 0:
+            await asyncio.sleep(delay)
+
+        if stop and stop.is_set():
+            break
+
+        tasks.append(asyncio.create_task(dispatch(query, scheduled_at)))
+
+    completed = list(await asyncio.gather(*tasks))
+
+    return completed + [{} for _ in range(len(queries) - len(completed))]
+
+
+async def measure_from(scheduled_at: float, pending: Awaitable[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Await a search and replace its latency with the time elapsed since its scheduled send;
+    the search's own latency is kept as its service time and the difference as queueing delay
+    """
+    result = await pending
+    if not result or "error" in result:
+        return result
+
+    latency = time.perf_counter() - scheduled_at
+    return {
+        **result,
+        "service_latency": result["latency"],
+        "queue_latency": max(latency - result["latency"], 0.0),
+        "latency": latency,
+    }
+
+
+def build_arrival_schedule(count: int, rate: float, process: ArrivalProcess, seed: int | None = None) -> list[float]:
+    """Pure function - send offsets in seconds from the start of the workload"""
+    if rate <= 0:
+        raise ValueError(f"arrival_rate must be positive, got {rate}")
+
+    if process == ArrivalProcess.POISSON:
+        gaps = np.random.default_rng(seed).exponential(scale=1.0 / rate, size=count)
+        return (np.cumsum(gaps) - gaps[0]).tolist() if count else []
+
+    return [i / rate for i in range(count)]
+
+
+def split_latency(latency: float, server_time: float | None) -> dict[str, float]:
+    """Pure function - the server's share of a client-observed latency and the overhead around it"""
+    if server_time is None:
+        return {}
+
+    return {"server_latency": server_time, "overhead_latency": max(latency - server_time, 0.0)}
+
+
+def collect_latency_components(results: list[dict[str, Any]]) -> dict[str, LatencyHistogram]:
+    """Pure function - one histogram per latency component the results reported"""
+    histograms = {
+        component: LatencyHistogram.of(r[component] for r in results if component in r)
+        for component in LATENCY_COMPONENTS
+    }
+
+    return {component: histogram for component, histogram in histograms.items() if histogram.count}
+
+
+def summarize_latency_components(components: dict[str, LatencyHistogram]) -> dict[str, float]:
+    """Pure function - percentiles per component, e.g. server_p99_latency, overhead_p99_latency and queue_p99_latency"""
+    return {
+        f"{component.removesuffix('_latency')}_{name}": value
+        for component, histogram in components.items()
+        for name, value in summarize_latencies(histogram).items()
+    }
+
+
+def summarize_latencies(latencies: LatencyHistogram) -> dict[str, float]:
+    """Pure function - latency percentiles in seconds"""
+    if not latencies.count:
+        return {}
+
+    return {
+        "mean_latency": latencies.mean,
+        "p50_latency": latencies.percentile(50),
+        "p95_latency": latencies.percentile(95),
+        "p99_latency": latencies.percentile(99),
+    }
+
+
+def summarize_curve(curve: list[dict[str, Any]]) -> dict[str, Any]:
+    """Pure function - concurrency curve plus its peak throughput point"""
+    if not curve:
+        return {}
+
+    peak = max(curve, key=lambda point: point["qps"])
+
+    return {"concurrency_curve": curve, "peak_qps": peak["qps"], "peak_qps_concurrency": peak["concurrency"]}
+
+
+def summarize_run(
+    config: WorkloadConfig, completed: int, total_duration: float, curve: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Pure function - load metrics for either a sweep or a single load pattern"""
+    if curve:
+        return summarize_curve(curve)
+
+    return summarize_load(config, completed, total_duration)
+
+
+def summarize_load(config: WorkloadConfig, completed: int, total_duration: float) -> dict[str, Any]:
+    """
+    Pure function - offered vs achieved query rate for open-loop runs; batched runs send
+    arrival_rate batches a second, each carrying batch_size queries
+    """
+    if not config.arrival_rate:
+        return {}
+
+    return {
+        "arrival_process": config.arrival_process.value,
+        "offered_qps": float(config.arrival_rate * (config.batch_size or 1)),
+        "achieved_qps": completed / total_duration if total_duration > 0 else 0.0,
+    }
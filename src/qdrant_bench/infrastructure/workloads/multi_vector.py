@@ -1,19 +1,37 @@
 import time
+from dataclasses import replace
 from typing import Any
 
 import logfire
+import numpy as np
 from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
 
 from qdrant_bench.domain.entities.core import Dataset
-from qdrant_bench.infrastructure.persistence.dataset_loader import load_query_data
-from qdrant_bench.ports.workload import Workload, WorkloadConfig, WorkloadResult
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.infrastructure.persistence.dataset_loader import load_query_matrices
+from qdrant_bench.infrastructure.workloads.batched import execute_batched_searches
+from qdrant_bench.infrastructure.workloads.execution import (
+    build_result,
+    collect_latency_components,
+    record_outcome,
+    run_closed_loop,
+    run_load,
+    split_latency,
+    summarize_latencies,
+    summarize_latency_components,
+    warm_up,
+)
+from qdrant_bench.infrastructure.workloads.parallel import execute_in_process_pool
+from qdrant_bench.infrastructure.workloads.server_timing import query_with_server_time
+from qdrant_bench.ports.workload import FusionConfig, Workload, WorkloadConfig, WorkloadResult
 
 
 class MultiVectorWorkload(Workload):
-    async def execute(self, client: AsyncQdrantClient, dataset: Dataset, config: WorkloadConfig) -> WorkloadResult:
+    async def execute(
+        self, client: AsyncQdrantClient, collection_name: str, dataset: Dataset, config: WorkloadConfig
+    ) -> WorkloadResult:
         """Execute multi-vector workload with real data"""
-        collection_name = dataset.name
-
         vector_names = extract_vector_names(dataset)
         if not vector_names:
             raise ValueError("Multi-vector workload requires 'vectors' in schema_config")
@@ -24,7 +42,7 @@ class MultiVectorWorkload(Workload):
             raise ValueError(f"No queries loaded from dataset {dataset.name}")
 
         return await execute_multi_vector_search_batch(
-            client=client, collection_name=collection_name, queries=queries, vector_names=vector_names, config=config
+            client=client, collection_name=collection_name, queries=queries, config=config
         )
 
 
@@ -35,58 +53,213 @@ def extract_vector_names(dataset: Dataset) -> list[str]:
 
 async def load_multi_vector_queries(
     dataset: Dataset, limit: int, vector_names: list[str]
-) -> list[dict[str, list[float]]]:
-    """Pure async function - load queries with multiple named vectors"""
-    query_records = await load_query_data(dataset, limit)
+) -> list[dict[str, np.ndarray]]:
+    """Pure async function - load queries with multiple named vectors as float32 row views"""
+    matrices = await load_query_matrices(dataset, [f"{name}_vector" for name in vector_names], limit)
+    present = {name: matrices[f"{name}_vector"] for name in vector_names if f"{name}_vector" in matrices}
+    query_count = min((len(matrix) for matrix in present.values()), default=0)
 
-    return [{name: rec[f"{name}_vector"] for name in vector_names if f"{name}_vector" in rec} for rec in query_records]
+    return [{name: matrix[i] for name, matrix in present.items()} for i in range(query_count)]
 
 
 async def execute_multi_vector_search_batch(
-    client: AsyncQdrantClient,
-    collection_name: str,
-    queries: list[dict[str, list[float]]],
-    vector_names: list[str],
-    config: WorkloadConfig,
+    client: AsyncQdrantClient, collection_name: str, queries: list[dict[str, np.ndarray]], config: WorkloadConfig
 ) -> WorkloadResult:
-    """Execute batch of multi-vector searches"""
-    start_total = time.perf_counter()
+    """
+    Execute multi-vector searches with the configured load pattern. With fusion, every query
+    prefetches candidates from each named vector and fuses them server-side; without it, or with
+    a single vector, only the first named vector is searched.
+    """
+    if config.processes > 1 and config.concurrency_levels:
+        raise ValueError("concurrency_levels cannot be combined with processes > 1")
+
+    vector_names = list(queries[0]) if queries else []
+    fusion = active_fusion(vector_names, config)
 
-    primary_vector = vector_names[0]
+    if config.processes > 1:
+        # Worker metrics beyond the load summary are not merged, so the stages are profiled here instead
+        result = await execute_in_process_pool(
+            client,
+            collection_name,
+            queries,
+            replace(config, fusion=replace(fusion, profile_stages=False)) if fusion else config,
+            execute_multi_vector_search_batch,
+        )
+        return replace(
+            result,
+            metrics={
+                **result.metrics,
+                **summarize_fusion(vector_names, config),
+                **await profile_fusion(client, collection_name, queries, vector_names, config),
+            },
+        )
 
-    results = [
-        await execute_multi_vector_search(client, collection_name, query_bundle, primary_vector, config)
-        for query_bundle in queries
-    ]
+    requests = [build_multi_vector_query_request(bundle, vector_names, config) for bundle in queries]
 
-    total_duration = time.perf_counter() - start_total
+    if config.batch_size:
+        return await execute_batched_searches(client, collection_name, requests, config)
 
-    predictions = [r["prediction"] for r in results]
-    latencies = [r["latency"] for r in results]
+    async def search(request: models.QueryRequest) -> dict[str, Any]:
+        return await execute_multi_vector_search(client, collection_name, request)
 
-    return WorkloadResult(predictions=predictions, latencies=latencies, total_duration=total_duration)
+    warmup = await warm_up(requests, search, config)
+    start_total = time.perf_counter()
+
+    results, curve = await run_load(requests, search, config)
+
+    total_duration = time.perf_counter() - start_total
+
+    return build_result(
+        config,
+        results,
+        curve,
+        start_total,
+        total_duration,
+        {
+            **warmup,
+            **summarize_fusion(vector_names, config),
+            **await profile_fusion(client, collection_name, queries, vector_names, config),
+        },
+    )
 
 
 async def execute_multi_vector_search(
-    client: AsyncQdrantClient,
-    collection_name: str,
-    query_bundle: dict[str, list[float]],
-    primary_vector: str,
-    config: WorkloadConfig,
+    client: AsyncQdrantClient, collection_name: str, request: models.QueryRequest
 ) -> dict[str, Any]:
     """Execute single multi-vector search with timing"""
     start = time.perf_counter()
 
     with logfire.span("Multi-Vector Search", collection=collection_name):
-        response = await client.query_points(
-            collection_name=collection_name,
-            query=query_bundle[primary_vector],
-            using=primary_vector,
+        points, server_time = await query_with_server_time(client, collection_name, request)
+
+    latency = time.perf_counter() - start
+
+    return {"prediction": points, "latency": latency, **split_latency(latency, server_time)}
+
+
+async def profile_fusion(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    queries: list[dict[str, np.ndarray]],
+    vector_names: list[str],
+    config: WorkloadConfig,
+) -> dict[str, Any]:
+    """Isolated prefetch-stage metrics over a sample of the queries, when the fused run profiles its stages"""
+    fusion = active_fusion(vector_names, config)
+    if fusion is None or not fusion.profile_stages:
+        return {}
+
+    stages = await profile_prefetch_stages(
+        client, collection_name, queries[: fusion.profile_queries], vector_names, config
+    )
+
+    return {"isolated_prefetch_stages": stages} if stages else {}
+
+
+async def profile_prefetch_stages(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    queries: list[dict[str, np.ndarray]],
+    vector_names: list[str],
+    config: WorkloadConfig,
+) -> dict[str, dict[str, float]]:
+    """
+    Latency of each prefetch stage replayed on its own after the measured run, one stage at a
+    time over a warm cache with no other load. These are isolated-stage numbers, not a
+    breakdown of the fused query: its stages run together and share the server.
+    Past the deadline no stage query is sent and stages that sent none are left out.
+    """
+    stages = {}
+
+    async def search(request: models.QueryRequest) -> dict[str, Any]:
+        return await execute_multi_vector_search(client, collection_name, request)
+
+    recorded = record_outcome(search)
+
+    async def bounded(request: models.QueryRequest) -> dict[str, Any]:
+        return {} if config.deadline is not None and time.perf_counter() >= config.deadline else await recorded(request)
+
+    for name in vector_names:
+        requests = [build_stage_request(bundle, name, config) for bundle in queries]
+        results = [r for r in await run_closed_loop(requests, bounded, config.concurrency or 1) if r]
+        if not results:
+            break
+
+        completed = [r for r in results if "error" not in r]
+        stages[name] = {
+            **summarize_latencies(LatencyHistogram.of(r["latency"] for r in completed)),
+            **summarize_latency_components(collect_latency_components(completed)),
+            "queries": len(results),
+            "errors": len(results) - len(completed),
+        }
+
+    return stages
+
+
+def active_fusion(vector_names: list[str], config: WorkloadConfig) -> FusionConfig | None:
+    """Pure function - fusion settings when queries fuse several named vectors, None for plain searches"""
+    return config.fusion if len(vector_names) > 1 else None
+
+
+def summarize_fusion(vector_names: list[str], config: WorkloadConfig) -> dict[str, Any]:
+    """Pure function - the query shape the workload measured"""
+    fusion = active_fusion(vector_names, config)
+    if fusion is None:
+        return {"query_vectors": vector_names[:1]}
+
+    return {
+        "query_vectors": vector_names,
+        "fusion": fusion.method.value,
+        "prefetch_limit": fusion.prefetch_limit or config.k,
+    }
+
+
+def build_multi_vector_query_request(
+    query_bundle: dict[str, np.ndarray], vector_names: list[str], config: WorkloadConfig
+) -> models.QueryRequest:
+    """Pure function - a fused prefetch query over every named vector, or a search of the first one"""
+    fusion = active_fusion(vector_names, config)
+    if fusion is None:
+        return models.QueryRequest(
+            query=query_bundle[vector_names[0]].tolist(),
+            using=vector_names[0],
+            filter=config.query_filter,
             limit=config.k,
             score_threshold=config.score_threshold,
-            search_params=config.to_search_params(),
+            params=config.to_search_params(),
+            with_payload=True,
         )
 
-    latency = time.perf_counter() - start
+    return models.QueryRequest(
+        prefetch=[build_prefetch(query_bundle, name, config) for name in vector_names],
+        query=models.FusionQuery(fusion=models.Fusion(fusion.method.value)),
+        limit=config.k,
+        with_payload=True,
+    )
+
+
+def build_prefetch(query_bundle: dict[str, np.ndarray], name: str, config: WorkloadConfig) -> models.Prefetch:
+    """Pure function - one named vector's candidate stage of a fused query"""
+    return models.Prefetch(
+        query=query_bundle[name].tolist(),
+        using=name,
+        filter=config.query_filter,
+        limit=(config.fusion.prefetch_limit if config.fusion else None) or config.k,
+        score_threshold=config.score_threshold,
+        params=config.to_search_params(),
+    )
+
+
+def build_stage_request(query_bundle: dict[str, np.ndarray], name: str, config: WorkloadConfig) -> models.QueryRequest:
+    """Pure function - a prefetch stage as a standalone query returning the same candidates"""
+    prefetch = build_prefetch(query_bundle, name, config)
 
-    return {"prediction": response.points, "latency": latency}
+    return models.QueryRequest(
+        query=prefetch.query,
+        using=prefetch.using,
+        filter=prefetch.filter,
+        limit=prefetch.limit,
+        score_threshold=prefetch.score_threshold,
+        params=prefetch.params,
+        with_payload=False,
+    )
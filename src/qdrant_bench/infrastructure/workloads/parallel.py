@@ -0,0 +1,160 @@
+import asyncio
+import functools
+import math
+import multiprocessing
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Any
+
+from qdrant_client import AsyncQdrantClient
+
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.domain.services.timeline import QueryTimeline
+from qdrant_bench.infrastructure.workloads.execution import summarize_load
+from qdrant_bench.ports.workload import WorkloadConfig, WorkloadResult
+
+BatchFn = Callable[[AsyncQdrantClient, str, list[Any], WorkloadConfig], Awaitable[WorkloadResult]]
+
+
+async def execute_in_process_pool(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    queries: list[Any],
+    config: WorkloadConfig,
+    batch_fn: BatchFn,
+) -> WorkloadResult:
+    """
+    Fan the query set out to a pool of processes, each with its own event loop and client.
+    Queries are split into contiguous chunks so merged predictions keep their query index.
+    Workers honour the deadline on the shared monotonic clock, but an SLO guard needs every
+    query's latency and recall in one place, so a guard enforcing SLOs is rejected.
+    """
+    if config.guard and config.guard.enforces_slo:
+        raise ValueError("SLO guards cannot be combined with processes > 1")
+
+    chunks = split_queries(queries, config.processes)
+    worker_config = derive_worker_config(config, len(chunks))
+    loop = asyncio.get_running_loop()
+
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn")) as pool:
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    pool, run_worker, client.init_options, collection_name, chunk, worker_config, batch_fn
+                )
+                for chunk in chunks
+            ]
+        )
+
+    merged = merge_workload_results(list(results))
+
+    return replace(
+        merged,
+        metrics={
+            **summarize_load(config, count_completed(merged.predictions), merged.total_duration),
+            **merge_warmups([result.metrics for result in results]),
+            "processes": len(chunks),
+        },
+    )
+
+
+def run_worker(
+    client_options: dict[str, Any],
+    collection_name: str,
+    queries: list[Any],
+    config: WorkloadConfig,
+    batch_fn: BatchFn,
+) -> WorkloadResult:
+    """Process entry point - run one chunk of the workload on a fresh event loop"""
+
+    async def run() -> WorkloadResult:
+        client = AsyncQdrantClient(**client_options)
+        try:
+            return await batch_fn(client, collection_name, queries, config)
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def split_queries(queries: Sequence[Any], processes: int) -> list[list[Any]]:
+    """Pure function - split queries into at most `processes` contiguous, non-empty chunks"""
+    if processes < 1:
+        raise ValueError(f"processes must be at least 1, got {processes}")
+
+    chunk_size = math.ceil(len(queries) / processes) if queries else 1
+
+    return [list(queries[i : i + chunk_size]) for i in range(0, len(queries), chunk_size)]
+
+
+def derive_worker_config(config: WorkloadConfig, workers: int) -> WorkloadConfig:
+    """Pure function - divide the offered load between workers"""
+    return replace(
+        config,
+        processes=1,
+        guard=None,
+        arrival_rate=config.arrival_rate / workers if config.arrival_rate else None,
+        concurrency=math.ceil(config.concurrency / workers) if config.concurrency else None,
+    )
+
+
+def merge_workload_results(results: list[WorkloadResult]) -> WorkloadResult:
+    """
+    Pure function - concatenate per-worker results in chunk order.
+    Workers run side by side, so the slowest worker bounds the load phase; process
+    start-up time is deliberately left out of the duration.
+    """
+    return WorkloadResult(
+        predictions=[prediction for result in results for prediction in result.predictions],
+        latencies=functools.reduce(
+            LatencyHistogram.merge, (result.latencies for result in results), LatencyHistogram()
+        ),
+        total_duration=max((result.total_duration for result in results), default=0.0),
+        timeline=merge_timelines([result.timeline for result in results if result.timeline]),
+        latency_components=merge_latency_components(results),
+    )
+
+
+def count_completed(predictions: list[Any]) -> int:
+    """Pure function - queries that got a response; failed and unsent queries carry no prediction"""
+    return sum(1 for prediction in predictions if prediction is not None)
+
+
+def merge_warmups(worker_metrics: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Pure function - warmup totals across workers, each of which warmed up its own client.
+    Warmup latency percentiles stay per worker and are not merged.
+    """
+    warmups = [metrics for metrics in worker_metrics if "warmup_queries" in metrics]
+    if not warmups:
+        return {}
+
+    return {
+        "warmup_queries": sum(metrics["warmup_queries"] for metrics in warmups),
+        "warmup_errors": sum(metrics["warmup_errors"] for metrics in warmups),
+        "warmup_duration": max(metrics["warmup_duration"] for metrics in warmups),
+        **(
+            {"warmup_steady": all(metrics["warmup_steady"] for metrics in warmups)}
+            if "warmup_steady" in warmups[0]
+            else {}
+        ),
+    }
+
+
+def merge_latency_components(results: list[WorkloadResult]) -> dict[str, LatencyHistogram]:
+    """Pure function - per-component histograms merged across the workers that reported them"""
+    merged: dict[str, LatencyHistogram] = {}
+    for result in results:
+        for component, histogram in result.latency_components.items():
+            merged[component] = merged[component].merge(histogram) if component in merged else histogram
+
+    return merged
+
+
+def merge_timelines(timelines: list[QueryTimeline]) -> QueryTimeline | None:
+    """Pure function - one timeline across workers, which stamp completions with the host's monotonic clock"""
+    if not timelines:
+        return None
+
+    return functools.reduce(QueryTimeline.merge, timelines)
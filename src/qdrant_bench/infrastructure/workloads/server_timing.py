@@ -0,0 +1,71 @@
+from collections.abc import Sequence
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client import grpc as qdrant_grpc
+from qdrant_client.conversions.conversion import GrpcToRest, RestToGrpc
+from qdrant_client.http import models
+
+from qdrant_bench.ports.workload import Transport
+
+
+async def query_with_server_time(
+    client: AsyncQdrantClient, collection_name: str, request: models.QueryRequest
+) -> tuple[list[models.ScoredPoint], float | None]:
+    """
+    Run one query and return its points with the processing time Qdrant reported for it.
+    Both protocols carry that time in the response, but `query_points` drops it, so the
+    raw REST API or gRPC stub is called instead. Local clients report no server time.
+    """
+    protocol = wire_protocol(client)
+
+    if protocol == Transport.GRPC:
+        grpc_response = await client.grpc_points.Query(
+            RestToGrpc.convert_query_request(request, collection_name), timeout=client.init_options.get("timeout")
+        )
+        return [GrpcToRest.convert_scored_point(hit) for hit in grpc_response.result], grpc_response.time
+
+    if protocol == Transport.REST:
+        rest_response = await client.http.search_api.query_points(
+            collection_name=collection_name, query_request=request
+        )
+        return rest_response.result.points if rest_response.result else [], rest_response.time
+
+    responses = await client.query_batch_points(collection_name=collection_name, requests=[request])
+    return responses[0].points, None
+
+
+async def query_batch_with_server_time(
+    client: AsyncQdrantClient, collection_name: str, requests: Sequence[models.QueryRequest]
+) -> tuple[list[list[models.ScoredPoint]], float | None]:
+    """Run a batch of queries in one call and return their points with the server time of the whole call"""
+    protocol = wire_protocol(client)
+
+    if protocol == Transport.GRPC:
+        grpc_response = await client.grpc_points.QueryBatch(
+            qdrant_grpc.QueryBatchPoints(
+                collection_name=collection_name,
+                query_points=[RestToGrpc.convert_query_request(request, collection_name) for request in requests],
+            ),
+            timeout=client.init_options.get("timeout"),
+        )
+        points = [[GrpcToRest.convert_scored_point(hit) for hit in batch.result] for batch in grpc_response.result]
+        return points, grpc_response.time
+
+    if protocol == Transport.REST:
+        rest_response = await client.http.search_api.query_batch_points(
+            collection_name=collection_name, query_request_batch=models.QueryRequestBatch(searches=list(requests))
+        )
+        return [response.points for response in rest_response.result or []], rest_response.time
+
+    responses = await client.query_batch_points(collection_name=collection_name, requests=requests)
+    return [response.points for response in responses], None
+
+
+def wire_protocol(client: AsyncQdrantClient) -> Transport | None:
+    """The protocol the client speaks to a server, None for a local in-process client"""
+    try:
+        client.http  # noqa: B018 - only remote clients expose a raw API
+    except NotImplementedError:
+        return None
+
+    return Transport.GRPC if client.init_options.get("prefer_grpc") else Transport.REST
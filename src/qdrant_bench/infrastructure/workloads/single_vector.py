@@ -1,23 +1,33 @@
-import asyncio
 import time
 from typing import Any
 
 import logfire
+import numpy as np
 from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
 
 from qdrant_bench.domain.entities.core import Dataset
-from qdrant_bench.infrastructure.persistence.dataset_loader import load_query_data
+from qdrant_bench.infrastructure.persistence.dataset_loader import load_query_matrix
+from qdrant_bench.infrastructure.workloads.batched import execute_batched_searches
+from qdrant_bench.infrastructure.workloads.execution import (
+    build_result,
+    run_load,
+    split_latency,
+    warm_up,
+)
+from qdrant_bench.infrastructure.workloads.parallel import execute_in_process_pool
+from qdrant_bench.infrastructure.workloads.server_timing import query_with_server_time
 from qdrant_bench.ports.workload import Workload, WorkloadConfig, WorkloadResult
 
 
 class SingleVectorWorkload(Workload):
-    async def execute(self, client: AsyncQdrantClient, dataset: Dataset, config: WorkloadConfig) -> WorkloadResult:
+    async def execute(
+        self, client: AsyncQdrantClient, collection_name: str, dataset: Dataset, config: WorkloadConfig
+    ) -> WorkloadResult:
         """Execute workload with real data"""
-        collection_name = dataset.name
-
         queries = await load_query_vectors(dataset, config.query_count)
 
-        if not queries:
+        if len(queries) == 0:
             raise ValueError(f"No queries loaded from dataset {dataset.name}")
 
         return await execute_search_batch(
@@ -25,46 +35,60 @@ class SingleVectorWorkload(Workload):
         )
 
 
-async def load_query_vectors(dataset: Dataset, limit: int) -> list[list[float]]:
-    """Pure async function - load query vectors from dataset"""
-    query_records = await load_query_data(dataset, limit)
-
-    return [rec["vector"] for rec in query_records if "vector" in rec]
+async def load_query_vectors(dataset: Dataset, limit: int) -> list[np.ndarray]:
+    """Pure async function - load query vectors from dataset as float32 row views"""
+    return list(await load_query_matrix(dataset, "vector", limit))
 
 
 async def execute_search_batch(
-    client: AsyncQdrantClient, collection_name: str, queries: list[list[float]], config: WorkloadConfig
+    client: AsyncQdrantClient, collection_name: str, queries: list[np.ndarray], config: WorkloadConfig
 ) -> WorkloadResult:
     """Execute batch of searches and collect timing"""
+    if config.processes > 1 and config.concurrency_levels:
+        raise ValueError("concurrency_levels cannot be combined with processes > 1")
+
+    if config.processes > 1:
+        return await execute_in_process_pool(client, collection_name, queries, config, execute_search_batch)
+
+    if config.batch_size:
+        requests = [build_query_request(query, config) for query in queries]
+        return await execute_batched_searches(client, collection_name, requests, config)
+
+    async def search(query: np.ndarray) -> dict[str, Any]:
+        return await execute_single_search(client, collection_name, query, config)
+
+    warmup = await warm_up(queries, search, config)
     start_total = time.perf_counter()
 
-    results = await asyncio.gather(
-        *[execute_single_search(client, collection_name, query, config) for query in queries]
-    )
+    results, curve = await run_load(queries, search, config)
 
     total_duration = time.perf_counter() - start_total
 
-    predictions = [r["prediction"] for r in results]
-    latencies = [r["latency"] for r in results]
-
-    return WorkloadResult(predictions=predictions, latencies=latencies, total_duration=total_duration)
+    return build_result(config, results, curve, start_total, total_duration, warmup)
 
 
 async def execute_single_search(
-    client: AsyncQdrantClient, collection_name: str, query: list[float], config: WorkloadConfig
+    client: AsyncQdrantClient, collection_name: str, query: np.ndarray, config: WorkloadConfig
 ) -> dict[str, Any]:
-    """Execute single search with timing"""
+    """Execute single search with timing, split into server time and overhead where the server reports it"""
+    request = build_query_request(query, config)
     start = time.perf_counter()
 
     with logfire.span("Single Search", collection=collection_name):
-        response = await client.query_points(
-            collection_name=collection_name,
-            query=query,
-            limit=config.k,
-            score_threshold=config.score_threshold,
-            search_params=config.to_search_params(),
-        )
+        points, server_time = await query_with_server_time(client, collection_name, request)
 
     latency = time.perf_counter() - start
 
-    return {"prediction": response.points, "latency": latency}
+    return {"prediction": points, "latency": latency, **split_latency(latency, server_time)}
+
+
+def build_query_request(query: np.ndarray, config: WorkloadConfig) -> models.QueryRequest:
+    """Pure function - a single-vector search as a batch query request"""
+    return models.QueryRequest(
+        query=query.tolist(),
+        filter=config.query_filter,
+        limit=config.k,
+        score_threshold=config.score_threshold,
+        params=config.to_search_params(),
+        with_payload=True,
+    )
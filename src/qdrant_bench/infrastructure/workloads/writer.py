@@ -0,0 +1,254 @@
+import asyncio
+import contextlib
+import itertools
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, cast
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.domain.services.timeline import QueryTimeline
+from qdrant_bench.infrastructure.workloads.execution import build_timeline, summarize_latencies
+
+# Payload marker on every point the writer creates, so leftovers can be found and removed
+WRITER_PAYLOAD_KEY = "qdrant_bench_writer"
+
+VectorPool = np.ndarray | dict[str, np.ndarray]
+
+
+class WriteOperation(str, Enum):
+    UPSERT = "upsert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+def create_default_mix() -> dict[WriteOperation, float]:
+    return {WriteOperation.UPSERT: 0.5, WriteOperation.UPDATE: 0.3, WriteOperation.DELETE: 0.2}
+
+
+@dataclass
+class WriterConfig:
+    """
+    Background write load for a mixed workload: `rate` operations per second on a fixed
+    schedule, each touching `batch_size` points, drawn from `mix` by weight. With `wait`
+    every write returns once applied, so write latency includes the time to apply it.
+    """
+
+    rate: float
+    batch_size: int = 10
+    mix: dict[WriteOperation, float] = field(default_factory=create_default_mix)
+    wait: bool = True
+    seed: int | None = None
+    pool_size: int = 256
+    status_interval: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(f"write rate must be positive, got {self.rate}")
+        if self.batch_size < 1:
+            raise ValueError(f"write batch_size must be at least 1, got {self.batch_size}")
+        if not self.mix or any(weight < 0 for weight in self.mix.values()) or sum(self.mix.values()) <= 0:
+            raise ValueError(f"write mix needs non-negative weights with a positive sum, got {self.mix}")
+
+
+@dataclass
+class BackgroundWriter:
+    """
+    Streams upserts, updates and deletes into a collection on a fixed schedule until stopped,
+    independent of how fast writes complete - a slow server builds a backlog instead of
+    slowing the writer down. Only points the writer created itself are updated or deleted,
+    so the corpus and its ground truth stay intact; new points can still outrank true
+    neighbours, which is the recall cost of a collection that grows while it is searched.
+    """
+
+    config: WriterConfig
+    results: list[dict[str, Any]] = field(default_factory=list)
+    owned: list[models.ExtendedPointId] = field(default_factory=list)
+
+    async def run(self, client: AsyncQdrantClient, collection_name: str, stop: asyncio.Event) -> None:
+        """Send writes until `stop` is set, then wait for the ones in flight"""
+        rng = np.random.default_rng(self.config.seed)
+        pool = await sample_vector_pool(client, collection_name, self.config.pool_size)
+        operations = list(self.config.mix)
+        weights = np.asarray([self.config.mix[operation] for operation in operations], dtype=np.float64)
+        weights /= weights.sum()
+
+        start = time.perf_counter()
+        tasks = []
+
+        for sent in itertools.count():
+            delay = start + sent / self.config.rate - time.perf_counter()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), timeout=delay)
+            if stop.is_set():
+                break
+
+            operation = operations[rng.choice(len(operations), p=weights)]
+            tasks.append(asyncio.create_task(self.write(client, collection_name, operation, pool, rng)))
+
+        self.results.extend(await asyncio.gather(*tasks))
+
+    async def write(
+        self,
+        client: AsyncQdrantClient,
+        collection_name: str,
+        operation: WriteOperation,
+        pool: VectorPool,
+        rng: np.random.Generator,
+    ) -> dict[str, Any]:
+        """Send one write; updates and deletes fall back to an upsert until the writer owns enough points"""
+        count = self.config.batch_size
+        if operation != WriteOperation.UPSERT and len(self.owned) < count:
+            operation = WriteOperation.UPSERT
+
+        ids: list[models.ExtendedPointId]
+        # Deleted ids leave the owned set before the delete is sent, so no update races it
+        if operation == WriteOperation.DELETE:
+            ids = [self.owned.pop(int(rng.integers(len(self.owned)))) for _ in range(count)]
+        elif operation == WriteOperation.UPDATE:
+            ids = [self.owned[int(index)] for index in rng.choice(len(self.owned), size=count, replace=False)]
+        else:
+            ids = [str(uuid.uuid4()) for _ in range(count)]
+
+        start = time.perf_counter()
+        try:
+            await send_write(client, collection_name, operation, ids, mix_vectors(pool, rng, count), self.config.wait)
+        except Exception as e:
+            return {"operation": operation.value, "error": repr(e), "completed_at": time.perf_counter()}
+
+        completed_at = time.perf_counter()
+        # Upserted ids become updatable only once written, so an update never targets a missing point
+        if operation == WriteOperation.UPSERT:
+            self.owned.extend(ids)
+
+        return {
+            "operation": operation.value,
+            "points": count,
+            "latency": completed_at - start,
+            "completed_at": completed_at,
+        }
+
+    def timeline(self, start: float) -> QueryTimeline:
+        """Write completions and latencies on the same clock as the search timeline"""
+        return build_timeline(self.results, start)
+
+    def summary(self, duration: float) -> dict[str, Any]:
+        """Write throughput and latency, overall and per operation"""
+        succeeded = [r for r in self.results if "error" not in r]
+        by_operation = {
+            operation.value: [r for r in succeeded if r["operation"] == operation.value] for operation in WriteOperation
+        }
+
+        return {
+            "write_offered_rate": self.config.rate,
+            "write_ops": len(succeeded),
+            "write_errors": len(self.results) - len(succeeded),
+            "write_points": sum(r["points"] for r in succeeded),
+            "write_achieved_rate": len(succeeded) / duration if duration > 0 else 0.0,
+            "write_ops_by_operation": {name: len(results) for name, results in by_operation.items()},
+            **prefixed("write", summarize_latencies(LatencyHistogram.of(r["latency"] for r in succeeded))),
+            **{
+                key: value
+                for name, results in by_operation.items()
+                for key, value in prefixed(
+                    f"write_{name}", summarize_latencies(LatencyHistogram.of(r["latency"] for r in results))
+                ).items()
+            },
+        }
+
+
+async def send_write(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    operation: WriteOperation,
+    ids: list[models.ExtendedPointId],
+    vectors: VectorPool,
+    wait: bool,
+) -> None:
+    """Helper function - apply one write operation to the given points"""
+    if operation == WriteOperation.DELETE:
+        await client.delete(collection_name=collection_name, points_selector=models.PointIdsList(points=ids), wait=wait)
+        return
+
+    rows = split_vectors(vectors, len(ids))
+
+    if operation == WriteOperation.UPDATE:
+        await client.update_vectors(
+            collection_name=collection_name,
+            points=[models.PointVectors(id=point_id, vector=row) for point_id, row in zip(ids, rows, strict=True)],
+            wait=wait,
+        )
+        return
+
+    await client.upsert(
+        collection_name=collection_name,
+        points=[
+            models.PointStruct(id=point_id, vector=row, payload={WRITER_PAYLOAD_KEY: True})
+            for point_id, row in zip(ids, rows, strict=True)
+        ],
+        wait=wait,
+    )
+
+
+async def sample_vector_pool(client: AsyncQdrantClient, collection_name: str, size: int) -> VectorPool:
+    """Helper function - vectors of up to `size` existing points, the material new points are made from"""
+    points, _ = await client.scroll(collection_name=collection_name, limit=size, with_vectors=True)
+    vectors = [point.vector for point in points if point.vector is not None]
+    if not vectors:
+        raise ValueError(f"Collection '{collection_name}' has no points to derive written vectors from")
+
+    if isinstance(vectors[0], dict):
+        named = cast(list[dict[str, Any]], vectors)
+        return {name: np.asarray([vector[name] for vector in named], dtype=np.float32) for name in named[0]}
+
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def mix_vectors(pool: VectorPool, rng: np.random.Generator, count: int) -> VectorPool:
+    """
+    Pure function - `count` random convex combinations of pairs of pool vectors: new points
+    follow the corpus distribution without duplicating any point in it
+    """
+    size = len(next(iter(pool.values()))) if isinstance(pool, dict) else len(pool)
+    first, second = rng.integers(size, size=count), rng.integers(size, size=count)
+    weights = rng.uniform(0.2, 0.8, size=(count, 1)).astype(np.float32)
+
+    def mix(matrix: np.ndarray) -> np.ndarray:
+        return weights * matrix[first] + (1 - weights) * matrix[second]
+
+    if isinstance(pool, dict):
+        return {name: mix(matrix) for name, matrix in pool.items()}
+
+    return mix(pool)
+
+
+def split_vectors(vectors: VectorPool, count: int) -> list[Any]:
+    """Pure function - one plain vector, or one dict of named vectors, per point"""
+    if isinstance(vectors, dict):
+        return [{name: matrix[i].tolist() for name, matrix in vectors.items()} for i in range(count)]
+
+    return vectors.tolist()
+
+
+def prefixed(prefix: str, metrics: dict[str, float]) -> dict[str, float]:
+    """Pure function - metric names under a prefix, e.g. write_p99_latency"""
+    return {f"{prefix}_{name}": value for name, value in metrics.items()}
+
+
+async def delete_writer_points(client: AsyncQdrantClient, collection_name: str) -> None:
+    """Helper function - remove every point a background writer created"""
+    await client.delete(
+        collection_name=collection_name,
+        points_selector=models.FilterSelector(
+            filter=models.Filter(
+                must=[models.FieldCondition(key=WRITER_PAYLOAD_KEY, match=models.MatchValue(value=True))]
+            )
+        ),
+        wait=True,
+    )
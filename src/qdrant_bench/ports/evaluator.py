@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from typing import Any, Protocol
 
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.domain.services.timeline import QueryTimeline
+
 
 @dataclass
 class GroundTruth:
@@ -15,5 +18,9 @@ class EvaluationResult:
 
 class Evaluator(Protocol):
     def evaluate(
-        self, predictions: list[Any], ground_truth: GroundTruth, latencies: list[float]
+        self,
+        predictions: list[Any],
+        ground_truth: GroundTruth,
+        latencies: LatencyHistogram,
+        timeline: QueryTimeline | None = None,
     ) -> EvaluationResult: ...
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+from datetime import timedelta
 from typing import Protocol
 from uuid import UUID
 
@@ -14,6 +16,9 @@ class RunRepository(Protocol):
     async def save(self, run: Run) -> Run: ...
     async def get(self, id: UUID) -> Run | None: ...
     async def list(self, experiment_id: UUID | None = None, status: str | None = None) -> list[Run]: ...
+    async def claim_next(self) -> Run | None: ...
+    async def renew_lease(self, id: UUID) -> None: ...
+    async def expire_stale_runs(self, lease: timedelta) -> Sequence[Run]: ...
 
 
 class DatasetRepository(Protocol):
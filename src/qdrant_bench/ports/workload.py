@@ -6,6 +6,10 @@ from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 
 from qdrant_bench.domain.entities.core import Dataset
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.domain.services.slo import SloGuard
+from qdrant_bench.domain.services.timeline import QueryTimeline
+from qdrant_bench.domain.services.warmup import WarmupPlan
 
 
 class Distance(str, Enum):
@@ -19,6 +23,21 @@ class ScalarType(str, Enum):
     INT8 = "int8"
 
 
+class ArrivalProcess(str, Enum):
+    FIXED = "fixed"
+    POISSON = "poisson"
+
+
+class Transport(str, Enum):
+    REST = "rest"
+    GRPC = "grpc"
+
+
+class FusionMethod(str, Enum):
+    RRF = "rrf"
+    DBSF = "dbsf"
+
+
 class CompressionRatio(str, Enum):
     X4 = "x4"
     X8 = "x8"
@@ -87,12 +106,40 @@ def create_empty_search_params() -> SearchParams:
     return {}
 
 
+@dataclass
+class FusionConfig:
+    """
+    Hybrid search over several named vectors: one prefetch per vector, fused server-side.
+    Prefetches return `prefetch_limit` candidates each (the workload's k when unset);
+    `profile_stages` also times every prefetch as an isolated query over the first
+    `profile_queries` queries after the run.
+    """
+
+    method: FusionMethod = FusionMethod.RRF
+    prefetch_limit: int | None = None
+    profile_stages: bool = True
+    profile_queries: int = 100
+
+
 @dataclass
 class WorkloadConfig:
     k: int = 10
     query_count: int = 1000
     score_threshold: float | None = None
     search_params: SearchParams = field(default_factory=create_empty_search_params)
+    arrival_rate: float | None = None
+    arrival_process: ArrivalProcess = ArrivalProcess.FIXED
+    seed: int | None = None
+    concurrency: int | None = None
+    concurrency_levels: list[int] = field(default_factory=list)
+    processes: int = 1
+    batch_size: int | None = None
+    guard: SloGuard | None = None
+    # time.perf_counter() value after which no further query is sent
+    deadline: float | None = None
+    warmup: WarmupPlan | None = None
+    fusion: FusionConfig | None = field(default_factory=FusionConfig)
+    query_filter: models.Filter | None = None
 
     def to_search_params(self) -> models.SearchParams:
         """Convert to Qdrant search params model"""
@@ -107,9 +154,14 @@ class WorkloadConfig:
 @dataclass
 class WorkloadResult:
     predictions: list[Any]
-    latencies: list[float]
+    latencies: LatencyHistogram
     total_duration: float
+    metrics: dict[str, Any] = field(default_factory=dict)
+    timeline: QueryTimeline | None = None
+    latency_components: dict[str, LatencyHistogram] = field(default_factory=dict)
 
 
 class Workload(Protocol):
-    async def execute(self, client: AsyncQdrantClient, dataset: Dataset, config: WorkloadConfig) -> WorkloadResult: ...
+    async def execute(
+        self, client: AsyncQdrantClient, collection_name: str, dataset: Dataset, config: WorkloadConfig
+    ) -> WorkloadResult: ...
@@ -1,13 +1,17 @@
+import functools
 import os
 from collections.abc import AsyncGenerator
+from pathlib import Path
 
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from qdrant_bench.application.usecases.connections.gate import ConnectionGate
 from qdrant_bench.application.usecases.connections.manage import CreateConnectionUseCase, ListConnectionsUseCase
 from qdrant_bench.application.usecases.datasets.manage import CreateDatasetUseCase, ListDatasetsUseCase
 from qdrant_bench.application.usecases.experiments.create import CreateExperimentUseCase, ListExperimentsUseCase
 from qdrant_bench.application.usecases.experiments.execute import ExecuteExperimentUseCase
+from qdrant_bench.application.usecases.experiments.filtered import FilteredSearchCache
 from qdrant_bench.application.usecases.reports.generate import GenerateReportUseCase
 from qdrant_bench.application.usecases.runs.trigger import GetRunUseCase, ListRunsUseCase, TriggerRunUseCase
 from qdrant_bench.application.usecases.storage.manage import CreateStorageUseCase, ListStorageUseCase
@@ -17,8 +21,10 @@ from qdrant_bench.infrastructure.persistence.repositories.experiment import SqlA
 from qdrant_bench.infrastructure.persistence.repositories.run import SqlAlchemyRunRepository
 from qdrant_bench.infrastructure.persistence.repositories.storage import SqlAlchemyObjectStorageRepository
 from qdrant_bench.infrastructure.services.deterministic_embedding import DeterministicEmbeddingAdapter
+from qdrant_bench.infrastructure.services.embedding_cache import CachingEmbeddingService, EmbeddingCacheStore
 from qdrant_bench.infrastructure.services.openai_embedding import OpenAIEmbeddingAdapter
 from qdrant_bench.infrastructure.telemetry.qdrant_adapter import QdrantTelemetryAdapter
+from qdrant_bench.ports.embedding_service import EmbeddingService
 from qdrant_bench.presentation.reports.generator import ReportGenerator
 
 
@@ -55,18 +61,19 @@ def get_get_run_usecase(session: AsyncSession = Depends(get_session)) -> GetRunU
     return GetRunUseCase(run_repo)
 
 
-def get_execute_experiment_usecase(session: AsyncSession = Depends(get_session)) -> ExecuteExperimentUseCase:
+def get_connection_gate(request: Request) -> ConnectionGate:
+    return request.app.state.connection_gate
+
+
+def get_execute_experiment_usecase(
+    session: AsyncSession = Depends(get_session), connection_gate: ConnectionGate = Depends(get_connection_gate)
+) -> ExecuteExperimentUseCase:
     run_repo = SqlAlchemyRunRepository(session)
     experiment_repo = SqlAlchemyExperimentRepository(session)
     dataset_repo = SqlAlchemyDatasetRepository(session)
     connection_repo = SqlAlchemyConnectionRepository(session)
 
-    embedding_backend = os.getenv("QDRANT_BENCH_EMBEDDING_BACKEND", "openai")
-    embedding_service = (
-        DeterministicEmbeddingAdapter()
-        if embedding_backend == "deterministic"
-        else OpenAIEmbeddingAdapter(api_key=os.getenv("OPENAI_API_KEY", ""))
-    )
+    embedding_service = create_embedding_service()
     qdrant_cloud_api_key = os.getenv("QDRANT_API_KEY", "")
     telemetry_adapter = QdrantTelemetryAdapter(cloud_api_key=qdrant_cloud_api_key)
 
@@ -77,9 +84,54 @@ def get_execute_experiment_usecase(session: AsyncSession = Depends(get_session))
         connection_repo=connection_repo,
         embedding_service=embedding_service,
         telemetry_adapter=telemetry_adapter,
+        connection_gate=connection_gate,
+        filtered_searches=get_filtered_search_cache(),
     )
 
 
+def create_embedding_service() -> EmbeddingService:
+    """Embedding backend selected by environment, behind the on-disk cache when one is configured"""
+    embedding_backend = os.getenv("QDRANT_BENCH_EMBEDDING_BACKEND", "openai")
+    embedding_service: EmbeddingService = (
+        DeterministicEmbeddingAdapter()
+        if embedding_backend == "deterministic"
+        else OpenAIEmbeddingAdapter(api_key=os.getenv("OPENAI_API_KEY", ""))
+    )
+    store = get_embedding_cache_store()
+    if store:
+        embedding_service = CachingEmbeddingService(inner=embedding_service, store=store)
+
+    return embedding_service
+
+
+@functools.cache
+def get_filtered_search_cache() -> FilteredSearchCache:
+    """The process-wide filtered ground truth cache, so runs repeating a filtered search skip recomputing it"""
+    return FilteredSearchCache()
+
+
+@functools.cache
+def get_embedding_cache_store() -> EmbeddingCacheStore | None:
+    """The process-wide embedding cache store, None when no cache directory is configured"""
+    embedding_cache_dir = os.getenv("QDRANT_BENCH_EMBEDDING_CACHE_DIR")
+    if not embedding_cache_dir:
+        return None
+
+    return EmbeddingCacheStore(
+        directory=Path(embedding_cache_dir),
+        max_bytes=int(os.getenv("QDRANT_BENCH_EMBEDDING_CACHE_MAX_BYTES", str(2 * 1024**3))),
+    )
+
+
+def close_embedding_cache_store() -> None:
+    """Close the process-wide store, if one was opened; the next use opens a fresh one"""
+    if get_embedding_cache_store.cache_info().currsize:
+        store = get_embedding_cache_store()
+        if store:
+            store.close()
+        get_embedding_cache_store.cache_clear()
+
+
 def get_create_connection_usecase(session: AsyncSession = Depends(get_session)) -> CreateConnectionUseCase:
     return CreateConnectionUseCase(SqlAlchemyConnectionRepository(session))
 
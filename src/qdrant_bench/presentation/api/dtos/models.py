@@ -25,7 +25,7 @@ class ExperimentResponse(BaseModel):
 
 
 class TriggerRunRequest(BaseModel):
-    pass  # No body needed for now, experiment_id is in path
+    priority: int = 0  # Higher runs are claimed first by workers; experiment_id is in path
 
 
 class RunResponse(BaseModel):
@@ -35,3 +35,4 @@ class RunResponse(BaseModel):
     start_time: datetime | None
     end_time: datetime | None
     metrics: dict[str, Any]
+    priority: int = 0
@@ -6,8 +6,10 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from qdrant_bench.application.usecases.connections.gate import ConnectionGate
 from qdrant_bench.infrastructure.persistence.database import create_db_engine, get_session_maker, init_db
 from qdrant_bench.infrastructure.telemetry import configure_logging
+from qdrant_bench.presentation.api.dependencies import close_embedding_cache_store
 from qdrant_bench.presentation.api.routes import connections, datasets, experiments, reports, runs, storage, system
 
 
@@ -20,11 +22,13 @@ async def lifespan(app: FastAPI):
     await init_db(engine)
     app.state.engine = engine
     app.state.sessionmaker = get_session_maker(engine)
+    app.state.connection_gate = ConnectionGate()
 
     logfire.info("Database initialized")
     yield
 
     # Cleanup
+    close_embedding_cache_store()
     await engine.dispose()
     logfire.info("Stopping Qdrant Bench API")
 
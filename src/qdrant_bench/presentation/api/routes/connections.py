@@ -8,6 +8,7 @@ from qdrant_bench.application.usecases.connections.manage import (
     CreateConnectionUseCase,
     ListConnectionsUseCase,
 )
+from qdrant_bench.domain.entities.core import ConcurrencyPolicy
 from qdrant_bench.presentation.api.dependencies import get_create_connection_usecase, get_list_connections_usecase
 
 
@@ -15,6 +16,8 @@ class CreateConnectionRequest(BaseModel):
     name: str
     url: str
     api_key: str
+    concurrency_policy: ConcurrencyPolicy = ConcurrencyPolicy.SHARED
+    max_concurrent_runs: int | None = None
 
 
 class ConnectionResponse(BaseModel):
@@ -22,6 +25,8 @@ class ConnectionResponse(BaseModel):
     name: str
     url: str
     api_key: str
+    concurrency_policy: ConcurrencyPolicy
+    max_concurrent_runs: int | None
 
 
 router = APIRouter(prefix="/connections", tags=["Connections"])
@@ -30,13 +35,36 @@ router = APIRouter(prefix="/connections", tags=["Connections"])
 @router.get("")
 async def list_connections(use_case: ListConnectionsUseCase = Depends(get_list_connections_usecase)):
     connections = await use_case.execute()
-    return [ConnectionResponse(id=c.id, name=c.name, url=c.url, api_key=c.api_key) for c in connections]
+    return [
+        ConnectionResponse(
+            id=c.id,
+            name=c.name,
+            url=c.url,
+            api_key=c.api_key,
+            concurrency_policy=c.concurrency_policy,
+            max_concurrent_runs=c.max_concurrent_runs,
+        )
+        for c in connections
+    ]
 
 
 @router.post("", status_code=201)
 async def create_connection(
     request: CreateConnectionRequest, use_case: CreateConnectionUseCase = Depends(get_create_connection_usecase)
 ):
-    command = CreateConnectionCommand(name=request.name, url=request.url, api_key=request.api_key)
+    command = CreateConnectionCommand(
+        name=request.name,
+        url=request.url,
+        api_key=request.api_key,
+        concurrency_policy=request.concurrency_policy,
+        max_concurrent_runs=request.max_concurrent_runs,
+    )
     connection = await use_case.execute(command)
-    return ConnectionResponse(id=connection.id, name=connection.name, url=connection.url, api_key=connection.api_key)
+    return ConnectionResponse(
+        id=connection.id,
+        name=connection.name,
+        url=connection.url,
+        api_key=connection.api_key,
+        concurrency_policy=connection.concurrency_policy,
+        max_concurrent_runs=connection.max_concurrent_runs,
+    )
@@ -1,3 +1,4 @@
+import os
 from uuid import UUID
 
 import logfire
@@ -11,28 +12,20 @@ from qdrant_bench.application.usecases.runs.trigger import (
 )
 from qdrant_bench.domain.entities.core import RunStatus
 from qdrant_bench.presentation.api.dependencies import (
-    get_execute_experiment_usecase,
     get_get_run_usecase,
     get_list_runs_usecase,
     get_trigger_run_usecase,
 )
-from qdrant_bench.presentation.api.dtos.models import RunResponse
+from qdrant_bench.presentation.api.dtos.models import RunResponse, TriggerRunRequest
+from qdrant_bench.presentation.worker.main import drain_queue
 
 router = APIRouter(tags=["Runs"])
 
 
-async def execute_run_task(run_id: UUID, request: Request):
-    logfire.info(f"Starting execution for Run ID: {run_id}")
-
-    # We manually construct the session and dependencies for the background task
-    # because `Depends` only works in the request-response cycle context.
-    session_maker = request.app.state.sessionmaker
-
-    async with session_maker() as session:
-        # Use the factory function to get the use case with all dependencies wired
-        use_case = get_execute_experiment_usecase(session)
-
-        await use_case.execute(run_id)
+async def execute_queued_runs(request: Request):
+    # Inline runs are claimed like a worker's, so priority and connection limits still hold
+    logfire.info("Draining queued runs inline")
+    await drain_queue(request.app.state.sessionmaker, request.app.state.connection_gate)
 
 
 @router.post("/experiments/{experiment_id}/runs", status_code=202)
@@ -40,14 +33,19 @@ async def trigger_run(
     experiment_id: UUID,
     background_tasks: BackgroundTasks,
     request: Request,
+    body: TriggerRunRequest | None = None,
     use_case: TriggerRunUseCase = Depends(get_trigger_run_usecase),
 ):
-    command = TriggerRunCommand(experiment_id=experiment_id)
+    command = TriggerRunCommand(experiment_id=experiment_id, priority=body.priority if body else 0)
 
     try:
         run = await use_case.execute(command)
-        # Pass request to task to access app state (sessionmaker)
-        background_tasks.add_task(execute_run_task, run.id, request)
+
+        # Runs are queued in the database for `qdrant-bench worker`; inline mode keeps
+        # single-process setups working by draining the queue inside the API process instead.
+        if os.getenv("QDRANT_BENCH_RUN_EXECUTOR", "worker") == "inline":
+            # Pass request to task to access app state (sessionmaker, connection gate)
+            background_tasks.add_task(execute_queued_runs, request)
 
         return RunResponse(
             id=run.id,
@@ -56,6 +54,7 @@ async def trigger_run(
             start_time=run.start_time,
             end_time=run.end_time,
             metrics=run.metrics,
+            priority=run.priority,
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -76,6 +75,7 @@ async def list_runs(
             start_time=r.start_time,
             end_time=r.end_time,
             metrics=r.metrics,
+            priority=r.priority,
         )
         for r in runs
     ]
@@ -92,5 +92,6 @@ async def get_run(run_id: UUID, use_case: GetRunUseCase = Depends(get_get_run_us
             start_time=run.start_time,
             end_time=run.end_time,
             metrics=run.metrics,
+            priority=run.priority,
         )
     raise HTTPException(status_code=404, detail="Run not found")
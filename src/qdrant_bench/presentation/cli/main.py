@@ -1,6 +1,17 @@
+import asyncio
+import os
+from pathlib import Path
+
 import logfire
 import typer
 
+from qdrant_bench.application.usecases.datasets.ground_truth import (
+    GenerateGroundTruthCommand,
+    GenerateGroundTruthUseCase,
+)
+from qdrant_bench.domain.entities.core import Dataset
+from qdrant_bench.presentation.api.dependencies import close_embedding_cache_store, create_embedding_service
+
 # Create a new Typer app for CLI tools.
 # We don't call logfire.configure() here to avoid side effects when importing;
 # it should be configured in the main entry point.
@@ -12,6 +23,43 @@ def hello(name: str):
     logfire.info(f"Hello command called with name={name}")
     print(f"Hello {name}")
 
+@app.command(name="ground-truth")
+def ground_truth(
+    source_uri: str = typer.Argument(help="Corpus parquet; queries are read from its .queries.parquet sibling."),
+    k: int = typer.Option(100, help="Neighbors per query."),
+    distance: str = typer.Option("COSINE", help="COSINE, DOT, EUCLID or MANHATTAN, as in vector_config."),
+    vector_name: str | None = typer.Option(None, help="Named vector to use instead of the `vector` column."),
+    query_count: int | None = typer.Option(None, help="Only the first N queries."),
+    batch_size: int = typer.Option(10_000, help="Corpus rows scored per block."),
+    embedding_model: str = typer.Option("text-embedding-3-small", help="Model for corpora without vectors."),
+    workers: int = typer.Option(os.cpu_count() or 1, help="Threads scoring query tiles."),
+    memory_limit_mb: int = typer.Option(256, help="Memory for score tiles, shared by all workers."),
+):
+    """Compute exact top-k ground truth for a dataset and write it next to the corpus."""
+    use_case = GenerateGroundTruthUseCase(embedding_service=create_embedding_service())
+    dataset = Dataset(name=Path(source_uri).stem, source_uri=source_uri, schema_config={})
+    command = GenerateGroundTruthCommand(
+        k=k,
+        distance=distance.upper(),
+        vector_name=vector_name,
+        query_count=query_count,
+        batch_size=batch_size,
+        embedding_model=embedding_model,
+        workers=workers,
+        memory_limit_mb=memory_limit_mb,
+    )
+
+    try:
+        summary = asyncio.run(use_case.execute(dataset, command))
+    finally:
+        close_embedding_cache_store()
+
+    logfire.info(f"Ground truth written to {summary.uri}")
+    print(
+        f"Wrote top-{summary.k} neighbors for {summary.queries} queries over {summary.corpus_points} points "
+        f"to {summary.uri} in {summary.duration:.1f}s"
+    )
+
 if __name__ == "__main__":
     logfire.configure()
     app()
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import timedelta
+from uuid import UUID
+
+import logfire
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from qdrant_bench.application.usecases.connections.gate import ConnectionGate
+from qdrant_bench.application.usecases.runs.worker import RUN_LEASE_S, RunWorkerPool
+from qdrant_bench.infrastructure.persistence.database import create_db_engine, get_session_maker, init_db
+from qdrant_bench.infrastructure.persistence.repositories.run import SqlAlchemyRunRepository
+from qdrant_bench.presentation.api.dependencies import close_embedding_cache_store, get_execute_experiment_usecase
+
+
+async def serve(workers: int, poll_interval: float, drain: bool, lease_seconds: float = RUN_LEASE_S) -> None:
+    engine = create_db_engine()
+    await init_db(engine)
+    session_maker = get_session_maker(engine)
+
+    async with session_maker() as session:
+        await expire_stale_runs(SqlAlchemyRunRepository(session), timedelta(seconds=lease_seconds))
+
+    logfire.info(f"Starting run worker with {workers} slots")
+
+    try:
+        await create_worker_pool(
+            session_maker, ConnectionGate(), workers=workers, poll_interval=poll_interval, lease_seconds=lease_seconds
+        ).run(drain=drain)
+    finally:
+        close_embedding_cache_store()
+        await engine.dispose()
+        logfire.info("Stopping run worker")
+
+
+async def drain_queue(
+    session_maker: async_sessionmaker[AsyncSession], connection_gate: ConnectionGate, lease_seconds: float = RUN_LEASE_S
+) -> None:
+    """Execute queued runs on one slot until none can be claimed - the API's inline executor"""
+    await create_worker_pool(session_maker, connection_gate, workers=1, lease_seconds=lease_seconds).run(drain=True)
+
+
+def create_worker_pool(
+    session_maker: async_sessionmaker[AsyncSession],
+    connection_gate: ConnectionGate,
+    workers: int = 4,
+    poll_interval: float = 1.0,
+    lease_seconds: float = RUN_LEASE_S,
+) -> RunWorkerPool:
+    """Worker pool claiming runs from the database - by priority, within each connection's limits - and leasing them"""
+    lease = timedelta(seconds=lease_seconds)
+
+    async def claim_next() -> UUID | None:
+        async with session_maker() as session:
+            repo = SqlAlchemyRunRepository(session)
+            # Runs held by dead workers would otherwise fill connection slots forever
+            await expire_stale_runs(repo, lease)
+            run = await repo.claim_next()
+            return run.id if run else None
+
+    async def renew_lease(run_id: UUID) -> None:
+        async with session_maker() as session:
+            await SqlAlchemyRunRepository(session).renew_lease(run_id)
+
+    async def execute_run(run_id: UUID) -> None:
+        async with session_maker() as session:
+            await get_execute_experiment_usecase(session, connection_gate).execute(run_id)
+
+    return RunWorkerPool(
+        claim_next=claim_next,
+        execute_run=execute_run,
+        workers=workers,
+        poll_interval=poll_interval,
+        renew_lease=renew_lease,
+        lease_interval=lease_seconds / 3,
+    )
+
+
+async def expire_stale_runs(repo: SqlAlchemyRunRepository, lease: timedelta) -> None:
+    for run in await repo.expire_stale_runs(lease):
+        logfire.warn(f"Run {run.id} lost its executor and was marked failed")
+
+
+def main(workers: int = 4, poll_interval: float = 1.0, drain: bool = False, lease_seconds: float = RUN_LEASE_S):
+    try:
+        logfire.configure()
+    except Exception:
+        print("Logfire authentication failed. Continuing without remote telemetry.")
+
+    asyncio.run(serve(workers=workers, poll_interval=poll_interval, drain=drain, lease_seconds=lease_seconds))
@@ -114,9 +114,17 @@ def api_server(docker_compose_up: None) -> Generator[str, None, None]:
         stderr=subprocess.DEVNULL,
     )
 
+    worker = subprocess.Popen(
+        ["uv", "run", "qdrant-bench", "worker", "--workers", "2", "--poll-interval", "0.25"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
     try:
         wait_for_http_ok(f"http://127.0.0.1:{api_port}/api/health", timeout_s=45.0)
         yield f"http://127.0.0.1:{api_port}"
     finally:
-        process.terminate()
-        process.wait(timeout=10)
+        for started in (worker, process):
+            started.terminate()
+            started.wait(timeout=10)
@@ -1,9 +1,11 @@
 """Fake repository implementations for testing"""
 
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from qdrant_bench.domain.entities.core import Connection, Dataset, Experiment, ObjectStorage, Run
+from qdrant_bench.domain.entities.core import Connection, Dataset, Experiment, ObjectStorage, Run, RunStatus
 
 
 @dataclass
@@ -30,6 +32,32 @@ class FakeRunRepository:
 
         return [run for run in runs if all(f(run) for f in filters)]
 
+    async def claim_next(self) -> Run | None:
+        """Claim the highest-priority, oldest CREATED run"""
+        created = [run for run in self.runs.values() if run.status == RunStatus.CREATED]
+        if not created:
+            return None
+
+        run = min(created, key=lambda r: (-r.priority, r.start_time))
+        self.runs[run.id] = replace(run, status=RunStatus.RUNNING, heartbeat_at=datetime.now(UTC))
+        return self.runs[run.id]
+
+    async def renew_lease(self, id: UUID) -> None:
+        run = self.runs.get(id)
+        if run and run.status == RunStatus.RUNNING:
+            self.runs[id] = replace(run, heartbeat_at=datetime.now(UTC))
+
+    async def expire_stale_runs(self, lease: timedelta) -> Sequence[Run]:
+        """Fail RUNNING runs without a heartbeat within the lease"""
+        cutoff = datetime.now(UTC) - lease
+        stale = [
+            replace(run, status=RunStatus.FAILED, end_time=datetime.now(UTC))
+            for run in self.runs.values()
+            if run.status == RunStatus.RUNNING and (run.heartbeat_at is None or run.heartbeat_at < cutoff)
+        ]
+        self.runs.update({run.id: run for run in stale})
+        return stale
+
 
 @dataclass
 class FakeExperimentRepository:
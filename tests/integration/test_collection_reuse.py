@@ -0,0 +1,234 @@
+"""Integration tests for run-scoped collections, their reuse and retention"""
+
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.application.usecases.experiments.config import parse_vector_config
+from qdrant_bench.application.usecases.experiments.execute import ExperimentWorkflow
+from qdrant_bench.application.usecases.experiments.lifecycle import (
+    COLLECTION_CREATED_AT_KEY,
+    COLLECTION_FINGERPRINT_KEY,
+    CollectionPolicy,
+    RunCollections,
+    collection_fingerprint,
+    parse_collection_policy,
+    reuses_collection,
+    run_collection_name,
+)
+from qdrant_bench.domain.entities.core import CollectionRetention, Dataset, Experiment, Run, RunStatus
+from qdrant_bench.domain.services.evaluator import StandardEvaluator
+from qdrant_bench.infrastructure.services.deterministic_embedding import DeterministicEmbeddingAdapter
+from tests.integration.fakes.adapters import FakeTelemetryAdapter
+from tests.integration.fakes.repositories import FakeRunRepository
+
+
+def make_experiment(dataset: Dataset, vector_config: dict, optimizer_config: dict) -> Experiment:
+    return Experiment(
+        name="reuse",
+        dataset_id=dataset.id,
+        connection_id=dataset.id,
+        optimizer_config=optimizer_config,
+        vector_config=vector_config,
+    )
+
+
+DATASET = Dataset(name="reuse", source_uri="/data/corpus.parquet", schema_config={"vector": {"dim": 4}})
+VECTOR_CONFIG = {"size": 4, "distance": "COSINE", "hnsw_config": {"m": 16, "ef_construct": 100}}
+
+
+def test_fingerprint_ignores_search_time_settings():
+    """Changing search params, load shape or k keeps the fingerprint"""
+    base = make_experiment(DATASET, VECTOR_CONFIG, {"indexing_threshold": 100})
+    tuned = make_experiment(
+        DATASET,
+        VECTOR_CONFIG,
+        {"indexing_threshold": 100, "search_params": {"hnsw_ef": 256}, "k": 50, "concurrency": 8},
+    )
+
+    assert collection_fingerprint(DATASET, base) == collection_fingerprint(DATASET, tuned)
+
+
+def test_fingerprint_tracks_index_settings():
+    """HNSW, quantization, optimizer, embedding model and payload index changes all produce a new fingerprint"""
+    base = collection_fingerprint(DATASET, make_experiment(DATASET, VECTOR_CONFIG, {}))
+
+    variants = [
+        make_experiment(DATASET, {**VECTOR_CONFIG, "hnsw_config": {"m": 32, "ef_construct": 100}}, {}),
+        make_experiment(DATASET, {**VECTOR_CONFIG, "quantization_config": {"scalar": {"type": "int8"}}}, {}),
+        make_experiment(DATASET, VECTOR_CONFIG, {"indexing_threshold": 0}),
+        make_experiment(DATASET, VECTOR_CONFIG, {"ingestion": {"embedding_model": "text-embedding-3-large"}}),
+        make_experiment(DATASET, VECTOR_CONFIG, {"filtered_search": {"create_payload_index": True}}),
+    ]
+
+    assert all(collection_fingerprint(DATASET, variant) != base for variant in variants)
+
+
+def test_parse_vector_config_applies_hnsw_and_quantization():
+    """Index settings in vector_config reach the collection's vector params"""
+    params = parse_vector_config({**VECTOR_CONFIG, "quantization_config": {"scalar": {"type": "int8"}}})
+
+    assert params.hnsw_config == models.HnswConfigDiff(m=16, ef_construct=100)
+    assert isinstance(params.quantization_config, models.ScalarQuantization)
+
+
+def make_workflow(client: AsyncQdrantClient) -> ExperimentWorkflow:
+    return ExperimentWorkflow(
+        client=client,
+        embedding_service=DeterministicEmbeddingAdapter(embedding_dim=4),
+        telemetry_adapter=FakeTelemetryAdapter(),
+        evaluator=StandardEvaluator(),
+    )
+
+
+async def create_stamped_collection(client: AsyncQdrantClient, name: str, metadata: dict | None = None) -> None:
+    await client.create_collection(
+        collection_name=name, vectors_config=models.VectorParams(size=4, distance=models.Distance.COSINE)
+    )
+    if metadata:
+        await client.update_collection(collection_name=name, metadata=metadata)
+
+
+@pytest.mark.asyncio
+async def test_collection_is_reused_only_with_matching_fingerprint():
+    """A stamped run collection of the dataset is found for the same config and ignored otherwise"""
+    client = AsyncQdrantClient(location=":memory:")
+    workflow = make_workflow(client)
+    experiment = make_experiment(DATASET, VECTOR_CONFIG, {})
+    fingerprint = collection_fingerprint(DATASET, experiment)
+
+    assert await workflow.find_reusable_collection(DATASET, fingerprint, experiment) is None
+
+    await create_stamped_collection(client, "reuse-run-unfinished")
+    await create_stamped_collection(client, "other-run-built", {COLLECTION_FINGERPRINT_KEY: fingerprint})
+    assert await workflow.find_reusable_collection(DATASET, fingerprint, experiment) is None
+
+    await create_stamped_collection(client, "reuse-run-built", {COLLECTION_FINGERPRINT_KEY: fingerprint})
+    assert await workflow.find_reusable_collection(DATASET, fingerprint, experiment) == "reuse-run-built"
+
+    forced = make_experiment(DATASET, VECTOR_CONFIG, {"reuse_collection": False})
+    assert await workflow.find_reusable_collection(DATASET, fingerprint, forced) is None
+
+
+def test_run_collection_names_are_scoped_to_the_run():
+    """Runs on the same dataset get distinct collections"""
+    first, second = uuid4(), uuid4()
+
+    assert run_collection_name(DATASET, first) != run_collection_name(DATASET, second)
+    assert run_collection_name(DATASET, first).startswith("reuse-run-")
+
+
+def test_parse_collection_policy():
+    """Retention defaults to keeping one collection per dataset; a null bound keeps them all"""
+    assert parse_collection_policy({}) == CollectionPolicy(max_retained=1)
+    assert parse_collection_policy({"max_retained_collections": None}).max_retained is None
+    assert parse_collection_policy(
+        {"collection_retention": "keep_on_failure", "max_retained_collections": 2}
+    ) == CollectionPolicy(retention=CollectionRetention.KEEP_ON_FAILURE, max_retained=2)
+
+
+@pytest.mark.asyncio
+async def test_retention_deletes_or_keeps_by_outcome():
+    """keep_on_failure drops successful collections and keeps failed ones for inspection"""
+    client = AsyncQdrantClient(location=":memory:")
+    workflow = make_workflow(client)
+    policy = CollectionPolicy(retention=CollectionRetention.KEEP_ON_FAILURE)
+
+    await create_stamped_collection(client, "reuse-run-ok")
+    await create_stamped_collection(client, "reuse-run-failed")
+
+    await workflow.retire_collection("reuse-run-ok", DATASET, policy, succeeded=True)
+    await workflow.retire_collection("reuse-run-failed", DATASET, policy, succeeded=False)
+
+    assert not await client.collection_exists("reuse-run-ok")
+    assert await client.collection_exists("reuse-run-failed")
+
+
+@pytest.mark.asyncio
+async def test_retention_prunes_oldest_built_collections():
+    """Only the newest max_retained built collections of the dataset survive"""
+    client = AsyncQdrantClient(location=":memory:")
+    workflow = make_workflow(client)
+
+    for age, name in enumerate(["reuse-run-new", "reuse-run-mid", "reuse-run-old"]):
+        await create_stamped_collection(
+            client, name, {COLLECTION_FINGERPRINT_KEY: name, COLLECTION_CREATED_AT_KEY: 100.0 - age}
+        )
+    await create_stamped_collection(client, "reuse-run-current", {COLLECTION_FINGERPRINT_KEY: "current"})
+
+    await workflow.retire_collection("reuse-run-current", DATASET, CollectionPolicy(max_retained=2), succeeded=True)
+
+    remaining = {c.name for c in (await client.get_collections()).collections}
+    assert remaining == {"reuse-run-current", "reuse-run-new"}
+
+
+@pytest.mark.asyncio
+async def test_retention_spares_collections_in_use_and_prunes_unstamped_ones():
+    """A collection another running run searches survives pruning and deletion; unfinished leftovers go first"""
+    client = AsyncQdrantClient(location=":memory:")
+    run_repo = FakeRunRepository()
+    current, other = Run(experiment_id=uuid4(), status=RunStatus.RUNNING), Run(experiment_id=uuid4())
+    await run_repo.save(current)
+    await run_repo.save(other)
+    workflow = make_workflow(client)
+    workflow.run_collections = RunCollections(run_repo, current.id)
+
+    await create_stamped_collection(client, "reuse-run-shared", {COLLECTION_FINGERPRINT_KEY: "shared"})
+    await create_stamped_collection(client, "reuse-run-leftover")
+    await create_stamped_collection(client, "reuse-run-current", {COLLECTION_FINGERPRINT_KEY: "current"})
+    await RunCollections(run_repo, other.id).claim("reuse-run-shared")
+    await run_repo.save(replace(await run_repo.get(other.id), status=RunStatus.RUNNING))
+
+    await workflow.retire_collection("reuse-run-current", DATASET, CollectionPolicy(), succeeded=True)
+    await workflow.retire_collection(
+        "reuse-run-shared", DATASET, CollectionPolicy(retention=CollectionRetention.DELETE), succeeded=True
+    )
+
+    remaining = {c.name for c in (await client.get_collections()).collections}
+    assert remaining == {"reuse-run-current", "reuse-run-shared"}
+
+
+@pytest.mark.asyncio
+async def test_reused_collection_is_claimed_by_the_run():
+    """A run records the collection it searches before using it; one dropped meanwhile is not reused"""
+    client = AsyncQdrantClient(location=":memory:")
+    run_repo = FakeRunRepository()
+    run = await run_repo.save(Run(experiment_id=uuid4(), status=RunStatus.RUNNING))
+    workflow = make_workflow(client)
+    workflow.run_collections = RunCollections(run_repo, run.id)
+    experiment = make_experiment(DATASET, VECTOR_CONFIG, {})
+    fingerprint = collection_fingerprint(DATASET, experiment)
+    await create_stamped_collection(client, "reuse-run-built", {COLLECTION_FINGERPRINT_KEY: fingerprint})
+
+    reused = await workflow.select_collection("reuse-run-own", DATASET, fingerprint, experiment)
+
+    assert reused == "reuse-run-built"
+    assert await RunCollections(run_repo, uuid4()).in_use() == {"reuse-run-built"}
+
+
+@pytest.mark.asyncio
+async def test_servers_without_metadata_skip_reuse(monkeypatch: pytest.MonkeyPatch):
+    """A server that rejects collection metadata leaves the collection unstamped instead of failing the run"""
+    client = AsyncQdrantClient(location=":memory:")
+    workflow = make_workflow(client)
+    await create_stamped_collection(client, "reuse-run-old-server")
+
+    async def reject_metadata(**_kwargs):
+        raise ValueError("unknown field `metadata`")
+
+    monkeypatch.setattr(client, "update_collection", reject_metadata)
+
+    await workflow.stamp_collection("reuse-run-old-server", "fingerprint")
+
+    experiment = make_experiment(DATASET, VECTOR_CONFIG, {})
+    assert await workflow.find_reusable_collection(DATASET, "fingerprint", experiment) is None
+
+
+def test_reuse_is_opt_out():
+    """Collections are reused and stamped unless reuse_collection is false or the run writes into them"""
+    assert reuses_collection({})
+    assert not reuses_collection({"reuse_collection": False})
+    assert not reuses_collection({"mixed_workload": {"write_rate": 10}})
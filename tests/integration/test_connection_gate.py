@@ -0,0 +1,78 @@
+"""Integration tests for per-connection run admission"""
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from qdrant_bench.application.usecases.connections.gate import ConnectionGate
+from qdrant_bench.domain.entities.core import ConcurrencyPolicy, Connection
+
+
+async def occupy(gate: ConnectionGate, connection: Connection, log: list[str], name: str) -> None:
+    async with gate.hold(connection):
+        log.append(f"{name}:start")
+        await asyncio.sleep(0.01)
+        log.append(f"{name}:end")
+
+
+@pytest.mark.asyncio
+async def test_shared_connection_runs_overlap():
+    """Runs on a shared connection execute side by side"""
+    gate = ConnectionGate()
+    connection = Connection(name="shared", url="http://localhost:6333", api_key="")
+    log: list[str] = []
+
+    await asyncio.gather(occupy(gate, connection, log, "a"), occupy(gate, connection, log, "b"))
+
+    assert log[:2] == ["a:start", "b:start"]
+
+
+@pytest.mark.asyncio
+async def test_exclusive_connection_serializes_runs():
+    """Runs on an exclusive connection never overlap"""
+    gate = ConnectionGate()
+    connection = Connection(
+        name="exclusive", url="http://localhost:6333", api_key="", concurrency_policy=ConcurrencyPolicy.EXCLUSIVE
+    )
+    log: list[str] = []
+
+    await asyncio.gather(occupy(gate, connection, log, "a"), occupy(gate, connection, log, "b"))
+
+    assert log == ["a:start", "a:end", "b:start", "b:end"]
+
+
+@pytest.mark.asyncio
+async def test_connections_are_gated_independently():
+    """An exclusive run only blocks its own connection"""
+    gate = ConnectionGate()
+    exclusive = Connection(
+        name="exclusive", url="http://a:6333", api_key="", concurrency_policy=ConcurrencyPolicy.EXCLUSIVE
+    )
+    other = Connection(name="other", url="http://b:6333", api_key="")
+    log: list[str] = []
+
+    await asyncio.gather(occupy(gate, exclusive, log, "a"), occupy(gate, other, log, "b"))
+
+    assert log[:2] == ["a:start", "b:start"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_exclusive_waiter_releases_shared_runs():
+    """An exclusive run cancelled while waiting no longer holds back shared runs"""
+    gate = ConnectionGate()
+    exclusive = Connection(
+        name="exclusive", url="http://a:6333", api_key="", concurrency_policy=ConcurrencyPolicy.EXCLUSIVE
+    )
+    shared = replace(exclusive, concurrency_policy=ConcurrencyPolicy.SHARED)
+    log: list[str] = []
+
+    async with gate.hold(shared):
+        waiter = asyncio.create_task(occupy(gate, exclusive, log, "exclusive"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+    await asyncio.wait_for(occupy(gate, shared, log, "shared"), timeout=1)
+
+    assert log == ["shared:start", "shared:end"]
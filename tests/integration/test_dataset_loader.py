@@ -1,8 +1,16 @@
 """Integration tests for dataset loader functions"""
 
+import numpy as np
+import polars as pl
+import pytest
+
+from qdrant_bench.domain.entities.core import Dataset
 from qdrant_bench.infrastructure.persistence.dataset_loader import (
     derive_ground_truth_uri,
     derive_query_uri,
+    extract_vector_matrix,
+    iter_from_uri,
+    load_query_matrices,
     parse_s3_uri,
 )
 from tests.integration.fixtures import create_multi_vector_dataset, create_test_dataset
@@ -101,3 +109,81 @@ def test_multi_vector_dataset_fixture_has_valid_schema():
     assert "image" in dataset.schema_config["vectors"]
     assert dataset.schema_config["vectors"]["text"]["dim"] == 384
     assert dataset.schema_config["vectors"]["image"]["dim"] == 512
+
+
+@pytest.mark.asyncio
+async def test_iter_from_uri_streams_local_parquet_in_batches(tmp_path):
+    """Local parquet is streamed in bounded record batches"""
+    corpus_path = tmp_path / "corpus.parquet"
+    pl.DataFrame({"text": [f"doc {i}" for i in range(25)]}).write_parquet(str(corpus_path), row_group_size=10)
+
+    batches = [batch async for batch in iter_from_uri(str(corpus_path), batch_size=10, limit=None)]
+
+    assert [batch.height for batch in batches] == [10, 10, 5]
+    assert batches[2]["text"].to_list() == [f"doc {i}" for i in range(20, 25)]
+
+
+@pytest.mark.asyncio
+async def test_iter_from_uri_scans_the_file_once(tmp_path, monkeypatch):
+    """With the default row-group layout every batch comes from one streaming query, not a query per batch"""
+    corpus_path = tmp_path / "corpus.parquet"
+    pl.DataFrame({"text": [f"doc {i}" for i in range(1_000)]}).write_parquet(str(corpus_path))
+    queries = []
+    collect, collect_batches = pl.LazyFrame.collect, pl.LazyFrame.collect_batches
+    monkeypatch.setattr(pl.LazyFrame, "collect", lambda self, *a, **kw: queries.append(1) or collect(self, *a, **kw))
+    monkeypatch.setattr(
+        pl.LazyFrame,
+        "collect_batches",
+        lambda self, *a, **kw: queries.append(1) or collect_batches(self, *a, **kw),
+    )
+
+    batches = [batch async for batch in iter_from_uri(str(corpus_path), batch_size=10, limit=None)]
+
+    assert len(batches) == 100
+    assert pl.concat(batches)["text"].to_list() == [f"doc {i}" for i in range(1_000)]
+    assert len(queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_from_uri_respects_limit(tmp_path):
+    """Streaming stops at the row limit"""
+    corpus_path = tmp_path / "corpus.parquet"
+    pl.DataFrame({"text": [f"doc {i}" for i in range(25)]}).write_parquet(str(corpus_path))
+
+    batches = [batch async for batch in iter_from_uri(str(corpus_path), batch_size=4, limit=6)]
+
+    assert [batch.height for batch in batches] == [4, 2]
+
+
+def test_extract_vector_matrix_views_fixed_size_float32_column():
+    """Fixed-size float32 vector columns are exposed as a matrix without copying"""
+    vectors = np.arange(12, dtype=np.float32).reshape(3, 4)
+    frame = pl.DataFrame({"vector": pl.Series("vector", vectors)})
+
+    matrix = extract_vector_matrix(frame, "vector")
+
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (3, 4)
+    assert np.shares_memory(matrix, frame.get_column("vector").to_numpy())
+
+
+def test_extract_vector_matrix_packs_list_columns():
+    """Variable-length list columns are packed into a float32 matrix"""
+    frame = pl.DataFrame({"vector": [[1.0, 2.0], [3.0, 4.0]]})
+
+    matrix = extract_vector_matrix(frame, "vector")
+
+    assert matrix.dtype == np.float32
+    assert matrix.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+@pytest.mark.asyncio
+async def test_load_query_matrices_skips_absent_columns(tmp_path):
+    """Only vector columns present in the query file are returned"""
+    pl.DataFrame({"text_vector": [[0.5, 0.5]] * 3}).write_parquet(str(tmp_path / "corpus.queries.parquet"))
+    dataset = Dataset(name="d", source_uri=str(tmp_path / "corpus.parquet"), schema_config={})
+
+    matrices = await load_query_matrices(dataset, ["text_vector", "image_vector"], limit=2)
+
+    assert list(matrices) == ["text_vector"]
+    assert matrices["text_vector"].shape == (2, 2)
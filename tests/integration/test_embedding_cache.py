@@ -0,0 +1,121 @@
+"""Integration tests for the persistent embedding cache"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from qdrant_bench.application.usecases.experiments.lifecycle import summarize_embedding_cache
+from qdrant_bench.infrastructure.services.deterministic_embedding import DeterministicEmbeddingAdapter
+from qdrant_bench.infrastructure.services.embedding_cache import (
+    CachingEmbeddingService,
+    EmbeddingCacheStats,
+    EmbeddingCacheStore,
+    cache_key,
+)
+from qdrant_bench.presentation.api.dependencies import (
+    close_embedding_cache_store,
+    create_embedding_service,
+    get_embedding_cache_store,
+)
+
+
+class CountingEmbeddingService:
+    def __init__(self) -> None:
+        self.inner = DeterministicEmbeddingAdapter(embedding_dim=4)
+        self.embedded: list[str] = []
+
+    async def embed_text(self, texts: list[str], model: str) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return await self.inner.embed_text(texts, model=model)
+
+
+@pytest.mark.asyncio
+async def test_repeat_embedding_is_served_from_disk(tmp_path: Path):
+    """A second service over the same directory embeds nothing and returns identical vectors"""
+    first_backend = CountingEmbeddingService()
+    first = CachingEmbeddingService(first_backend, EmbeddingCacheStore(tmp_path, max_bytes=1024**2))
+    expected = await first.embed_text(["alpha", "beta", "alpha"], model="m")
+
+    second_backend = CountingEmbeddingService()
+    second = CachingEmbeddingService(second_backend, EmbeddingCacheStore(tmp_path, max_bytes=1024**2))
+    vectors = await second.embed_text(["alpha", "beta", "alpha"], model="m")
+
+    assert first_backend.embedded == ["alpha", "beta"]
+    assert second_backend.embedded == []
+    assert np.allclose(vectors, expected)
+    assert second.stats.hit_ratio == 1.0
+    assert second.stats.bytes_saved == 3 * 4 * 4
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_by_model(tmp_path: Path):
+    """The same text under another model is a miss"""
+    backend = CountingEmbeddingService()
+    service = CachingEmbeddingService(backend, EmbeddingCacheStore(tmp_path, max_bytes=1024**2))
+
+    await service.embed_text(["alpha"], model="small")
+    await service.embed_text(["alpha"], model="large")
+
+    assert backend.embedded == ["alpha", "alpha"]
+    assert service.stats == EmbeddingCacheStats(hits=0, misses=2, bytes_saved=0)
+
+
+def test_store_evicts_least_recently_used_blocks(tmp_path: Path):
+    """Blocks beyond the size bound are evicted oldest-use first"""
+    block = np.ones((16, 8), dtype=np.float32)
+    store = EmbeddingCacheStore(tmp_path, max_bytes=2 * (block.nbytes + 256))
+
+    store.store([f"a{i}" for i in range(16)], block)
+    store.store([f"b{i}" for i in range(16)], block)
+    store.lookup(["a0"])
+    store.store([f"c{i}" for i in range(16)], block)
+
+    assert set(store.lookup(["a0", "b0", "c0"])) == {"a0", "c0"}
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+
+
+def test_cache_key_is_content_addressed():
+    """Keys depend only on model and text"""
+    assert cache_key("m", "text") == cache_key("m", "text")
+    assert cache_key("m", "text") != cache_key("m", "other")
+
+
+def test_summarize_embedding_cache_reports_ratio():
+    """Run metrics carry hit ratio and bytes saved for the ingestion window"""
+    stats = EmbeddingCacheStats(hits=9, misses=3, bytes_saved=900).since(EmbeddingCacheStats(hits=3, misses=3))
+
+    assert summarize_embedding_cache(stats) == {
+        "embedding_cache_hits": 6,
+        "embedding_cache_misses": 0,
+        "embedding_cache_hit_ratio": 1.0,
+        "embedding_cache_bytes_saved": 900,
+    }
+    assert summarize_embedding_cache(None) == {}
+
+
+def test_block_removed_by_another_process_is_a_miss(tmp_path: Path):
+    """A block evicted through a second store over the same directory is reported missing, not raised"""
+    store = EmbeddingCacheStore(tmp_path, max_bytes=1024**2)
+    store.store(["a"], np.ones((1, 4), dtype=np.float32))
+
+    for block in tmp_path.glob("*.npy"):
+        block.unlink()
+
+    assert store.lookup(["a"]) == {}
+
+
+def test_cache_store_is_shared_per_process(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Every embedding service in a process uses one store until it is closed on shutdown"""
+    monkeypatch.setenv("QDRANT_BENCH_EMBEDDING_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("QDRANT_BENCH_EMBEDDING_BACKEND", "deterministic")
+    close_embedding_cache_store()
+
+    first, second = create_embedding_service(), create_embedding_service()
+
+    assert isinstance(first, CachingEmbeddingService) and isinstance(second, CachingEmbeddingService)
+    assert first.store is second.store
+
+    close_embedding_cache_store()
+    assert get_embedding_cache_store() is not first.store
+    close_embedding_cache_store()
@@ -0,0 +1,91 @@
+"""Integration tests for the vectorized retrieval metrics"""
+
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from qdrant_bench.domain.services.evaluator import StandardEvaluator, hit_matrix, id_matrix
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.ports.evaluator import GroundTruth
+
+
+def points(*ids):
+    return [SimpleNamespace(id=point_id) for point_id in ids]
+
+
+def test_metrics_match_hand_computed_values():
+    """Recall, recall@c, nDCG, MRR and overlap agree with their definitions on a small case"""
+    predictions = [points(1, 2, 3), points(7, 8, 4)]
+    ground_truth = GroundTruth(relevant_items={0: {1, 3}, 1: {4, 5}})
+
+    scores = StandardEvaluator().evaluate(predictions, ground_truth, LatencyHistogram.of([0.01, 0.02])).scores
+
+    assert scores["recall"] == pytest.approx(0.75)
+    assert scores["precision"] == pytest.approx(0.5)
+    assert scores["recall@1"] == pytest.approx(0.5)
+    assert scores["recall@3"] == pytest.approx(0.75)
+    assert scores["mrr"] == pytest.approx((1 + 1 / 3) / 2)
+    assert scores["mean_overlap"] == pytest.approx(1.5)
+
+    ideal = 1 + 1 / math.log2(3)
+    expected_ndcg = ((1 + 1 / math.log2(4)) / ideal + (1 / math.log2(4)) / ideal) / 2
+    assert scores["ndcg"] == pytest.approx(expected_ndcg)
+
+
+def test_recall_at_cutoff_is_capped_by_judgment_count():
+    """A perfect top-1 scores recall@1 of 1.0 even with several relevant ids"""
+    ground_truth = GroundTruth(relevant_items={0: set(range(10))})
+
+    scores = StandardEvaluator().evaluate([points(*range(10))], ground_truth, LatencyHistogram.of([0.01])).scores
+
+    assert scores["recall@1"] == 1.0
+    assert scores["recall@10"] == 1.0
+    assert scores["ndcg"] == pytest.approx(1.0)
+
+
+def test_skipped_and_unjudged_queries_are_not_scored():
+    """Queries without a prediction or without ground truth do not dilute the averages"""
+    predictions = [points(1), None, points(9)]
+    ground_truth = GroundTruth(relevant_items={0: {1}, 1: {2}})
+
+    scores = StandardEvaluator().evaluate(predictions, ground_truth, LatencyHistogram.of([0.01])).scores
+
+    assert scores["recall"] == 1.0
+    assert scores["mrr"] == 1.0
+
+
+def test_uuid_and_integer_ids_are_matched():
+    """String point ids match, including integer judgments returned by the client as text"""
+    predictions = [points("a1", "b2"), points("3", "4")]
+    ground_truth = GroundTruth(relevant_items={0: {"b2"}, 1: {3}})
+
+    scores = StandardEvaluator().evaluate(predictions, ground_truth, LatencyHistogram.of([0.01, 0.01])).scores
+
+    assert scores["recall"] == 1.0
+    assert scores["mrr"] == pytest.approx(0.75)
+
+
+def test_hits_only_match_within_the_same_query():
+    """An id relevant to another query is not a hit"""
+    retrieved, retrieved_mask = id_matrix([1, 2], [[1], [2]])
+    judged, judged_mask = id_matrix([2, 1], [[2], [1]])
+
+    assert not hit_matrix(retrieved, retrieved_mask, judged, judged_mask).any()
+
+
+def test_sparse_integer_ids_are_factorized():
+    """Ids too spread out for row offsets still match correctly"""
+    retrieved, retrieved_mask = id_matrix([2**62, 5], [[2**62, 5]])
+    judged, judged_mask = id_matrix([5], [[5]])
+
+    assert np.array_equal(hit_matrix(retrieved, retrieved_mask, judged, judged_mask), [[False, True]])
+
+
+def test_empty_predictions_score_zero():
+    """No predictions yields zero quality rather than an error"""
+    scores = StandardEvaluator().evaluate([], GroundTruth(relevant_items={}), LatencyHistogram.of([])).scores
+
+    assert scores["recall"] == 0.0
+    assert scores["p99_latency"] == 0.0
@@ -0,0 +1,253 @@
+"""Integration tests for filtered search buckets and their exact filtered ground truth"""
+
+import numpy as np
+import polars as pl
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.application.usecases.experiments import filtered as filtered_module
+from qdrant_bench.application.usecases.experiments.config import PhaseBudgets
+from qdrant_bench.application.usecases.experiments.execute import ExperimentWorkflow
+from qdrant_bench.application.usecases.experiments.filtered import (
+    FilteredSearchCache,
+    FilteredSearchPlan,
+    build_query_filter,
+    filtered_search_key,
+    parse_filtered_search_plan,
+    prepare_filtered_search,
+    summarize_filter_bucket,
+)
+from qdrant_bench.application.usecases.experiments.lifecycle import collection_fingerprint
+from qdrant_bench.domain.entities.core import Dataset, Experiment
+from qdrant_bench.domain.services.evaluator import StandardEvaluator
+from qdrant_bench.domain.services.filters import PayloadFilter, derive_filters, pick_filter_field
+from qdrant_bench.infrastructure.persistence.dataset_loader import load_payload_columns
+from qdrant_bench.infrastructure.services.deterministic_embedding import (
+    DeterministicEmbeddingAdapter,
+    deterministic_vector,
+)
+from tests.integration.fakes.adapters import FakeTelemetryAdapter
+
+DIM = 4
+
+
+def test_range_filters_hit_numeric_quantiles():
+    """A numeric field gets `<=` bounds whose achieved selectivity matches the target"""
+    values = np.arange(1_000)
+
+    filters = derive_filters("price", values, [0.5, 0.05, 0.001])
+
+    assert [payload_filter.upper for payload_filter in filters] == [499.0, 49.0, 0.0]
+    assert [payload_filter.selectivity for payload_filter in filters] == [0.5, 0.05, 0.001]
+
+
+def test_match_filters_never_exceed_the_target_when_avoidable():
+    """Categorical values are combined up to the target share; the rarest value is the floor"""
+    values = np.array(["a"] * 60 + ["b"] * 30 + ["c"] * 10, dtype=object)
+
+    half, rare = derive_filters("tag", values, [0.5, 0.01])
+
+    assert (half.any_of, half.selectivity) == (["b", "c"], 0.4)
+    assert (rare.any_of, rare.selectivity) == (["c"], 0.1)
+
+
+def test_missing_values_never_match():
+    """Points without the field are excluded from every bucket"""
+    values = np.array([1.0, np.nan, 2.0, np.nan])
+
+    (payload_filter,) = derive_filters("score", values, [1.0])
+
+    assert payload_filter.matches(values).tolist() == [True, False, True, False]
+    assert payload_filter.selectivity == 0.5
+
+
+def test_invalid_selectivity_is_rejected():
+    """Selectivities outside (0, 1] cannot describe a share of the corpus"""
+    with pytest.raises(ValueError, match="Selectivities"):
+        derive_filters("price", np.arange(10), [0.0, 1.5])
+
+
+def test_numeric_field_is_preferred():
+    """Numeric fields can hit any selectivity, so they win over categorical ones"""
+    columns = {"tag": np.array(["a", "b"], dtype=object), "rank": np.array([1, 2])}
+
+    assert pick_filter_field(columns) == "rank"
+    assert pick_filter_field({"tag": columns["tag"], "flag": np.array([True, False])}) == "tag"
+
+
+def test_query_filter_follows_payload_filter():
+    """Range bounds become `lte` conditions and value sets become MatchAny"""
+    by_range = build_query_filter(PayloadFilter(field="price", target=0.1, selectivity=0.1, upper=9.0))
+    by_value = build_query_filter(PayloadFilter(field="tag", target=0.1, selectivity=0.1, any_of=["c"]))
+
+    assert by_range.must == [models.FieldCondition(key="price", range=models.Range(lte=9.0))]
+    assert by_value.must == [models.FieldCondition(key="tag", match=models.MatchAny(any=["c"]))]
+
+
+@pytest.mark.asyncio
+async def test_bool_field_filters_match_by_value():
+    """Qdrant's MatchAny rejects booleans, so bool buckets match each value and keep the derived share"""
+    flags = np.array([i % 4 == 0 for i in range(20)])
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection(
+        collection_name="flags", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE)
+    )
+    await client.upsert(
+        collection_name="flags",
+        points=models.Batch(
+            ids=list(range(20)), vectors=[[1.0, 0.0]] * 20, payloads=[{"flag": bool(f)} for f in flags]
+        ),
+    )
+
+    for payload_filter in derive_filters("flag", flags, [0.25, 1.0]):
+        query_filter = build_query_filter(payload_filter)
+        kept = await client.count(collection_name="flags", count_filter=query_filter, exact=True)
+
+        assert kept.count == payload_filter.selectivity * 20
+
+
+def test_parse_filtered_search_plan():
+    """Buckets come from the `filtered_search` section, with defaults for a bare section"""
+    assert parse_filtered_search_plan({}) is None
+    assert parse_filtered_search_plan({"filtered_search": {}}) == FilteredSearchPlan()
+    assert parse_filtered_search_plan(
+        {"filtered_search": {"selectivities": [0.2], "field": "tag", "create_payload_index": True}}
+    ) == FilteredSearchPlan(selectivities=[0.2], field="tag", create_payload_index=True)
+
+
+def test_bucket_summary_reports_achieved_selectivity():
+    """Each bucket reports its target, what the filter actually kept, and its quality and latency"""
+    payload_filter = PayloadFilter(field="price", target=0.05, selectivity=0.04, upper=3.0)
+
+    summary = summarize_filter_bucket(payload_filter, {"recall": 0.9, "p99_latency": 0.002, "k": 10})
+
+    assert summary == {
+        "target_selectivity": 0.05,
+        "selectivity": 0.04,
+        "filter": {"field": "price", "range": {"lte": 3.0}},
+        "recall": 0.9,
+        "p99_latency": 0.002,
+    }
+
+
+def write_corpus(tmp_path, points: int, queries: int) -> Dataset:
+    texts = [f"doc-{i}" for i in range(points)]
+    pl.DataFrame({"text": texts, "metadata": [{"rank": i, "tag": f"t{i % 4}"} for i in range(points)]}).write_parquet(
+        tmp_path / "corpus.parquet", row_group_size=16
+    )
+    pl.DataFrame({"vector": [deterministic_vector(f"query-{i}", DIM) for i in range(queries)]}).write_parquet(
+        tmp_path / "corpus.queries.parquet"
+    )
+
+    return Dataset(name="filtered", source_uri=str(tmp_path / "corpus.parquet"), schema_config={"vector": {"dim": DIM}})
+
+
+@pytest.mark.asyncio
+async def test_payload_columns_are_read_from_metadata(tmp_path):
+    """Scalar metadata fields come back as one array per field in point order"""
+    dataset = write_corpus(tmp_path, points=5, queries=1)
+
+    columns = await load_payload_columns(dataset)
+
+    assert columns["rank"].tolist() == [0, 1, 2, 3, 4]
+    assert columns["tag"].tolist() == ["t0", "t1", "t2", "t3", "t0"]
+
+
+@pytest.mark.asyncio
+async def test_filtered_ground_truth_is_exact_top_k_among_kept_points(tmp_path):
+    """Each bucket's neighbors are the brute-force top-k over only the points its filter keeps"""
+    dataset = write_corpus(tmp_path, points=100, queries=6)
+    experiment = Experiment(
+        name="filtered",
+        dataset_id=dataset.id,
+        connection_id=dataset.id,
+        optimizer_config={"k": 3, "filtered_search": {"selectivities": [0.5, 0.1]}},
+        vector_config={"size": DIM, "distance": "COSINE"},
+    )
+
+    filtered = await prepare_filtered_search(dataset, experiment, DeterministicEmbeddingAdapter(embedding_dim=DIM))
+
+    corpus = np.array([deterministic_vector(f"doc-{i}", DIM) for i in range(100)])
+    corpus /= np.linalg.norm(corpus, axis=1, keepdims=True)
+    assert filtered is not None
+    assert filtered.field == "rank"
+    for bucket, upper in zip(filtered.buckets, [49, 9], strict=True):
+        assert bucket.payload_filter.upper == upper
+        for query_id, relevant in bucket.ground_truth.relevant_items.items():
+            query = np.array(deterministic_vector(f"query-{query_id}", DIM))
+            scores = corpus[: upper + 1] @ (query / np.linalg.norm(query))
+            assert relevant == set(np.argsort(-scores)[:3].tolist())
+
+
+def make_filtered_experiment(dataset: Dataset, optimizer_config: dict) -> Experiment:
+    return Experiment(
+        name="filtered",
+        dataset_id=dataset.id,
+        connection_id=dataset.id,
+        optimizer_config=optimizer_config,
+        vector_config={"size": DIM, "distance": "COSINE"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_filtered_ground_truth_is_computed_once_per_fingerprint(tmp_path, monkeypatch):
+    """A run repeating a filtered search reuses the cached buckets instead of streaming the corpus again"""
+    dataset = write_corpus(tmp_path, points=50, queries=4)
+    experiment = make_filtered_experiment(dataset, {"k": 3, "filtered_search": {"selectivities": [0.5]}})
+    scans = []
+    iter_dataset_corpus = filtered_module.iter_dataset_corpus
+
+    def counting_scan(*args, **kwargs):
+        scans.append(args)
+        return iter_dataset_corpus(*args, **kwargs)
+
+    monkeypatch.setattr(filtered_module, "iter_dataset_corpus", counting_scan)
+    workflow = ExperimentWorkflow(
+        client=AsyncQdrantClient(location=":memory:"),
+        embedding_service=DeterministicEmbeddingAdapter(embedding_dim=DIM),
+        telemetry_adapter=FakeTelemetryAdapter(),
+        evaluator=StandardEvaluator(),
+        filtered_searches=FilteredSearchCache(),
+    )
+    fingerprint = collection_fingerprint(dataset, experiment)
+
+    first = await workflow.load_filtered_search(dataset, experiment, fingerprint, PhaseBudgets())
+    assert first is not None
+    first.payload_index_time_ms = 12.0
+    second = await workflow.load_filtered_search(dataset, experiment, fingerprint, PhaseBudgets())
+
+    assert len(scans) == 1
+    assert second is not None
+    assert second.buckets == first.buckets
+    assert second.payload_index_time_ms is None
+    assert (
+        await workflow.load_filtered_search(dataset, make_filtered_experiment(dataset, {}), fingerprint, PhaseBudgets())
+        is None
+    )
+
+
+def test_filtered_search_key_tracks_the_query_set():
+    """Changing k or the query count invalidates cached ground truth; search-time settings do not"""
+    dataset = Dataset(name="filtered", source_uri="/data/corpus.parquet", schema_config={"vector": {"dim": DIM}})
+    base = {"k": 3, "filtered_search": {"selectivities": [0.5]}}
+
+    def key(optimizer_config: dict) -> str:
+        return filtered_search_key("fingerprint", make_filtered_experiment(dataset, optimizer_config))
+
+    assert key(base) == key({**base, "concurrency": 8})
+    assert key(base) != key({**base, "k": 5})
+    assert key(base) != key({**base, "query_count": 10})
+    assert key(base) != key({**base, "filtered_search": {"selectivities": [0.1]}})
+
+
+def test_filtered_search_cache_drops_least_recently_used():
+    """Past max_entries the entry read or written longest ago goes first"""
+    cache = FilteredSearchCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, filtered_module.FilteredSearch(field=key, buckets=[]))
+
+    cache.get("a")
+    cache.put("c", filtered_module.FilteredSearch(field="c", buckets=[]))
+
+    assert list(cache.entries) == ["a", "c"]
@@ -0,0 +1,83 @@
+"""Integration tests for exact ground-truth generation"""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from qdrant_bench.application.usecases.datasets.ground_truth import (
+    GenerateGroundTruthCommand,
+    GenerateGroundTruthUseCase,
+)
+from qdrant_bench.domain.entities.core import Dataset
+from qdrant_bench.domain.services.ground_truth import ExactNeighbors, tile_rows
+from qdrant_bench.infrastructure.persistence.dataset_loader import load_ground_truth
+from tests.integration.fakes.services import FakeEmbeddingService
+
+
+def brute_force(queries: np.ndarray, corpus: np.ndarray, k: int, distance: str) -> np.ndarray:
+    if distance == "COSINE":
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        corpus = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+
+    differences = queries[:, None, :] - corpus[None, :, :]
+    scores = {
+        "COSINE": queries @ corpus.T,
+        "DOT": queries @ corpus.T,
+        "EUCLID": -np.sqrt((differences**2).sum(axis=2)),
+        "MANHATTAN": -np.abs(differences).sum(axis=2),
+    }[distance]
+
+    return np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+
+@pytest.mark.parametrize("distance", ["COSINE", "DOT", "EUCLID", "MANHATTAN"])
+def test_blocked_tiled_search_matches_brute_force(distance):
+    """Streaming the corpus in blocks over small multi-threaded tiles finds the exact neighbors"""
+    rng = np.random.default_rng(7)
+    queries = rng.normal(size=(37, 16)).astype(np.float32)
+    corpus = rng.normal(size=(500, 16)).astype(np.float32)
+
+    neighbors = ExactNeighbors(queries=queries, k=10, distance=distance, workers=4, memory_limit_bytes=16 * 1024)
+    for start in range(0, len(corpus), 64):
+        neighbors.add(start, corpus[start : start + 64])
+
+    assert np.array_equal(neighbors.ids, brute_force(queries, corpus, 10, distance))
+
+
+def test_corpus_smaller_than_k_returns_every_point():
+    """With fewer points than k every point is a neighbor, nearest first"""
+    neighbors = ExactNeighbors(queries=np.array([[1.0, 0.0]]), k=5, distance="DOT", workers=1)
+    neighbors.add(0, np.array([[0.5, 0.0], [2.0, 0.0]]))
+
+    assert neighbors.ids.tolist() == [[1, 0]]
+
+
+def test_manhattan_tiles_budget_for_the_difference_tensor():
+    """Manhattan holds a difference per dimension for every pair, so its tiles shrink with dim"""
+    budget = 64 * 1024**2
+
+    assert tile_rows(1_000, 128, "COSINE", budget) == budget // (1_000 * 4 * 3)
+    assert tile_rows(1_000, 128, "MANHATTAN", budget) == budget // (1_000 * 4 * 131)
+
+
+def test_unknown_distance_is_rejected():
+    """Only distances parse_vector_config accepts are supported"""
+    with pytest.raises(ValueError, match="Unsupported distance"):
+        ExactNeighbors(queries=np.ones((1, 2)), k=1, distance="HAMMING")
+
+
+@pytest.mark.asyncio
+async def test_generated_ground_truth_loads_back(tmp_path):
+    """Generated neighbors are written where load_ground_truth looks for them"""
+    corpus = np.eye(4, dtype=np.float32)
+    pl.DataFrame({"vector": corpus}).write_parquet(tmp_path / "corpus.parquet")
+    pl.DataFrame({"vector": corpus[[2, 0]]}).write_parquet(tmp_path / "corpus.queries.parquet")
+    dataset = Dataset(name="corpus", source_uri=str(tmp_path / "corpus.parquet"), schema_config={})
+
+    summary = await GenerateGroundTruthUseCase(embedding_service=FakeEmbeddingService()).execute(
+        dataset, GenerateGroundTruthCommand(k=1, batch_size=3, workers=2)
+    )
+    ground_truth = await load_ground_truth(dataset)
+
+    assert (summary.queries, summary.corpus_points) == (2, 4)
+    assert ground_truth.relevant_items == {0: {2}, 1: {0}}
@@ -0,0 +1,76 @@
+"""Integration tests for the indexing progress monitor"""
+
+from types import SimpleNamespace
+
+import pytest
+from qdrant_client.http import models
+
+from qdrant_bench.infrastructure.ingestion.indexing import IndexingMonitor, describe_optimizer_status
+
+
+class SequencedCollectionClient:
+    """Returns one collection info per get_collection call, in order"""
+
+    def __init__(self, progress: list[tuple[int, models.CollectionStatus]]):
+        self.infos = [
+            SimpleNamespace(
+                status=status,
+                indexed_vectors_count=indexed,
+                points_count=1000,
+                segments_count=2,
+                optimizer_status=models.OptimizersStatusOneOf.OK,
+            )
+            for indexed, status in progress
+        ]
+        self.calls = 0
+
+    async def get_collection(self, _collection_name):
+        info = self.infos[min(self.calls, len(self.infos) - 1)]
+        self.calls += 1
+        return info
+
+
+@pytest.mark.asyncio
+async def test_monitor_samples_until_green():
+    """Every poll becomes a sample and the last one is the GREEN collection"""
+    client = SequencedCollectionClient(
+        [
+            (0, models.CollectionStatus.YELLOW),
+            (400, models.CollectionStatus.YELLOW),
+            (1000, models.CollectionStatus.GREEN),
+        ]
+    )
+    monitor = IndexingMonitor(min_interval=0.001, max_interval=0.004)
+
+    await monitor.run(client, "docs")  # type: ignore[arg-type]
+
+    assert [sample.indexed_vectors for sample in monitor.samples] == [0, 400, 1000]
+    assert monitor.samples[1].vectors_per_sec > 0
+    assert monitor.samples[-1].status == "green"
+
+
+@pytest.mark.asyncio
+async def test_monitor_summary_reports_timeline_and_queryable_time():
+    """The summary carries the per-sample series and when the collection turned GREEN"""
+    client = SequencedCollectionClient([(0, models.CollectionStatus.YELLOW), (1000, models.CollectionStatus.GREEN)])
+    monitor = IndexingMonitor(min_interval=0.001, max_interval=0.004)
+
+    await monitor.run(client, "docs")  # type: ignore[arg-type]
+    summary = monitor.summary()
+
+    assert len(summary["indexing_timeline"]) == 2
+    assert summary["indexed_vectors"] == 1000
+    assert summary["segments_count"] == 2
+    assert summary["queryable_after_ms"] == summary["indexing_timeline"][-1]["t"] * 1000
+    assert summary["indexing_peak_vectors_per_sec"] == summary["indexing_timeline"][-1]["vectors_per_sec"]
+
+
+def test_empty_monitor_has_no_summary():
+    """A monitor that never sampled adds nothing to the run metrics"""
+    assert IndexingMonitor().summary() == {}
+
+
+def test_optimizer_errors_are_described():
+    """Optimizer failures surface their message in the timeline"""
+    assert describe_optimizer_status(models.OptimizersStatusOneOf.OK) == "ok"
+    assert describe_optimizer_status(models.OptimizersStatusOneOf1(error="disk full")) == "error: disk full"
@@ -0,0 +1,145 @@
+"""Integration tests for the pipelined ingestion stage"""
+
+from collections.abc import AsyncIterator
+
+import numpy as np
+import polars as pl
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.application.usecases.experiments.lifecycle import create_point_batch, create_point_batches
+from qdrant_bench.infrastructure.ingestion.pipeline import IngestionConfig, ingest_point_batches
+
+
+async def point_batches(count: int, batch_size: int) -> AsyncIterator[models.Batch]:
+    for start in range(0, count, batch_size):
+        ids = list(range(start, min(start + batch_size, count)))
+        yield models.Batch(ids=ids, vectors=[[float(i % 7), 1.0, 0.5] for i in ids], payloads=[{"i": i} for i in ids])
+
+
+async def create_in_memory_collection() -> AsyncQdrantClient:
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection(
+        collection_name="ingest", vectors_config=models.VectorParams(size=3, distance=models.Distance.DOT)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_ingest_uploads_every_batch_with_parallel_workers():
+    """All produced points are uploaded across parallel workers"""
+    client = await create_in_memory_collection()
+
+    result = await ingest_point_batches(
+        client, "ingest", point_batches(count=95, batch_size=10), IngestionConfig(parallel=3, queue_size=2)
+    )
+
+    assert result.points == 95
+    assert result.batches == 10
+    assert result.points_per_second > 0
+    assert (await client.count("ingest", exact=True)).count == 95
+
+
+@pytest.mark.asyncio
+async def test_ingest_without_wait_confirms_points_are_visible():
+    """Fire-and-forget upserts are confirmed by counting before returning"""
+    client = await create_in_memory_collection()
+
+    result = await ingest_point_batches(
+        client, "ingest", point_batches(count=20, batch_size=5), IngestionConfig(parallel=2, wait=False)
+    )
+
+    assert result.points == 20
+    assert (await client.count("ingest", exact=True)).count == 20
+
+
+@pytest.mark.asyncio
+async def test_ingest_propagates_producer_failure():
+    """A failing producer aborts the pipeline instead of hanging the workers"""
+    client = await create_in_memory_collection()
+
+    async def failing_batches() -> AsyncIterator[models.Batch]:
+        yield models.Batch(ids=[1], vectors=[[1.0, 0.0, 0.0]])
+        raise RuntimeError("embedding backend unavailable")
+
+    with pytest.raises(ExceptionGroup):
+        await ingest_point_batches(client, "ingest", failing_batches(), IngestionConfig(parallel=2))
+
+
+def test_create_point_batch_uses_consecutive_ids_and_metadata_payloads():
+    """Point batches carry consecutive ids and the metadata column as payload"""
+    record_batch = pl.DataFrame({"text": ["a", "b"], "metadata": [{"lang": "en"}, None]})
+    vectors = np.ones((2, 3), dtype=np.float32)
+
+    batch = create_point_batch(10, vectors, record_batch)
+
+    assert batch.ids == [10, 11]
+    assert batch.vectors == [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]]
+    assert batch.payloads == [{"lang": "en"}, {}]
+
+
+class RecordingEmbeddingService:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def embed_text(self, texts: list[str], model: str) -> list[list[float]]:
+        self.calls.append(texts)
+        return [[float(len(text)), float(len(model)), 0.0] for text in texts]
+
+
+async def record_batches(*frames: pl.DataFrame) -> AsyncIterator[pl.DataFrame]:
+    for frame in frames:
+        yield frame
+
+
+@pytest.mark.asyncio
+async def test_precomputed_vector_column_bypasses_embedding():
+    """A corpus `vector` column is uploaded as-is without calling the embedding service"""
+    embedding_service = RecordingEmbeddingService()
+    frame = pl.DataFrame({"text": ["a", "b"], "vector": [[0.5, 0.25, 1.0], [1.0, 0.0, 0.0]]})
+
+    batches = [b async for b in create_point_batches(record_batches(frame), embedding_service)]
+
+    assert embedding_service.calls == []
+    assert batches[0].vectors == [[0.5, 0.25, 1.0], [1.0, 0.0, 0.0]]
+
+
+@pytest.mark.asyncio
+async def test_text_only_corpus_is_embedded_with_configured_model():
+    """Without vector columns the text is embedded and ids continue across batches"""
+    embedding_service = RecordingEmbeddingService()
+    frames = (pl.DataFrame({"text": ["ab", "c"]}), pl.DataFrame({"text": ["def"]}))
+
+    batches = [b async for b in create_point_batches(record_batches(*frames), embedding_service, model="m")]
+
+    assert embedding_service.calls == [["ab", "c"], ["def"]]
+    assert batches[1].ids == [2]
+    assert batches[1].vectors == [[3.0, 1.0, 0.0]]
+
+
+@pytest.mark.asyncio
+async def test_named_vector_columns_are_uploaded_per_name():
+    """Named vector configs read one `{name}_vector` column per vector"""
+    frame = pl.DataFrame({"image_vector": [[1.0, 0.0]], "text_vector": [[0.0, 1.0, 0.0]]})
+
+    batches = [
+        b
+        async for b in create_point_batches(
+            record_batches(frame), RecordingEmbeddingService(), vector_names=["image", "text"]
+        )
+    ]
+
+    assert batches[0].vectors == {"image": [[1.0, 0.0]], "text": [[0.0, 1.0, 0.0]]}
+
+
+@pytest.mark.asyncio
+async def test_named_vectors_require_precomputed_columns():
+    """Missing named vector columns fail loudly instead of being embedded"""
+    frame = pl.DataFrame({"text": ["a"], "image_vector": [[1.0, 0.0]]})
+
+    with pytest.raises(ValueError, match="text_vector"):
+        async for _ in create_point_batches(
+            record_batches(frame), RecordingEmbeddingService(), vector_names=["image", "text"]
+        ):
+            pass
@@ -0,0 +1,112 @@
+"""Integration tests for splitting query latency into server time and overhead"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from qdrant_client import AsyncQdrantClient
+
+from qdrant_bench.application.usecases.experiments.execute import summarize_search_sweep
+from qdrant_bench.infrastructure.workloads.execution import (
+    collect_latency_components,
+    measure_from,
+    split_latency,
+    summarize_latency_components,
+)
+from qdrant_bench.infrastructure.workloads.server_timing import wire_protocol
+from qdrant_bench.infrastructure.workloads.single_vector import execute_single_search
+from qdrant_bench.ports.workload import Transport, WorkloadConfig
+
+
+class FakeSearchApi:
+    def __init__(self, server_time: float):
+        self.server_time = server_time
+        self.requests = []
+
+    async def query_points(self, collection_name, query_request):
+        self.requests.append((collection_name, query_request))
+        return SimpleNamespace(time=self.server_time, result=SimpleNamespace(points=["hit"]))
+
+
+def test_overhead_is_client_latency_minus_server_time():
+    """Server time and overhead add up to the query's service time"""
+    assert split_latency(0.010, 0.004) == {"server_latency": 0.004, "overhead_latency": pytest.approx(0.006)}
+    assert split_latency(0.010, None) == {}
+
+
+@pytest.mark.asyncio
+async def test_open_loop_reports_queueing_delay_as_its_own_component():
+    """Open-loop latency counts from the scheduled send; the wait before service is queue_latency"""
+
+    async def search():
+        await asyncio.sleep(0.01)
+        return {"prediction": [], "latency": 0.01, **split_latency(0.01, 0.004)}
+
+    result = await measure_from(time.perf_counter() - 0.05, search())
+
+    assert result["queue_latency"] == pytest.approx(result["latency"] - 0.01)
+    assert result["queue_latency"] >= 0.05
+    assert result["server_latency"] + result["overhead_latency"] + result["queue_latency"] == pytest.approx(
+        result["latency"]
+    )
+    assert set(collect_latency_components([result])) == {"server_latency", "overhead_latency", "queue_latency"}
+
+
+@pytest.mark.asyncio
+async def test_rest_search_records_server_reported_time():
+    """A REST search reads the processing time from the response envelope"""
+    search_api = FakeSearchApi(server_time=0.0)
+    client = SimpleNamespace(http=SimpleNamespace(search_api=search_api), init_options={"prefer_grpc": False})
+
+    result = await execute_single_search(client, "bench", np.ones(4, dtype=np.float32), WorkloadConfig(k=3))
+
+    assert result["prediction"] == ["hit"]
+    assert result["server_latency"] == 0.0
+    assert result["overhead_latency"] == pytest.approx(result["latency"])
+    assert search_api.requests[0][1].limit == 3
+
+
+def test_wire_protocol_follows_client_options():
+    """Remote clients report their protocol; local clients have no server to report time"""
+    remote = {"url": "http://localhost:6333", "check_compatibility": False}
+
+    assert wire_protocol(AsyncQdrantClient(**remote, prefer_grpc=True)) == Transport.GRPC
+    assert wire_protocol(AsyncQdrantClient(**remote)) == Transport.REST
+    assert wire_protocol(AsyncQdrantClient(location=":memory:")) is None
+
+
+def test_component_percentiles_skip_queries_without_server_time():
+    """Only results that carry a component feed its percentiles"""
+    results = [
+        {"latency": 0.01, **split_latency(0.01, 0.004)},
+        {"latency": 0.02, **split_latency(0.02, 0.004)},
+        {"latency": 0.03},
+    ]
+
+    summary = summarize_latency_components(collect_latency_components(results))
+
+    assert summary["server_p99_latency"] == pytest.approx(0.004, rel=0.01)
+    assert summary["overhead_p99_latency"] == pytest.approx(0.016, rel=0.01)
+
+
+def test_batch_server_time_is_reported_per_batch():
+    """A batch's server time is a per-batch figure like its headline latency, not spread over its queries"""
+    results = [{"prediction": [[], [], [], []], "latency": 0.02, "server_latency": 0.008}]
+
+    summary = summarize_latency_components(collect_latency_components(results))
+
+    assert summary["server_p99_latency"] == pytest.approx(0.008, rel=0.01)
+
+
+def test_sweep_ranks_on_server_latency_when_reported():
+    """Client-side noise in p95 does not outweigh a faster server time"""
+    points = [
+        {"search_params": {"hnsw_ef": 64}, "recall": 0.95, "p95_latency": 0.004, "server_p95_latency": 0.003},
+        {"search_params": {"hnsw_ef": 128}, "recall": 0.96, "p95_latency": 0.006, "server_p95_latency": 0.002},
+    ]
+
+    summary = summarize_search_sweep(points, target_recall=0.9)
+
+    assert summary["recommended_search_params"] == {"hnsw_ef": 128}
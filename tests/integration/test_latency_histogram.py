@@ -0,0 +1,73 @@
+"""Integration tests for the log-bucketed latency histogram"""
+
+import json
+
+import numpy as np
+import pytest
+
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+
+
+def test_percentiles_stay_within_bucket_precision():
+    """Percentiles match exact nearest-rank values to within the bucket precision"""
+    samples = np.random.default_rng(3).lognormal(mean=-5, sigma=1, size=20_000)
+
+    histogram = LatencyHistogram.of(samples)
+
+    for percentile in (50, 95, 99, 99.9):
+        exact = np.percentile(samples, percentile, method="inverted_cdf")
+        assert histogram.percentile(percentile) == pytest.approx(exact, rel=histogram.precision)
+
+
+def test_mean_and_extremes_are_exact():
+    """Count, mean, min and max are tracked outside the buckets"""
+    histogram = LatencyHistogram.of([0.002, 0.004, 0.009])
+
+    assert histogram.count == 3
+    assert histogram.mean == pytest.approx(0.005)
+    assert histogram.percentile(0) == 0.002
+    assert histogram.percentile(100) == 0.009
+
+
+def test_single_records_match_batch_records():
+    """Recording one at a time lands in the same buckets as a vectorized batch"""
+    samples = [0.0000001, 0.0013, 0.25, 7200.0]
+    one_by_one = LatencyHistogram()
+    for sample in samples:
+        one_by_one.record(sample)
+
+    assert np.array_equal(one_by_one.counts, LatencyHistogram.of(samples).counts)
+
+
+def test_merge_is_lossless():
+    """Merging histograms equals recording every sample into one"""
+    first, second = [0.001, 0.002, 0.5], [0.003, 0.004]
+
+    merged = LatencyHistogram.of(first).merge(LatencyHistogram.of(second))
+    combined = LatencyHistogram.of(first + second)
+
+    assert np.array_equal(merged.counts, combined.counts)
+    assert (merged.count, merged.minimum, merged.maximum) == (5, 0.001, 0.5)
+
+
+def test_merge_rejects_different_layouts():
+    """Buckets only line up between histograms with the same layout"""
+    with pytest.raises(ValueError):
+        LatencyHistogram().merge(LatencyHistogram(precision=0.05))
+
+
+def test_serialized_histogram_round_trips_through_json():
+    """A persisted histogram recomputes the same percentiles"""
+    histogram = LatencyHistogram.of([0.001, 0.01, 0.1, 0.1])
+
+    restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+
+    assert np.array_equal(restored.counts, histogram.counts)
+    assert restored.percentile(99) == histogram.percentile(99)
+    assert restored.mean == histogram.mean
+
+
+def test_empty_histogram_reports_zero():
+    """No samples yields zeros rather than errors"""
+    assert LatencyHistogram().percentile(99) == 0.0
+    assert LatencyHistogram().mean == 0.0
@@ -0,0 +1,134 @@
+"""Integration tests for the mixed read/write workload"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.application.usecases.experiments.mixed import merge_mixed_timeline, parse_writer_config
+from qdrant_bench.domain.services.timeline import QueryTimeline
+from qdrant_bench.infrastructure.ingestion.indexing import IndexingMonitor, IndexingSample
+from qdrant_bench.infrastructure.workloads.writer import (
+    BackgroundWriter,
+    WriteOperation,
+    WriterConfig,
+    delete_writer_points,
+    mix_vectors,
+)
+
+
+async def create_corpus(points: int) -> AsyncQdrantClient:
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection(
+        collection_name="mixed", vectors_config=models.VectorParams(size=4, distance=models.Distance.COSINE)
+    )
+    await client.upsert(
+        collection_name="mixed",
+        points=models.Batch(
+            ids=list(range(points)), vectors=np.random.default_rng(3).normal(size=(points, 4)).tolist()
+        ),
+    )
+
+    return client
+
+
+async def run_writer(client: AsyncQdrantClient, config: WriterConfig, seconds: float) -> BackgroundWriter:
+    writer = BackgroundWriter(config=config)
+    stop = asyncio.Event()
+    asyncio.get_running_loop().call_later(seconds, stop.set)
+
+    await writer.run(client, "mixed", stop)
+
+    return writer
+
+
+def test_parse_writer_config():
+    """The write load comes from the `mixed_workload` section and needs a rate"""
+    config = parse_writer_config({"mixed_workload": {"write_rate": 50, "mix": {"upsert": 1, "delete": 1}}})
+
+    assert parse_writer_config({}) is None
+    assert config == WriterConfig(rate=50, mix={WriteOperation.UPSERT: 1, WriteOperation.DELETE: 1})
+    with pytest.raises(ValueError, match="write_rate"):
+        parse_writer_config({"mixed_workload": {"batch_size": 5}})
+
+
+def test_writer_config_rejects_an_empty_mix():
+    """A mix without positive weight has no operation to send"""
+    with pytest.raises(ValueError, match="mix"):
+        WriterConfig(rate=10, mix={WriteOperation.UPSERT: 0})
+
+
+def test_written_vectors_stay_between_pool_vectors():
+    """New vectors are convex combinations of pool vectors, for plain and named vectors alike"""
+    rng = np.random.default_rng(0)
+    pool = np.array([[0.0, 0.0], [1.0, 1.0]], dtype=np.float32)
+
+    plain = mix_vectors(pool, rng, 50)
+    named = mix_vectors({"text": pool, "image": pool[:, :1]}, rng, 3)
+
+    assert isinstance(plain, np.ndarray) and plain.shape == (50, 2)
+    assert plain.min() >= 0.0 and plain.max() <= 1.0
+    assert isinstance(named, dict) and named["image"].shape == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_writer_leaves_the_corpus_intact():
+    """Updates and deletes only ever touch points the writer created; cleanup removes those"""
+    client = await create_corpus(points=50)
+    config = WriterConfig(rate=200, batch_size=2, seed=7)
+
+    writer = await run_writer(client, config, seconds=0.2)
+
+    summary = writer.summary(duration=0.2)
+    assert summary["write_errors"] == 0
+    assert summary["write_ops"] == len(writer.results) > 10
+    assert set(summary["write_ops_by_operation"]) == {"upsert", "update", "delete"}
+    assert summary["write_ops_by_operation"]["delete"] > 0
+    assert "write_upsert_p99_latency" in summary
+
+    corpus, _ = await client.scroll(
+        "mixed", scroll_filter=models.Filter(must=[models.HasIdCondition(has_id=list(range(50)))]), limit=100
+    )
+    assert len(corpus) == 50
+
+    await delete_writer_points(client, "mixed")
+    assert (await client.count("mixed", exact=True)).count == 50
+
+
+@pytest.mark.asyncio
+async def test_monitor_watches_until_stopped():
+    """Watching samples the collection at a fixed interval regardless of its status"""
+    client = await create_corpus(points=5)
+    monitor = IndexingMonitor()
+    stop = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.1, stop.set)
+
+    await monitor.watch(client, "mixed", stop, start=0.0, interval=0.02)
+
+    assert 3 <= len(monitor.samples) <= 8
+    assert all(sample.points == 5 for sample in monitor.samples)
+
+
+def test_mixed_timeline_lines_up_search_writes_and_status():
+    """Each second shows search load, write load and the status sampled last before it closed"""
+    search = QueryTimeline.of(0.0, [0.5, 1.5], [0.01, 0.02])
+    writes = QueryTimeline.of(0.0, [0.2, 0.4, 2.1], [0.001, float("nan"), 0.003])
+    samples = [
+        IndexingSample(
+            elapsed=e, indexed_vectors=0, points=p, segments=s, status=st, optimizer_status="ok", vectors_per_sec=0.0
+        )
+        for e, p, s, st in [(0.1, 100, 2, "green"), (1.2, 120, 3, "yellow"), (2.5, 130, 2, "green")]
+    ]
+
+    timeline = merge_mixed_timeline(search, writes, samples)
+
+    assert [(w["completed"], w["write_completed"], w["write_errors"]) for w in timeline] == [
+        (1, 1, 1),
+        (1, 0, 0),
+        (0, 1, 0),
+    ]
+    assert [(w["status"], w["segments"]) for w in timeline] == [("green", 2), ("yellow", 3), ("green", 2)]
+    assert timeline[2]["p99_latency"] is None
+    assert timeline[2]["points"] == 130
@@ -0,0 +1,141 @@
+"""Integration tests for the per-second query timeline"""
+
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from qdrant_bench.domain.services.evaluator import StandardEvaluator
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.domain.services.timeline import WINDOW_LATENCY_PRECISION, QueryTimeline
+from qdrant_bench.infrastructure.workloads.execution import build_timeline, run_load
+from qdrant_bench.ports.evaluator import GroundTruth
+from qdrant_bench.ports.workload import WorkloadConfig
+
+
+def test_windows_count_completions_errors_and_stalls():
+    """Each second reports its completions and errors; a stalled second shows as an empty window"""
+    timeline = QueryTimeline.of(
+        start=100.0, completed_at=[100.2, 100.4, 100.9, 102.5], latencies=[0.01, math.nan, 0.03, 0.02]
+    )
+
+    windows = timeline.windows()
+
+    assert [(w["second"], w["completed"], w["errors"]) for w in windows] == [(0.0, 2, 1), (1.0, 0, 0), (2.0, 1, 0)]
+    assert windows[1]["p99_latency"] is None
+    assert (timeline.completed, timeline.errors) == (3, 1)
+
+
+def test_window_percentiles_are_nearest_rank_within_histogram_precision():
+    """Per-window p50/p99 match numpy's nearest-rank percentiles over that window to the window histogram's precision"""
+    rng = np.random.default_rng(5)
+    completed_at = rng.uniform(0.0, 3.0, size=3_000)
+    latencies = rng.lognormal(mean=-5, sigma=1, size=3_000)
+
+    windows = QueryTimeline.of(0.0, completed_at, latencies).windows()
+
+    for window in windows:
+        in_window = latencies[np.floor(completed_at) == window["second"]]
+        assert window["p50_latency"] == pytest.approx(
+            np.percentile(in_window, 50, method="inverted_cdf"), rel=WINDOW_LATENCY_PRECISION
+        )
+        assert window["p99_latency"] == pytest.approx(
+            np.percentile(in_window, 99, method="inverted_cdf"), rel=WINDOW_LATENCY_PRECISION
+        )
+
+
+def test_timeline_keeps_one_aggregate_per_window_not_per_query():
+    """Recording more queries into the same windows grows counts, not the timeline"""
+    timeline = QueryTimeline(start=0.0)
+    for i in range(10_000):
+        timeline.record(i / 10_000 * 2, 0.001 * (1 + i % 7))
+
+    timeline.record_many(np.linspace(0.0, 1.99, 100_000), np.full(100_000, 0.002))
+
+    assert len(timeline.buckets) == 2
+    assert timeline.completed == 110_000
+    # Raw completion times and latencies alone would take 110k * 16 bytes
+    assert len(pickle.dumps(timeline)) < 20_000
+
+
+def test_recorded_and_batched_timelines_agree():
+    """Recording queries one at a time or in a batch yields the same windows"""
+    completed_at = [0.1, 0.5, 1.2, 3.7, 3.9]
+    latencies = [0.01, math.nan, 0.02, 0.03, 0.04]
+    one_by_one = QueryTimeline(start=0.0)
+    for at, latency in zip(completed_at, latencies, strict=True):
+        one_by_one.record(at, latency)
+
+    assert one_by_one.windows() == QueryTimeline.of(0.0, completed_at, latencies).windows()
+    assert (one_by_one.completed, one_by_one.errors, one_by_one.duration) == (4, 1, 3.9)
+
+
+def test_windows_coarsen_to_whole_multiples_only():
+    """Windows merge into wider ones on the same grid; a resolution off the grid is rejected"""
+    timeline = QueryTimeline.of(0.0, [0.5, 1.5, 2.5, 3.5], [0.01] * 4)
+
+    assert [w["completed"] for w in timeline.windows(2.0)] == [2, 2]
+    with pytest.raises(ValueError):
+        timeline.windows(1.5)
+
+
+def test_achieved_qps_is_wall_clock_throughput():
+    """Ten concurrent 1s queries finishing after 1s are 10 qps, not the inverse mean latency of 1 qps"""
+    timeline = QueryTimeline.of(0.0, [1.0] * 10, [1.0] * 10)
+
+    latencies = LatencyHistogram.of([1.0] * 10)
+
+    scores = StandardEvaluator().evaluate([[]] * 10, GroundTruth(relevant_items={}), latencies, timeline).scores
+
+    assert scores["qps"] == pytest.approx(10.0)
+
+
+def test_merged_worker_timelines_share_the_earliest_start():
+    """Merging keeps every query and measures from the first worker's start"""
+    merged = QueryTimeline.of(10.0, [10.5], [0.1]).merge(QueryTimeline.of(11.0, [11.5, 12.0], [0.1, math.nan]))
+
+    assert merged.duration == 2.0
+    assert [w["completed"] for w in merged.windows()] == [1, 1, 0]
+
+
+def test_workers_starting_off_the_grid_merge_exactly():
+    """Workers start at arbitrary times, yet each completion stays in the window it happened in"""
+    first = QueryTimeline.of(10.3, [10.6, 11.2], [0.1, 0.1])
+    second = QueryTimeline.of(10.45, [10.9, 11.1, 12.05], [0.1, 0.2, 0.1])
+
+    merged = first.merge(second)
+
+    assert [(w["completed"], w["p99_latency"]) for w in merged.windows()] == [
+        (2, pytest.approx(0.1, rel=0.02)),
+        (2, pytest.approx(0.2, rel=0.02)),
+        (1, pytest.approx(0.1, rel=0.02)),
+    ]
+    assert first.completed == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_queries_are_recorded_as_errors():
+    """A failing query becomes an error in the timeline instead of ending the run"""
+
+    async def search(query: int) -> dict:
+        if query % 2:
+            raise ConnectionError("throttled")
+        return {"prediction": [query], "latency": 0.001}
+
+    results, _ = await run_load(list(range(6)), search, WorkloadConfig(concurrency=2))
+    timeline = build_timeline(results, start=min(r["completed_at"] for r in results) - 0.001)
+
+    assert [r.get("prediction") for r in results] == [[0], None, [2], None, [4], None]
+    assert (timeline.completed, timeline.errors) == (3, 3)
+
+
+@pytest.mark.asyncio
+async def test_run_fails_when_every_query_fails():
+    """A run with no successful query surfaces the error rather than reporting empty metrics"""
+
+    async def search(_query: int) -> dict:
+        raise LookupError("collection not found")
+
+    with pytest.raises(RuntimeError, match="All 3 queries failed"):
+        await run_load([0, 1, 2], search, WorkloadConfig())
@@ -0,0 +1,104 @@
+"""Integration tests for the run worker pool"""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from qdrant_bench.application.usecases.runs.trigger import TriggerRunCommand, TriggerRunUseCase
+from qdrant_bench.application.usecases.runs.worker import RunWorkerPool
+from qdrant_bench.domain.entities.core import RunStatus
+from tests.integration.fakes.repositories import FakeExperimentRepository, FakeRunRepository
+from tests.integration.fixtures import create_test_experiment
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_claims_runs_by_priority():
+    """Queued runs are claimed highest priority first and each exactly once"""
+    run_repo = FakeRunRepository()
+    experiment_repo = FakeExperimentRepository()
+    experiment = await experiment_repo.save(create_test_experiment(uuid4(), uuid4()))
+    trigger = TriggerRunUseCase(run_repo, experiment_repo)
+
+    low = await trigger.execute(TriggerRunCommand(experiment_id=experiment.id))
+    high = await trigger.execute(TriggerRunCommand(experiment_id=experiment.id, priority=10))
+    executed: list[UUID] = []
+
+    async def claim_next() -> UUID | None:
+        run = await run_repo.claim_next()
+        return run.id if run else None
+
+    async def execute_run(run_id: UUID) -> None:
+        executed.append(run_id)
+
+    await RunWorkerPool(claim_next=claim_next, execute_run=execute_run, workers=1).run(drain=True)
+
+    assert executed == [high.id, low.id]
+    assert all(run.status == RunStatus.RUNNING for run in run_repo.runs.values())
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_bounds_concurrent_runs():
+    """No more runs execute at once than there are worker slots"""
+    queue = [uuid4() for _ in range(10)]
+    in_flight = 0
+    peak = 0
+
+    async def claim_next() -> UUID | None:
+        return queue.pop() if queue else None
+
+    async def execute_run(run_id: UUID) -> None:
+        nonlocal in_flight, peak
+        assert run_id
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+
+    await RunWorkerPool(claim_next=claim_next, execute_run=execute_run, workers=3).run(drain=True)
+
+    assert peak == 3
+    assert queue == []
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_survives_failing_runs():
+    """A failing run is logged and the slot moves on to the next one"""
+    queue = [uuid4() for _ in range(3)]
+    executed: list[UUID] = []
+
+    async def claim_next() -> UUID | None:
+        return queue.pop(0) if queue else None
+
+    async def execute_run(run_id: UUID) -> None:
+        executed.append(run_id)
+        raise RuntimeError("cluster unreachable")
+
+    await RunWorkerPool(claim_next=claim_next, execute_run=execute_run, workers=1).run(drain=True)
+
+    assert len(executed) == 3
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_renews_leases_while_executing():
+    """A run's lease is renewed for as long as it executes, and no longer"""
+    queue = [uuid4()]
+    renewed: list[UUID] = []
+
+    async def claim_next() -> UUID | None:
+        return queue.pop() if queue else None
+
+    async def execute_run(run_id: UUID) -> None:
+        assert run_id
+        await asyncio.sleep(0.05)
+
+    async def renew_lease(run_id: UUID) -> None:
+        renewed.append(run_id)
+
+    await RunWorkerPool(
+        claim_next=claim_next, execute_run=execute_run, workers=1, renew_lease=renew_lease, lease_interval=0.01
+    ).run(drain=True)
+    count = len(renewed)
+    await asyncio.sleep(0.03)
+
+    assert 2 <= count == len(renewed)
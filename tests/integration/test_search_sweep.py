@@ -0,0 +1,61 @@
+"""Integration tests for search-time parameter sweeps"""
+
+import pytest
+
+from qdrant_bench.application.usecases.experiments.config import expand_search_param_grid
+from qdrant_bench.application.usecases.experiments.execute import summarize_search_sweep
+
+
+def test_grid_expands_to_every_combination_over_base_params():
+    """Each combination layers grid values over the base search params"""
+    grid = expand_search_param_grid({"indexed_only": True}, {"hnsw_ef": [32, 128], "exact": [False]})
+
+    assert grid == [
+        {"indexed_only": True, "hnsw_ef": 32, "exact": False},
+        {"indexed_only": True, "hnsw_ef": 128, "exact": False},
+    ]
+
+
+def test_grid_expands_nested_quantization_params():
+    """Quantization rescore and oversampling are swept as nested axes"""
+    grid = expand_search_param_grid(
+        {"quantization": {"ignore": False}}, {"quantization": {"rescore": [True, False], "oversampling": [2.0]}}
+    )
+
+    assert grid == [
+        {"quantization": {"ignore": False, "rescore": True, "oversampling": 2.0}},
+        {"quantization": {"ignore": False, "rescore": False, "oversampling": 2.0}},
+    ]
+
+
+def test_empty_grid_means_no_sweep():
+    """Without a grid the workload runs once with its own search params"""
+    assert expand_search_param_grid({"hnsw_ef": 64}, {}) == []
+
+
+def test_grid_rejects_unknown_search_params():
+    """Index-time settings cannot be swept without a rebuild"""
+    with pytest.raises(ValueError, match="ef_construct"):
+        expand_search_param_grid({}, {"ef_construct": [100, 200]})
+
+
+def test_sweep_recommends_fastest_combination_meeting_recall_target():
+    """The recommendation is the lowest p95 among combinations that reach the target recall"""
+    points = [
+        {"search_params": {"hnsw_ef": 16}, "recall": 0.82, "p95_latency": 0.002, "f1": 0.5},
+        {"search_params": {"hnsw_ef": 64}, "recall": 0.95, "p95_latency": 0.004, "f1": 0.6},
+        {"search_params": {"hnsw_ef": 256}, "recall": 0.99, "p95_latency": 0.009, "f1": 0.7},
+    ]
+
+    summary = summarize_search_sweep(points, target_recall=0.9)
+
+    assert summary["recommended_search_params"] == {"hnsw_ef": 64}
+    assert summary["search_param_sweep"][0] == {"search_params": {"hnsw_ef": 16}, "recall": 0.82, "p95_latency": 0.002}
+
+
+def test_sweep_without_reachable_target_recommends_nothing():
+    """No combination meeting the target yields no recommendation"""
+    points = [{"search_params": {"hnsw_ef": 16}, "recall": 0.5, "p95_latency": 0.001}]
+
+    assert summarize_search_sweep(points, target_recall=0.9)["recommended_search_params"] is None
+    assert "recommended_search_params" not in summarize_search_sweep(points, target_recall=None)
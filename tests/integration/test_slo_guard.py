@@ -0,0 +1,208 @@
+"""Integration tests for phase budgets and SLO guards"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from qdrant_bench.application.usecases.experiments.config import parse_phase_budgets
+from qdrant_bench.application.usecases.experiments.execute import create_slo_guard, summarize_search_sweep
+from qdrant_bench.domain.services.slo import DEADLINE_BREACH, SloGuard
+from qdrant_bench.infrastructure.workloads.execution import run_load, run_queries
+from qdrant_bench.infrastructure.workloads.parallel import execute_in_process_pool
+from qdrant_bench.ports.workload import WorkloadConfig
+
+
+def points(*ids):
+    return [SimpleNamespace(id=point_id) for point_id in ids]
+
+
+def test_latency_guard_trips_once_p99_cannot_recover():
+    """With 100 queries the nearest-rank p99 is the second slowest, so two slow queries settle it"""
+    guard = SloGuard(max_p99_latency=0.1)
+    guard.begin(100)
+
+    guard.observe(0, points(), 0.5)
+    assert not guard.tripped
+
+    guard.observe(1, points(), 0.5)
+    assert guard.breach == "p99 latency above 0.1s"
+
+
+def test_latency_guard_matches_nearest_rank_p99_on_small_runs():
+    """With 10 queries the nearest-rank p99 is the slowest one, so a single slow query settles it"""
+    guard = SloGuard(max_p99_latency=0.1)
+    guard.begin(10)
+
+    guard.observe(0, points(), 0.5)
+
+    assert guard.breach == "p99 latency above 0.1s"
+
+
+def test_recall_guard_trips_once_perfect_remaining_queries_cannot_reach_target():
+    """Recall breaches only when the best case over the remaining queries is below target"""
+    guard = SloGuard(min_recall=0.7, relevant_items={i: {i} for i in range(4)})
+    guard.begin(4)
+
+    guard.observe(0, points(99), 0.01)
+    assert not guard.tripped
+
+    guard.observe(1, points(99), 0.01)
+    assert guard.breach == "recall below 0.7"
+
+
+def test_guard_summary_is_empty_until_tripped():
+    """Metrics only carry an abort reason for runs that were actually stopped"""
+    guard = SloGuard(max_p99_latency=1.0)
+    guard.begin(10)
+    guard.observe(0, points(), 0.01)
+
+    assert guard.summary() == {}
+
+
+def test_expired_deadline_trips_before_any_query():
+    """A guard whose deadline already passed stops the run immediately"""
+    guard = SloGuard(deadline=time.perf_counter() - 1)
+    guard.begin(10)
+
+    assert guard.out_of_time
+
+
+@pytest.mark.asyncio
+async def test_guarded_run_stops_sending_after_breach():
+    """Once the guard trips, remaining queries are skipped and keep their positions empty"""
+    sent = []
+
+    async def search(query):
+        sent.append(query)
+        return {"prediction": points(), "latency": 1.0}
+
+    guard = SloGuard(max_p99_latency=0.1)
+    results = await run_queries(list(range(100)), search, WorkloadConfig(concurrency=1, guard=guard))
+
+    assert len(results) == 100
+    assert len(sent) == 2
+    assert results[2:] == [{}] * 98
+    assert guard.summary() == {"aborted_reason": "p99 latency above 0.1s", "completed_queries": 2}
+
+
+@pytest.mark.asyncio
+async def test_guarded_open_loop_stops_at_deadline():
+    """The open-loop dispatcher stops scheduling queries when the workload budget runs out"""
+
+    async def search(_query):
+        return {"prediction": points(), "latency": 0.001}
+
+    guard = SloGuard(deadline=time.perf_counter() + 0.05)
+    results = await run_queries(list(range(100)), search, WorkloadConfig(arrival_rate=100.0, guard=guard))
+
+    completed = [result for result in results if result]
+    assert len(results) == 100
+    assert 0 < len(completed) < 100
+    assert guard.breach == DEADLINE_BREACH
+
+
+@pytest.mark.asyncio
+async def test_guarded_open_loop_trips_on_queueing_delay():
+    """The guard sees latency from the scheduled send, so a backlog trips it even when each query is fast"""
+    sent = []
+
+    async def search(query):
+        sent.append(query)
+        time.sleep(0.005)  # blocks the event loop, so queries scheduled 1 ms apart queue up behind it
+        return {"prediction": points(), "latency": 0.005}
+
+    guard = SloGuard(max_p99_latency=0.05)
+    results = await run_queries(list(range(100)), search, WorkloadConfig(arrival_rate=1000.0, guard=guard))
+
+    assert guard.breach == "p99 latency above 0.05s"
+    assert len(sent) < 100
+    assert all(result["service_latency"] < 0.05 for result in results if result)
+
+
+@pytest.mark.asyncio
+async def test_slo_guard_is_rejected_where_it_cannot_be_enforced():
+    """Concurrency sweeps and process pools cannot observe every query, so an SLO guard fails loudly there"""
+
+    async def search(_query):
+        return {"prediction": points(), "latency": 0.001}
+
+    guard = SloGuard(max_p99_latency=0.05)
+
+    with pytest.raises(ValueError, match="concurrency_levels"):
+        await run_load(list(range(10)), search, WorkloadConfig(concurrency_levels=[1, 2], guard=guard))
+
+    with pytest.raises(ValueError, match="processes"):
+        await execute_in_process_pool(None, "bench", list(range(10)), WorkloadConfig(processes=2, guard=guard), None)
+
+
+@pytest.mark.asyncio
+async def test_unguarded_run_sends_every_query():
+    """Without a guard the load pattern is unchanged"""
+
+    async def search(_query):
+        await asyncio.sleep(0)
+        return {"prediction": points(), "latency": 1.0}
+
+    results = await run_queries(list(range(10)), search, WorkloadConfig(concurrency=2))
+
+    assert all(results)
+
+
+def test_phase_budgets_are_parsed_in_seconds():
+    """Missing budgets leave their phase unbounded"""
+    budgets = parse_phase_budgets({"budgets": {"ingestion_s": 60, "workload_s": 30}})
+
+    assert (budgets.ingestion, budgets.indexing, budgets.workload) == (60, None, 30)
+
+
+def test_no_slo_and_no_deadline_means_no_guard():
+    """Runs without SLOs or a workload budget are not guarded"""
+    assert create_slo_guard({}, None, None) is None
+    assert create_slo_guard({"max_p99_latency": 0.05}, None, None) is not None
+
+
+def test_sweep_never_recommends_aborted_combinations():
+    """A combination cut short by its guard is reported but not recommended"""
+    sweep = [
+        {"search_params": {"hnsw_ef": 16}, "recall": 0.99, "p95_latency": 0.001, "aborted_reason": "p99 latency"},
+        {"search_params": {"hnsw_ef": 64}, "recall": 0.95, "p95_latency": 0.004},
+    ]
+
+    summary = summarize_search_sweep(sweep, target_recall=0.9)
+
+    assert summary["recommended_search_params"] == {"hnsw_ef": 64}
+    assert summary["search_param_sweep"][0]["aborted_reason"] == "p99 latency"
+
+
+@pytest.mark.asyncio
+async def test_deadline_stops_unguarded_load_with_partial_results():
+    """Without a guard the deadline still stops dispatch, and completed queries keep their results"""
+
+    async def search(_query):
+        await asyncio.sleep(0.005)
+        return {"prediction": points(), "latency": 0.005}
+
+    config = WorkloadConfig(concurrency=1, deadline=time.perf_counter() + 0.05)
+    results = await run_queries(list(range(100)), search, config)
+
+    completed = [result for result in results if result]
+    assert len(results) == 100
+    assert 0 < len(completed) < 100
+    assert results[len(completed) :] == [{}] * (100 - len(completed))
+
+
+@pytest.mark.asyncio
+async def test_concurrency_sweep_stops_at_deadline():
+    """No concurrency level starts once the deadline has passed"""
+
+    async def search(_query):
+        await asyncio.sleep(0.01)
+        return {"prediction": points(), "latency": 0.01}
+
+    config = WorkloadConfig(concurrency_levels=[1, 2, 4], deadline=time.perf_counter() + 0.05)
+    results, curve = await run_load(list(range(20)), search, config)
+
+    assert [point["concurrency"] for point in curve] == [1]
+    assert 0 < sum(1 for result in results if result) < 20
@@ -1,12 +1,15 @@
 """Integration tests for ExecuteExperimentUseCase"""
 
+import asyncio
+from collections.abc import AsyncIterator
 from unittest.mock import patch
 from uuid import uuid4
 
+import polars as pl
 import pytest
 
 from qdrant_bench.application.usecases.experiments.execute import ExecuteExperimentUseCase
-from qdrant_bench.domain.entities.core import RunStatus
+from qdrant_bench.domain.entities.core import Dataset, RunStatus
 from qdrant_bench.domain.services.evaluator import GroundTruth
 from tests.integration.fakes.adapters import FakeTelemetryAdapter
 from tests.integration.fakes.repositories import (
@@ -173,15 +176,53 @@ async def test_execute_experiment_full_flow_with_mocked_data():
         telemetry_adapter=telemetry_adapter,
     )
 
+    corpus = pl.DataFrame({"text": [f"doc {i}" for i in range(10)], "metadata": [{"id": i} for i in range(10)]})
+
+    async def fake_corpus(dataset: Dataset, batch_size: int, limit: int | None = None) -> AsyncIterator[pl.DataFrame]:
+        assert dataset.source_uri
+        for batch in corpus.head(limit or corpus.height).iter_slices(batch_size):
+            yield batch
+
     with (
-        patch("qdrant_bench.application.usecases.experiments.execute.load_dataset_corpus") as mock_corpus,
+        patch("qdrant_bench.application.usecases.experiments.execute.iter_dataset_corpus", new=fake_corpus),
         patch("qdrant_bench.application.usecases.experiments.execute.load_ground_truth") as mock_gt,
     ):
-        mock_corpus.return_value = [{"text": f"doc {i}", "metadata": {"id": i}} for i in range(10)]
-
         mock_gt.return_value = GroundTruth(relevant_items={i: {i} for i in range(5)})
 
         await use_case.execute(run.id)
 
     updated_run = await run_repo.get(run.id)
     assert updated_run.status in [RunStatus.COMPLETED, RunStatus.FAILED]
+
+
+@pytest.mark.asyncio
+async def test_execute_experiment_records_cancellation():
+    """A run cancelled mid-flight is marked canceled instead of being left running"""
+    run_repo = FakeRunRepository()
+    experiment_repo = FakeExperimentRepository()
+    dataset_repo = FakeDatasetRepository()
+    connection_repo = FakeConnectionRepository()
+
+    connection = await connection_repo.save(create_test_connection())
+    dataset = await dataset_repo.save(create_test_dataset())
+    experiment = await experiment_repo.save(create_test_experiment(dataset.id, connection.id))
+    run = await run_repo.save(create_test_run(experiment.id))
+
+    use_case = ExecuteExperimentUseCase(
+        run_repo=run_repo,
+        experiment_repo=experiment_repo,
+        dataset_repo=dataset_repo,
+        connection_repo=connection_repo,
+        embedding_service=FakeEmbeddingService(),
+        telemetry_adapter=FakeTelemetryAdapter(),
+    )
+
+    async def cancelled_workflow(**_kwargs):
+        raise asyncio.CancelledError
+
+    use_case.execute_workflow = cancelled_workflow
+
+    with pytest.raises(asyncio.CancelledError):
+        await use_case.execute(run.id)
+
+    assert run_repo.runs[run.id].status == RunStatus.CANCELED
@@ -0,0 +1,96 @@
+"""Integration tests for the warmup stage and steady-state detection"""
+
+import asyncio
+
+import pytest
+
+from qdrant_bench.application.usecases.experiments.config import parse_workload_config
+from qdrant_bench.domain.services.warmup import SteadyStateDetector, WarmupPlan
+from qdrant_bench.infrastructure.workloads.execution import run_warmup
+
+
+def cooling_search():
+    """Search whose latency starts high and settles at 1ms after 30 queries, like a cold collection"""
+    sent = []
+
+    async def search(query: int) -> dict:
+        sent.append(query)
+        return {"prediction": [query], "latency": 0.001 + max(30 - len(sent), 0) * 0.001}
+
+    return search, sent
+
+
+def test_detector_waits_for_the_median_to_stop_falling():
+    """Steady state is declared only once two consecutive windows have the same median"""
+    detector = SteadyStateDetector(window=5, tolerance=0.1)
+    falling = [0.010, 0.009, 0.008, 0.007, 0.006, 0.005, 0.004, 0.003, 0.002, 0.001]
+
+    assert not any(detector.observe(latency) for latency in falling)
+    assert [detector.observe(0.001) for _ in range(7)] == [False] * 6 + [True]
+
+
+def test_plan_requires_a_stopping_condition():
+    """A warmup with neither count, duration nor auto mode would never end"""
+    with pytest.raises(ValueError, match="warmup needs"):
+        WarmupPlan()
+
+
+@pytest.mark.asyncio
+async def test_fixed_count_warmup_cycles_through_queries():
+    """A fixed warmup sends exactly its query count, wrapping around the query set"""
+    search, sent = cooling_search()
+
+    summary = await run_warmup([0, 1, 2], search, WarmupPlan(queries=7), concurrency=2)
+
+    assert sent == [0, 1, 2, 0, 1, 2, 0]
+    assert summary["warmup_queries"] == 7
+    assert "warmup_steady" not in summary
+
+
+@pytest.mark.asyncio
+async def test_auto_warmup_stops_once_latency_settles():
+    """Auto mode ends shortly after the cold phase instead of running to its cap"""
+    search, sent = cooling_search()
+
+    summary = await run_warmup(list(range(10)), search, WarmupPlan(auto=True, window=10), concurrency=1)
+
+    assert summary["warmup_steady"] is True
+    assert 30 <= len(sent) <= 50
+    assert summary["warmup_p99_latency"] == pytest.approx(0.03, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_auto_warmup_reports_when_latency_never_settles():
+    """Hitting the cap without a steady window is reported rather than hidden"""
+    latencies = iter(range(1, 1000))
+
+    async def drifting_search(query: int) -> dict:
+        return {"prediction": [query], "latency": next(latencies) * 0.001}
+
+    summary = await run_warmup([0], drifting_search, WarmupPlan(auto=True, queries=40, window=5), concurrency=1)
+
+    assert summary["warmup_steady"] is False
+    assert summary["warmup_queries"] == 40
+
+
+@pytest.mark.asyncio
+async def test_duration_warmup_counts_errors():
+    """A duration-bound warmup keeps going through failed queries and counts them"""
+
+    async def failing_search(_query: int) -> dict:
+        await asyncio.sleep(0.001)
+        raise ConnectionError("cold start")
+
+    summary = await run_warmup([0], failing_search, WarmupPlan(duration=0.02), concurrency=1)
+
+    assert summary["warmup_errors"] == summary["warmup_queries"] > 0
+    assert summary["warmup_duration"] >= 0.02
+    assert "warmup_p99_latency" not in summary
+
+
+def test_parse_workload_config_reads_warmup():
+    """Warmup settings come from the `warmup` section of the optimizer config"""
+    config = parse_workload_config({"warmup": {"auto": True, "duration_s": 30, "tolerance": 0.05}})
+
+    assert config.warmup == WarmupPlan(duration=30, auto=True, tolerance=0.05)
+    assert parse_workload_config({}).warmup is None
@@ -0,0 +1,66 @@
+"""Integration tests for experiment workflow configuration helpers"""
+
+import pytest
+
+from qdrant_bench.application.usecases.experiments.config import parse_ingestion_config, parse_transports
+from qdrant_bench.application.usecases.experiments.execute import summarize_transports
+from qdrant_bench.ports.workload import Transport
+
+
+def test_parse_transports_defaults_to_rest():
+    """REST is used when no transport is configured"""
+    assert parse_transports({}) == [Transport.REST]
+
+
+def test_parse_transports_both_runs_rest_then_grpc():
+    """'both' benchmarks REST and gRPC back to back"""
+    assert parse_transports({"transport": "both"}) == [Transport.REST, Transport.GRPC]
+    assert parse_transports({"transport": "grpc"}) == [Transport.GRPC]
+
+
+def test_parse_transports_rejects_unknown_transport():
+    """Unknown transports fail loudly"""
+    with pytest.raises(ValueError):
+        parse_transports({"transport": "carrier-pigeon"})
+
+
+def test_summarize_single_transport_tags_metrics():
+    """A single transport keeps flat metrics plus a transport tag"""
+    metrics = summarize_transports({Transport.GRPC: {"recall": 0.9, "p95_latency": 0.01}})
+
+    assert metrics == {"recall": 0.9, "p95_latency": 0.01, "transport": "grpc"}
+
+
+def test_summarize_both_transports_reports_rest_overhead():
+    """Comparing transports reports per-transport metrics and the REST latency overhead"""
+    metrics = summarize_transports(
+        {
+            Transport.REST: {"p50_latency": 0.012, "p95_latency": 0.02, "p99_latency": 0.03},
+            Transport.GRPC: {"p50_latency": 0.008, "p95_latency": 0.015, "p99_latency": 0.02},
+        }
+    )
+
+    assert metrics["transport"] == "rest"
+    assert metrics["p95_latency"] == 0.02
+    assert set(metrics["transports"]) == {"rest", "grpc"}
+    assert metrics["rest_overhead_p50_latency"] == pytest.approx(0.004)
+    assert metrics["rest_overhead_p99_latency"] == pytest.approx(0.01)
+
+
+def test_parse_ingestion_config_defaults():
+    """Ingestion defaults keep the historical batch size"""
+    config = parse_ingestion_config({})
+
+    assert config.batch_size == 100
+    assert config.parallel == 4
+    assert config.wait is True
+
+
+def test_parse_ingestion_config_overrides():
+    """Ingestion settings are read from the nested ingestion block"""
+    config = parse_ingestion_config({"ingestion": {"batch_size": 256, "parallel": 8, "queue_size": 16, "wait": False}})
+
+    assert config.batch_size == 256
+    assert config.parallel == 8
+    assert config.queue_size == 16
+    assert config.wait is False
@@ -0,0 +1,113 @@
+"""Integration tests for batched search workload helpers"""
+
+import time
+
+import numpy as np
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.infrastructure.workloads.batched import (
+    amortize_batch_latencies,
+    chunk_requests,
+    execute_batched_searches,
+    expand_batches,
+    summarize_batches,
+)
+from qdrant_bench.infrastructure.workloads.single_vector import build_query_request
+from qdrant_bench.ports.workload import WorkloadConfig
+
+
+def test_chunk_requests_respects_batch_size():
+    """Requests are grouped into batches of at most batch_size"""
+    requests = [build_query_request(np.zeros(2, dtype=np.float32), WorkloadConfig()) for _ in range(5)]
+
+    batches = chunk_requests(requests, batch_size=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+def test_chunk_requests_rejects_zero_batch_size():
+    """Batch size must be positive"""
+    with pytest.raises(ValueError):
+        chunk_requests([], batch_size=0)
+
+
+def test_amortize_batch_latencies_spreads_batch_time():
+    """Each query carries its share of the batch latency"""
+    results = [{"prediction": [[], [], [], []], "latency": 0.4}, {"prediction": [[]], "latency": 0.1}]
+
+    assert amortize_batch_latencies(results) == pytest.approx([0.1, 0.1, 0.1, 0.1, 0.1])
+
+
+def test_queries_complete_with_their_batch_at_the_batch_latency():
+    """On the timeline every query of a batch shares its completion time and full latency"""
+    results = [
+        {"prediction": [[], []], "latency": 0.2, "completed_at": 1.0},
+        {"prediction": [None], "error": "boom", "completed_at": 2.0},
+    ]
+
+    assert expand_batches(results) == [
+        {"completed_at": 1.0, "latency": 0.2},
+        {"completed_at": 1.0, "latency": 0.2},
+        {"completed_at": 2.0, "error": "boom"},
+    ]
+
+
+def test_summarize_batches_reports_amortized_latency_separately():
+    """Amortized latency gets its own fields, marked apart from the per-batch headline"""
+    results = [{"prediction": [[], []], "latency": 0.2}, {"prediction": [[], []], "latency": 0.2}]
+
+    summary = summarize_batches(results, batch_size=2, total_duration=0.4)
+
+    assert summary["batch_count"] == 2
+    assert summary["latency_scope"] == "batch"
+    assert summary["amortized_p50_latency"] == pytest.approx(0.1, rel=0.01)
+    assert summary["amortized_query_latency"] == pytest.approx(0.1)
+    assert summary["batch_query_throughput"] == pytest.approx(10.0)
+
+
+def test_build_query_request_carries_search_params():
+    """Batch requests carry k, threshold and search params"""
+    config = WorkloadConfig(k=5, score_threshold=0.3, search_params={"hnsw_ef": 128})
+
+    request = build_query_request(np.array([0.1, 0.2], dtype=np.float32), config)
+
+    assert request.limit == 5
+    assert request.score_threshold == 0.3
+    assert isinstance(request.params, models.SearchParams)
+    assert request.params.hnsw_ef == 128
+
+
+@pytest.mark.asyncio
+async def test_batches_not_sent_by_the_deadline_keep_their_queries_aligned():
+    """Unsent batches leave one empty prediction per query and are left out of the batch metrics"""
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection("batched", vectors_config=models.VectorParams(size=2, distance=models.Distance.DOT))
+    await client.upsert("batched", points=models.Batch(ids=[0, 1], vectors=[[1.0, 0.0], [0.0, 1.0]]))
+    config = WorkloadConfig(k=1, batch_size=2, concurrency=1, deadline=time.perf_counter() - 1)
+    requests = [build_query_request(np.ones(2, dtype=np.float32), config) for _ in range(5)]
+
+    result = await execute_batched_searches(client, "batched", requests, config)
+
+    assert result.predictions == [None] * 5
+    assert result.metrics["batch_count"] == 0
+    assert result.latencies.count == 0
+
+
+@pytest.mark.asyncio
+async def test_achieved_qps_counts_the_queries_of_succeeded_batches():
+    """A failed batch's queries never count as completed, and throughput is in queries, not batches"""
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection("batched", vectors_config=models.VectorParams(size=2, distance=models.Distance.DOT))
+    await client.upsert("batched", points=models.Batch(ids=[0, 1], vectors=[[1.0, 0.0], [0.0, 1.0]]))
+    config = WorkloadConfig(k=1, batch_size=2, arrival_rate=100.0)
+    good = [build_query_request(np.ones(2, dtype=np.float32), config) for _ in range(4)]
+    # Wrong dimension, so the last batch fails server-side
+    bad = [build_query_request(np.ones(3, dtype=np.float32), config) for _ in range(2)]
+
+    result = await execute_batched_searches(client, "batched", good + bad, config)
+
+    assert result.metrics["batch_errors"] == 1
+    assert result.metrics["offered_qps"] == 200.0
+    assert result.metrics["achieved_qps"] * result.total_duration == pytest.approx(4)
@@ -0,0 +1,131 @@
+"""Integration tests for workload load generation"""
+
+import asyncio
+
+import pytest
+
+from qdrant_bench.application.usecases.experiments.config import parse_workload_config
+from qdrant_bench.infrastructure.workloads.execution import (
+    build_arrival_schedule,
+    run_closed_loop,
+    run_concurrency_sweep,
+    run_open_loop,
+    summarize_curve,
+    summarize_load,
+)
+from qdrant_bench.ports.workload import ArrivalProcess, WorkloadConfig
+
+
+async def fake_search(query: int) -> dict:
+    await asyncio.sleep(0.005)
+    return {"prediction": [query], "latency": 0.005}
+
+
+def test_fixed_schedule_is_evenly_spaced():
+    """Fixed arrival schedule spaces sends at 1/rate"""
+    schedule = build_arrival_schedule(count=4, rate=100.0, process=ArrivalProcess.FIXED)
+
+    assert schedule == pytest.approx([0.0, 0.01, 0.02, 0.03])
+
+
+def test_poisson_schedule_is_reproducible_with_seed():
+    """Poisson schedule starts at zero, is monotonic and deterministic for a seed"""
+    first = build_arrival_schedule(count=200, rate=50.0, process=ArrivalProcess.POISSON, seed=7)
+    second = build_arrival_schedule(count=200, rate=50.0, process=ArrivalProcess.POISSON, seed=7)
+
+    assert first == second
+    assert first[0] == 0.0
+    assert all(b >= a for a, b in zip(first, first[1:], strict=False))
+    assert first[-1] / len(first) == pytest.approx(1 / 50.0, rel=0.3)
+
+
+def test_schedule_rejects_non_positive_rate():
+    """Arrival rate must be positive"""
+    with pytest.raises(ValueError):
+        build_arrival_schedule(count=3, rate=0.0, process=ArrivalProcess.FIXED)
+
+
+@pytest.mark.asyncio
+async def test_open_loop_measures_from_scheduled_time():
+    """Open-loop latency includes service time and keeps per-query ordering"""
+    schedule = build_arrival_schedule(count=5, rate=200.0, process=ArrivalProcess.FIXED)
+
+    results = await run_open_loop(list(range(5)), fake_search, schedule)
+
+    assert [r["prediction"] for r in results] == [[0], [1], [2], [3], [4]]
+    assert all(r["service_latency"] == 0.005 for r in results)
+    assert all(r["latency"] >= 0.005 for r in results)
+
+
+def test_summarize_load_reports_offered_and_achieved_rate():
+    """Open-loop summary reports offered vs achieved qps"""
+    config = WorkloadConfig(arrival_rate=100.0)
+
+    summary = summarize_load(config, completed=50, total_duration=1.0)
+
+    assert summary == {"arrival_process": "fixed", "offered_qps": 100.0, "achieved_qps": 50.0}
+
+
+def test_summarize_load_is_empty_without_arrival_rate():
+    """Closed batches report no arrival metrics"""
+    assert summarize_load(WorkloadConfig(), completed=10, total_duration=1.0) == {}
+
+
+def test_parse_workload_config_reads_arrival_settings():
+    """Arrival settings are read from optimizer config"""
+    config = parse_workload_config({"arrival_rate": 250, "arrival_process": "poisson", "seed": 3})
+
+    assert config.arrival_rate == 250
+    assert config.arrival_process == ArrivalProcess.POISSON
+    assert config.seed == 3
+    assert config.query_count == 100
+
+
+def test_parse_workload_config_reads_concurrency_levels():
+    """Concurrency sweep levels are read from optimizer config"""
+    config = parse_workload_config({"concurrency_levels": [1, 4, 16]})
+
+    assert config.concurrency_levels == [1, 4, 16]
+    assert config.concurrency is None
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_bounds_in_flight_queries():
+    """Closed loop never exceeds its virtual client count and keeps result order"""
+    in_flight = 0
+    peak = 0
+
+    async def tracking_search(query: int) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return {"prediction": [query], "latency": 0.001}
+
+    results = await run_closed_loop(list(range(20)), tracking_search, concurrency=4)
+
+    assert peak == 4
+    assert [r["prediction"] for r in results] == [[i] for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_sweep_records_one_point_per_level():
+    """Sweep yields a curve point per level and the first level's results"""
+    results, curve = await run_concurrency_sweep(list(range(8)), fake_search, levels=[1, 4])
+
+    assert len(results) == 8
+    assert [point["concurrency"] for point in curve] == [1, 4]
+    assert all(point["qps"] > 0 and "p99_latency" in point for point in curve)
+    assert curve[1]["qps"] > curve[0]["qps"]
+
+
+def test_summarize_curve_reports_peak_throughput():
+    """Curve summary picks the highest-throughput level"""
+    curve = [{"concurrency": 1, "qps": 10.0}, {"concurrency": 8, "qps": 70.0}, {"concurrency": 32, "qps": 65.0}]
+
+    summary = summarize_curve(curve)
+
+    assert summary["peak_qps"] == 70.0
+    assert summary["peak_qps_concurrency"] == 8
+    assert summary["concurrency_curve"] == curve
@@ -0,0 +1,148 @@
+"""Integration tests for concurrent hybrid search in the multi-vector workload"""
+
+import time
+
+import numpy as np
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from qdrant_bench.application.usecases.experiments.config import (
+    parse_follow_up_workload_config,
+    parse_workload_config,
+)
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.infrastructure.workloads import multi_vector
+from qdrant_bench.infrastructure.workloads.multi_vector import (
+    build_multi_vector_query_request,
+    execute_multi_vector_search_batch,
+    profile_prefetch_stages,
+)
+from qdrant_bench.ports.workload import FusionConfig, FusionMethod, WorkloadConfig, WorkloadResult
+
+VECTORS = {"text": 4, "image": 3}
+
+
+async def create_hybrid_collection(points: int) -> tuple[AsyncQdrantClient, list[dict[str, np.ndarray]]]:
+    """In-memory collection with two named vectors; each point is queried by its own vectors"""
+    rng = np.random.default_rng(11)
+    vectors = {name: rng.normal(size=(points, size)).astype(np.float32) for name, size in VECTORS.items()}
+
+    client = AsyncQdrantClient(location=":memory:")
+    await client.create_collection(
+        collection_name="hybrid",
+        vectors_config={
+            name: models.VectorParams(size=size, distance=models.Distance.COSINE) for name, size in VECTORS.items()
+        },
+    )
+    await client.upsert(
+        collection_name="hybrid",
+        points=models.Batch(
+            ids=list(range(points)), vectors={name: matrix.tolist() for name, matrix in vectors.items()}
+        ),
+    )
+
+    return client, [{name: matrix[i] for name, matrix in vectors.items()} for i in range(points)]
+
+
+def test_fused_request_prefetches_every_named_vector():
+    """Each named vector becomes one prefetch stage and the stages are fused server-side"""
+    bundle = {"text": np.ones(4, dtype=np.float32), "image": np.ones(3, dtype=np.float32)}
+    config = WorkloadConfig(k=5, fusion=FusionConfig(method=FusionMethod.DBSF, prefetch_limit=50))
+
+    request = build_multi_vector_query_request(bundle, ["text", "image"], config)
+
+    assert isinstance(request.prefetch, list)
+    assert [(stage.using, stage.limit) for stage in request.prefetch] == [("text", 50), ("image", 50)]
+    assert request.query == models.FusionQuery(fusion=models.Fusion.DBSF)
+    assert request.limit == 5
+
+
+def test_disabled_fusion_searches_the_first_vector():
+    """`{"method": "none"}` keeps the plain search of the first named vector"""
+    config = parse_workload_config({"fusion": {"method": "none"}})
+    bundle = {"text": np.ones(4, dtype=np.float32), "image": np.ones(3, dtype=np.float32)}
+
+    request = build_multi_vector_query_request(bundle, ["text", "image"], config)
+
+    assert config.fusion is None
+    assert request.using == "text"
+    assert request.prefetch is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fused_run_finds_each_query_point():
+    """A concurrent RRF run ranks each query's own point first and profiles every prefetch stage in isolation"""
+    client, queries = await create_hybrid_collection(points=30)
+
+    result = await execute_multi_vector_search_batch(client, "hybrid", queries, WorkloadConfig(k=3, concurrency=4))
+
+    assert [points[0].id for points in result.predictions] == list(range(30))
+    assert result.latencies.count == 30
+    assert result.metrics["fusion"] == "rrf"
+    assert set(result.metrics["isolated_prefetch_stages"]) == {"text", "image"}
+    assert result.metrics["isolated_prefetch_stages"]["text"]["errors"] == 0
+    assert "p99_latency" in result.metrics["isolated_prefetch_stages"]["image"]
+
+
+@pytest.mark.asyncio
+async def test_stage_profiling_can_be_skipped():
+    """Without stage profiling only the fused queries are sent"""
+    client, queries = await create_hybrid_collection(points=5)
+    config = WorkloadConfig(k=3, fusion=FusionConfig(profile_stages=False))
+
+    result = await execute_multi_vector_search_batch(client, "hybrid", queries, config)
+
+    assert "isolated_prefetch_stages" not in result.metrics
+    assert result.metrics["query_vectors"] == ["text", "image"]
+
+
+@pytest.mark.asyncio
+async def test_stage_profile_replays_a_bounded_sample():
+    """Only the first `profile_queries` queries are replayed per stage, whatever the workload size"""
+    client, queries = await create_hybrid_collection(points=30)
+    config = WorkloadConfig(k=3, fusion=FusionConfig(profile_queries=5))
+
+    result = await execute_multi_vector_search_batch(client, "hybrid", queries, config)
+
+    assert result.latencies.count == 30
+    assert [stage["queries"] for stage in result.metrics["isolated_prefetch_stages"].values()] == [5, 5]
+
+
+@pytest.mark.asyncio
+async def test_stage_profile_stops_at_deadline():
+    """Past the workload deadline no stage query is sent"""
+    client, queries = await create_hybrid_collection(points=5)
+    config = WorkloadConfig(k=3, deadline=time.perf_counter())
+
+    stages = await profile_prefetch_stages(client, "hybrid", queries, list(VECTORS), config)
+
+    assert stages == {}
+
+
+@pytest.mark.asyncio
+async def test_process_pool_profiles_stages_once_in_the_parent(monkeypatch):
+    """Workers skip the stage profile, whose metrics they could not return, and the parent runs it after the pool"""
+    client, queries = await create_hybrid_collection(points=10)
+    worker_configs = []
+
+    async def fake_pool(_client, _collection_name, chunk, config, _batch_fn):
+        worker_configs.append(config)
+        return WorkloadResult(predictions=[[] for _ in chunk], latencies=LatencyHistogram(), total_duration=1.0)
+
+    monkeypatch.setattr(multi_vector, "execute_in_process_pool", fake_pool)
+    result = await execute_multi_vector_search_batch(client, "hybrid", queries, WorkloadConfig(k=3, processes=2))
+
+    assert [config.fusion.profile_stages for config in worker_configs] == [False]
+    assert result.metrics["fusion"] == "rrf"
+    assert set(result.metrics["isolated_prefetch_stages"]) == {"text", "image"}
+
+
+def test_follow_up_phases_do_not_profile_stages():
+    """Filtered and mixed runs keep the fused query but leave stage profiling to the unfiltered run"""
+    config = parse_follow_up_workload_config({"warmup": {"queries": 10}, "concurrency_levels": [1, 2]})
+
+    assert config.fusion is not None
+    assert not config.fusion.profile_stages
+    assert config.warmup is None
+    assert config.concurrency_levels == []
@@ -0,0 +1,99 @@
+"""Integration tests for multi-process workload helpers"""
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+
+from qdrant_bench.domain.services.histogram import LatencyHistogram
+from qdrant_bench.infrastructure.workloads.parallel import (
+    derive_worker_config,
+    execute_in_process_pool,
+    merge_workload_results,
+    run_worker,
+    split_queries,
+)
+from qdrant_bench.ports.workload import WorkloadConfig, WorkloadResult
+
+
+async def echo_batch(
+    client: AsyncQdrantClient, collection_name: str, queries: list[int], config: WorkloadConfig
+) -> WorkloadResult:
+    assert isinstance(client, AsyncQdrantClient)
+
+    return WorkloadResult(
+        predictions=[[collection_name, q] for q in queries],
+        latencies=LatencyHistogram.of(0.001 * q for q in queries),
+        total_duration=float(config.k),
+    )
+
+
+async def failing_batch(
+    _client: AsyncQdrantClient, _collection_name: str, queries: list[int], _config: WorkloadConfig
+) -> WorkloadResult:
+    # Odd queries fail and carry no prediction, as failed queries do in every workload
+    return WorkloadResult(
+        predictions=[None if q % 2 else [q] for q in queries],
+        latencies=LatencyHistogram.of(0.001 for q in queries if not q % 2),
+        total_duration=2.0,
+    )
+
+
+def test_split_queries_keeps_contiguous_order():
+    """Chunks are contiguous and cover every query once"""
+    chunks = split_queries(list(range(10)), processes=3)
+
+    assert chunks == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_split_queries_never_yields_empty_chunks():
+    """More processes than queries yields one chunk per query"""
+    assert split_queries([1, 2], processes=8) == [[1], [2]]
+    assert split_queries([], processes=4) == []
+
+
+def test_split_queries_rejects_zero_processes():
+    """At least one process is required"""
+    with pytest.raises(ValueError):
+        split_queries([1], processes=0)
+
+
+def test_derive_worker_config_divides_offered_load():
+    """Arrival rate and virtual clients are shared between workers"""
+    config = WorkloadConfig(arrival_rate=1000.0, concurrency=10, processes=4)
+
+    worker_config = derive_worker_config(config, workers=4)
+
+    assert worker_config.arrival_rate == 250.0
+    assert worker_config.concurrency == 3
+    assert worker_config.processes == 1
+
+
+def test_merge_workload_results_preserves_query_order():
+    """Merged predictions follow chunk order and latency histograms are combined"""
+    first = WorkloadResult(predictions=[["a"], ["b"]], latencies=LatencyHistogram.of([0.1, 0.2]), total_duration=1.0)
+    second = WorkloadResult(predictions=[["c"]], latencies=LatencyHistogram.of([0.3]), total_duration=2.0)
+
+    merged = merge_workload_results([first, second])
+
+    assert merged.predictions == [["a"], ["b"], ["c"]]
+    assert merged.latencies.count == 3
+    assert merged.latencies.maximum == 0.3
+    assert merged.total_duration == 2.0
+
+
+def test_run_worker_builds_its_own_client():
+    """Worker entry point runs the batch on a fresh event loop and client"""
+    result = run_worker({"location": ":memory:"}, "bench", [1, 2], WorkloadConfig(), echo_batch)
+
+    assert result.predictions == [["bench", 1], ["bench", 2]]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_achieved_qps_counts_only_completed_queries():
+    """Failed queries keep their prediction slot but do not count towards achieved throughput"""
+    client = AsyncQdrantClient(location=":memory:")
+    config = WorkloadConfig(arrival_rate=10.0, processes=2)
+
+    result = await execute_in_process_pool(client, "bench", list(range(8)), config, failing_batch)
+
+    assert len(result.predictions) == 8
+    assert result.metrics["achieved_qps"] == 2.0